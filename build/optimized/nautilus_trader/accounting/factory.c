@@ -0,0 +1,12989 @@
+/* Generated by Cython 3.0.0b1 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "define_macros": [
+            [
+                "NPY_NO_DEPRECATED_API",
+                "NPY_1_7_API_VERSION"
+            ]
+        ],
+        "depends": [
+            "nautilus_trader/core/includes/core.h",
+            "nautilus_trader/core/includes/model.h"
+        ],
+        "extra_compile_args": [
+            "-O3",
+            "-pipe"
+        ],
+        "extra_link_args": [
+            "nautilus_core/target/release/libnautilus_common.a",
+            "nautilus_core/target/release/libnautilus_core.a",
+            "nautilus_core/target/release/libnautilus_model.a"
+        ],
+        "include_dirs": [
+            "nautilus_trader/core/rust",
+            ".",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/core/include",
+            "nautilus_trader/common/includes",
+            "nautilus_trader/core/includes",
+            "nautilus_trader/model/includes"
+        ],
+        "language": "c",
+        "name": "nautilus_trader.accounting.factory",
+        "sources": [
+            "nautilus_trader/accounting/factory.pyx"
+        ]
+    },
+    "module_name": "nautilus_trader.accounting.factory"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#if defined(CYTHON_LIMITED_API) && 0
+  #ifndef Py_LIMITED_API
+    #if CYTHON_LIMITED_API+0 > 0x03030000
+      #define Py_LIMITED_API CYTHON_LIMITED_API
+    #else
+      #define Py_LIMITED_API 0x03030000
+    #endif
+  #endif
+#endif
+
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02070000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.7+ or Python 3.3+.
+#else
+#define CYTHON_ABI "3_0_0b1"
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
+#define CYTHON_HEX_VERSION 0x030000B1
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(_WIN32) && !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #define HAVE_LONG_LONG
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#if defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS (PY_MAJOR_VERSION >= 3)
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS (PY_MAJOR_VERSION >= 3)
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(CYTHON_LIMITED_API)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_CLINE_IN_TRACEBACK
+  #define CYTHON_CLINE_IN_TRACEBACK 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 1
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 1
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #ifndef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL (PY_MAJOR_VERSION < 3 || PY_VERSION_HEX >= 0x03060000)
+  #endif
+  #ifndef CYTHON_METH_FASTCALL
+    #define CYTHON_METH_FASTCALL (PY_VERSION_HEX >= 0x030700A1)
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL 1
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #if PY_VERSION_HEX < 0x030400a1
+    #undef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 0
+  #elif !defined(CYTHON_USE_TP_FINALIZE)
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #if PY_VERSION_HEX < 0x030600B1
+    #undef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS 0
+  #elif !defined(CYTHON_USE_DICT_VERSIONS)
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #if PY_VERSION_HEX < 0x030700A3
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK 1
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if !defined(CYTHON_VECTORCALL)
+#define CYTHON_VECTORCALL  (CYTHON_FAST_PYCCALL && PY_VERSION_HEX >= 0x030800B1)
+#endif
+#define CYTHON_BACKPORT_VECTORCALL (CYTHON_METH_FASTCALL && PY_VERSION_HEX < 0x030800B1)
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+  #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+            typedef unsigned char     uint8_t;
+            typedef unsigned short    uint16_t;
+            typedef unsigned int      uint32_t;
+        #else
+            typedef unsigned __int8   uint8_t;
+            typedef unsigned __int16  uint16_t;
+            typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+    #if _MSC_VER < 1300
+        #ifdef _WIN64
+            typedef unsigned long long  __pyx_uintptr_t;
+        #else
+            typedef unsigned int        __pyx_uintptr_t;
+        #endif
+    #else
+        #ifdef _WIN64
+            typedef unsigned __int64    __pyx_uintptr_t;
+        #else
+            typedef unsigned __int32    __pyx_uintptr_t;
+        #endif
+    #endif
+#else
+    #include <stdint.h>
+    typedef uintptr_t  __pyx_uintptr_t;
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
+  #define Py_OptimizeFlag 0
+#endif
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_DefaultClassType PyClass_Type
+  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int p, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(p))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#elif PY_VERSION_HEX >= 0x030800B2 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_NewWithPosOnlyArgs(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#else
+  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+#endif
+#if PY_VERSION_HEX >= 0x030900A4 || defined(Py_IS_TYPE)
+  #define __Pyx_IS_TYPE(ob, type) Py_IS_TYPE(ob, type)
+#else
+  #define __Pyx_IS_TYPE(ob, type) (((const PyObject*)ob)->ob_type == (type))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
+#else
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
+#else
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
+#endif
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#ifndef CO_COROUTINE
+  #define CO_COROUTINE 0x80
+#endif
+#ifndef CO_ASYNC_GENERATOR
+  #define CO_ASYNC_GENERATOR 0x200
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE 0
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_METH_FASTCALL
+  #define __Pyx_METH_FASTCALL METH_FASTCALL
+  #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
+  #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
+#else
+  #define __Pyx_METH_FASTCALL METH_VARARGS
+  #define __Pyx_PyCFunction_FastCall PyCFunction
+  #define __Pyx_PyCFunction_FastCallWithKeywords PyCFunctionWithKeywords
+#endif
+#if CYTHON_VECTORCALL
+  #define __pyx_vectorcallfunc vectorcallfunc
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
+  #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
+#elif CYTHON_BACKPORT_VECTORCALL
+  typedef PyObject *(*__pyx_vectorcallfunc)(PyObject *callable, PyObject *const *args,
+                                            size_t nargsf, PyObject *kwnames);
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  ((size_t)1 << (8 * sizeof(size_t) - 1))
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(((size_t)(n)) & ~__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET))
+#else
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
+#endif
+#if PY_VERSION_HEX < 0x030900B1
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+  #define __Pyx_PyCMethod  PyCMethod
+#endif
+#ifndef METH_METHOD
+  #define METH_METHOD 0x200
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyThreadState_Current PyThreadState_Get()
+#elif !CYTHON_FAST_THREAD_STATE
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE void *__Pyx_PyModule_GetState(PyObject *op)
+{
+    void *result;
+    result = PyModule_GetState(op);
+    if (!result)
+        Py_FatalError("Couldn't find the module state");
+    return result;
+}
+#endif
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE(obj), name, func_ctype)
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if PY_MAJOR_VERSION < 3
+    #if CYTHON_COMPILING_IN_PYPY
+        #if PYPY_VERSION_NUM < 0x07030600
+            #if defined(__cplusplus) && __cplusplus >= 201402L
+                [[deprecated("`with nogil:` inside a nogil function will not release the GIL in PyPy2 < 7.3.6")]]
+            #elif defined(__GNUC__) || defined(__clang__)
+                __attribute__ ((__deprecated__("`with nogil:` inside a nogil function will not release the GIL in PyPy2 < 7.3.6")))
+            #elif defined(_MSC_VER)
+                __declspec(deprecated("`with nogil:` inside a nogil function will not release the GIL in PyPy2 < 7.3.6"))
+            #endif
+            static CYTHON_INLINE int PyGILState_Check(void) {
+                return 0;
+            }
+        #else  // PYPY_VERSION_NUM < 0x07030600
+        #endif  // PYPY_VERSION_NUM < 0x07030600
+    #else
+        static CYTHON_INLINE int PyGILState_Check(void) {
+            PyThreadState * tstate = _PyThreadState_Current;
+            return tstate && (tstate == PyGILState_GetThisThreadState());
+        }
+    #endif
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX > 0x030600B4 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
+    PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
+    if (res == NULL) PyErr_Clear();
+    return res;
+}
+#elif PY_MAJOR_VERSION >= 3 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000)
+#define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#else
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict, PyObject *name) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyDict_GetItem(dict, name);
+#else
+    PyDictEntry *ep;
+    PyDictObject *mp = (PyDictObject*) dict;
+    long hash = ((PyStringObject *) name)->ob_shash;
+    assert(hash != -1);
+    ep = (mp->ma_lookup)(mp, name, hash);
+    if (ep == NULL) {
+        return NULL;
+    }
+    return ep->me_value;
+#endif
+}
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
+  #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
+  #define __Pyx_PyObject_GetIterNextFunc(obj)  (Py_TYPE(obj)->tp_iternext)
+#else
+  #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
+  #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
+  #define __Pyx_PyObject_GetIterNextFunc(obj)  PyIter_Next
+#endif
+#if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX >= 0x03080000
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
+    PyTypeObject *type = Py_TYPE(obj);\
+    assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
+    PyObject_GC_Del(obj);\
+    Py_DECREF(type);\
+}
+#else
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define CYTHON_PEP393_ENABLED 1
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GetLength(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
+#elif PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #if !defined(PyUnicode_DecodeUnicodeEscape)
+    #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
+  #endif
+  #if !defined(PyUnicode_Contains) || (PY_MAJOR_VERSION == 2 && PYPY_VERSION_NUM < 0x07030500)
+    #undef PyUnicode_Contains
+    #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+  #endif
+  #if !defined(PyByteArray_Check)
+    #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+  #endif
+  #if !defined(PyObject_Format)
+    #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+  #endif
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#else
+  #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        __Pyx_IS_TYPE(obj, &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define __Pyx_Py3Int_Check(op)       PyLong_Check(op)
+  #define __Pyx_Py3Int_CheckExact(op)  PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#else
+  #define __Pyx_Py3Int_Check(op)       (PyLong_Check(op) || PyInt_Check(op))
+  #define __Pyx_Py3Int_CheckExact(op)  (PyLong_CheckExact(op) || PyInt_CheckExact(op))
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__nautilus_trader__accounting__factory
+#define __PYX_HAVE_API__nautilus_trader__accounting__factory
+/* Early includes */
+#include <stdint.h>
+#include <string.h>
+#include <stdio.h>
+#include "../includes/model.h"
+#include "../includes/core.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const wchar_t *u)
+{
+    const wchar_t *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#else
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u)
+{
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#endif
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+#endif
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+#if !CYTHON_USE_MODULE_STATE
+static PyObject *__pyx_m = NULL;
+#endif
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm = __FILE__;
+static const char *__pyx_filename;
+
+/* #### Code section: filename_table ### */
+
+static const char *__pyx_f[] = {
+  "nautilus_trader/accounting/factory.pyx",
+  "<stringsource>",
+  "nautilus_trader/core/correctness.pxd",
+  "nautilus_trader/model/c_enums/account_type.pxd",
+  "nautilus_trader/model/c_enums/liquidity_side.pxd",
+  "type.pxd",
+  "nautilus_trader/model/currency.pxd",
+  "nautilus_trader/core/uuid.pxd",
+  "nautilus_trader/core/message.pxd",
+  "nautilus_trader/model/identifiers.pxd",
+  "nautilus_trader/model/events/account.pxd",
+  "nautilus_trader/model/c_enums/contingency_type.pxd",
+  "nautilus_trader/model/c_enums/order_side.pxd",
+  "nautilus_trader/model/c_enums/order_type.pxd",
+  "nautilus_trader/model/c_enums/time_in_force.pxd",
+  "nautilus_trader/model/objects.pxd",
+  "nautilus_trader/model/events/order.pxd",
+  "nautilus_trader/core/data.pxd",
+  "nautilus_trader/model/c_enums/asset_class.pxd",
+  "nautilus_trader/model/c_enums/asset_type.pxd",
+  "nautilus_trader/model/tick_scheme/base.pxd",
+  "nautilus_trader/model/instruments/base.pxd",
+  "nautilus_trader/model/c_enums/position_side.pxd",
+  "nautilus_trader/model/position.pxd",
+  "nautilus_trader/accounting/accounts/base.pxd",
+  "nautilus_trader/accounting/accounts/cash.pxd",
+  "nautilus_trader/accounting/accounts/betting.pxd",
+  "nautilus_trader/accounting/accounts/margin.pxd",
+};
+/* #### Code section: utility_code_proto_before_types ### */
+/* #### Code section: numeric_typedefs ### */
+/* #### Code section: complex_type_declarations ### */
+/* #### Code section: type_declarations ### */
+
+/*--- Type declarations ---*/
+struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory;
+struct __pyx_obj_15nautilus_trader_4core_11correctness_Condition;
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account;
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount;
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount;
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount;
+struct __pyx_obj_15nautilus_trader_5model_8position_Position;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser;
+struct __pyx_obj_15nautilus_trader_5model_11tick_scheme_4base_TickScheme;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser;
+struct __pyx_obj_15nautilus_trader_4core_4data_Data;
+struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument;
+struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance;
+struct __pyx_obj_15nautilus_trader_5model_7objects_AccountBalance;
+struct __pyx_obj_15nautilus_trader_5model_7objects_Money;
+struct __pyx_obj_15nautilus_trader_5model_7objects_Price;
+struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_TradeId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_OrderListId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_VenueOrderId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_ComponentId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_TraderId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_Venue;
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_Symbol;
+struct __pyx_obj_15nautilus_trader_4core_7message_Message;
+struct __pyx_obj_15nautilus_trader_4core_7message_Response;
+struct __pyx_obj_15nautilus_trader_4core_7message_Request;
+struct __pyx_obj_15nautilus_trader_4core_7message_Event;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderUpdated;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCancelRejected;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderModifyRejected;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingCancel;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingUpdate;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderTriggered;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderExpired;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCanceled;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderRejected;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderAccepted;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderSubmitted;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderDenied;
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderInitialized;
+struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState;
+struct __pyx_obj_15nautilus_trader_4core_7message_Document;
+struct __pyx_obj_15nautilus_trader_4core_7message_Command;
+struct __pyx_obj_15nautilus_trader_4core_7message_MessageCategoryParser;
+struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4;
+struct __pyx_obj_15nautilus_trader_5model_8currency_Currency;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser;
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser;
+
+/* "nautilus_trader/model/c_enums/account_type.pxd":17
+ * 
+ * 
+ * cpdef enum AccountType:             # <<<<<<<<<<<<<<
+ *     CASH = 1
+ *     MARGIN = 2
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_12account_type_AccountType {
+  __pyx_e_15nautilus_trader_5model_7c_enums_12account_type_CASH = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_12account_type_MARGIN = 2,
+  __pyx_e_15nautilus_trader_5model_7c_enums_12account_type_BETTING = 3
+};
+
+/* "nautilus_trader/model/c_enums/liquidity_side.pxd":17
+ * 
+ * 
+ * cpdef enum LiquiditySide:             # <<<<<<<<<<<<<<
+ *     NONE = 0
+ *     MAKER = 1
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySide {
+  __pyx_e_15nautilus_trader_5model_7c_enums_14liquidity_side_NONE = 0,
+  __pyx_e_15nautilus_trader_5model_7c_enums_14liquidity_side_MAKER = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_14liquidity_side_TAKER = 2
+};
+struct __pyx_opt_args_15nautilus_trader_5model_8currency_8Currency_register_c;
+struct __pyx_opt_args_15nautilus_trader_5model_8currency_8Currency_from_str_c;
+
+/* "nautilus_trader/model/currency.pxd":27
+ * 
+ *     @staticmethod
+ *     cdef void register_c(Currency currency, bint overwrite=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_5model_8currency_8Currency_register_c {
+  int __pyx_n;
+  int overwrite;
+};
+
+/* "nautilus_trader/model/currency.pxd":30
+ * 
+ *     @staticmethod
+ *     cdef Currency from_str_c(str code, bint strict=*)             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_5model_8currency_8Currency_from_str_c {
+  int __pyx_n;
+  int strict;
+};
+
+/* "nautilus_trader/core/message.pxd":21
+ * 
+ * 
+ * cpdef enum MessageCategory:             # <<<<<<<<<<<<<<
+ *     COMMAND = 1
+ *     DOCUMENT = 2
+ */
+enum __pyx_t_15nautilus_trader_4core_7message_MessageCategory {
+  __pyx_e_15nautilus_trader_4core_7message_COMMAND = 1,
+  __pyx_e_15nautilus_trader_4core_7message_DOCUMENT = 2,
+  __pyx_e_15nautilus_trader_4core_7message_EVENT = 3,
+  __pyx_e_15nautilus_trader_4core_7message_REQUEST = 4,
+  __pyx_e_15nautilus_trader_4core_7message_RESPONSE = 5
+};
+
+/* "nautilus_trader/model/c_enums/contingency_type.pxd":21
+ * 
+ * 
+ * cpdef enum ContingencyType:             # <<<<<<<<<<<<<<
+ *     NONE = 0
+ *     OTO = 1  # One Triggers Other
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyType {
+  __pyx_e_15nautilus_trader_5model_7c_enums_16contingency_type_NONE = 0,
+  __pyx_e_15nautilus_trader_5model_7c_enums_16contingency_type_OTO = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_16contingency_type_OCO = 2
+};
+
+/* "nautilus_trader/model/c_enums/order_side.pxd":17
+ * 
+ * 
+ * cpdef enum OrderSide:             # <<<<<<<<<<<<<<
+ *     BUY = 1
+ *     SELL = 2
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide {
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_side_BUY = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_side_SELL = 2
+};
+
+/* "nautilus_trader/model/c_enums/order_type.pxd":17
+ * 
+ * 
+ * cpdef enum OrderType:             # <<<<<<<<<<<<<<
+ *     MARKET = 1
+ *     LIMIT = 2
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_type_OrderType {
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_MARKET = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_LIMIT = 2,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_STOP_MARKET = 3,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_STOP_LIMIT = 4,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_MARKET_TO_LIMIT = 5,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_MARKET_IF_TOUCHED = 6,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_LIMIT_IF_TOUCHED = 7,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_TRAILING_STOP_MARKET = 8,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10order_type_TRAILING_STOP_LIMIT = 9
+};
+
+/* "nautilus_trader/model/c_enums/time_in_force.pxd":17
+ * 
+ * 
+ * cpdef enum TimeInForce:             # <<<<<<<<<<<<<<
+ *     GTC = 1  # Good 'till Canceled
+ *     IOC = 2  # Immediate or Cancel
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForce {
+  __pyx_e_15nautilus_trader_5model_7c_enums_13time_in_force_GTC = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13time_in_force_IOC = 2,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13time_in_force_FOK = 3,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13time_in_force_GTD = 4,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13time_in_force_DAY = 5,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13time_in_force_AT_THE_OPEN = 6,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13time_in_force_AT_THE_CLOSE = 7
+};
+
+/* "nautilus_trader/model/c_enums/asset_class.pxd":17
+ * 
+ * 
+ * cpdef enum AssetClass:             # <<<<<<<<<<<<<<
+ *     FX = 1
+ *     EQUITY = 2
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_11asset_class_AssetClass {
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_FX = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_EQUITY = 2,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_COMMODITY = 3,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_METAL = 4,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_ENERGY = 5,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_BOND = 6,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_INDEX = 7,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_CRYPTO = 8,
+  __pyx_e_15nautilus_trader_5model_7c_enums_11asset_class_BETTING = 9
+};
+
+/* "nautilus_trader/model/c_enums/asset_type.pxd":17
+ * 
+ * 
+ * cpdef enum AssetType:             # <<<<<<<<<<<<<<
+ *     SPOT = 1
+ *     SWAP = 2
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_10asset_type_AssetType {
+  __pyx_e_15nautilus_trader_5model_7c_enums_10asset_type_SPOT = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10asset_type_SWAP = 2,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10asset_type_FUTURE = 3,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10asset_type_FORWARD = 4,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10asset_type_CFD = 5,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10asset_type_OPTION = 6,
+  __pyx_e_15nautilus_trader_5model_7c_enums_10asset_type_WARRANT = 7
+};
+struct __pyx_opt_args_15nautilus_trader_5model_11tick_scheme_4base_10TickScheme_next_ask_price;
+struct __pyx_opt_args_15nautilus_trader_5model_11tick_scheme_4base_10TickScheme_next_bid_price;
+
+/* "nautilus_trader/model/tick_scheme/base.pxd":29
+ *     """The maximum valid price for the scheme.\n\n:returns: `Price`"""
+ * 
+ *     cpdef Price next_ask_price(self, double value, int n=*)             # <<<<<<<<<<<<<<
+ *     cpdef Price next_bid_price(self, double value, int n=*)
+ * 
+ */
+struct __pyx_opt_args_15nautilus_trader_5model_11tick_scheme_4base_10TickScheme_next_ask_price {
+  int __pyx_n;
+  int n;
+};
+
+/* "nautilus_trader/model/tick_scheme/base.pxd":30
+ * 
+ *     cpdef Price next_ask_price(self, double value, int n=*)
+ *     cpdef Price next_bid_price(self, double value, int n=*)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+struct __pyx_opt_args_15nautilus_trader_5model_11tick_scheme_4base_10TickScheme_next_bid_price {
+  int __pyx_n;
+  int n;
+};
+struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_next_bid_price;
+struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_next_ask_price;
+struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_notional_value;
+
+/* "nautilus_trader/model/instruments/base.pxd":89
+ *     cpdef Currency get_cost_currency(self)
+ *     cpdef Price make_price(self, value)
+ *     cpdef Price next_bid_price(self, double value, int num_ticks=*)             # <<<<<<<<<<<<<<
+ *     cpdef Price next_ask_price(self, double value, int num_ticks=*)
+ *     cpdef Quantity make_qty(self, value)
+ */
+struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_next_bid_price {
+  int __pyx_n;
+  int num_ticks;
+};
+
+/* "nautilus_trader/model/instruments/base.pxd":90
+ *     cpdef Price make_price(self, value)
+ *     cpdef Price next_bid_price(self, double value, int num_ticks=*)
+ *     cpdef Price next_ask_price(self, double value, int num_ticks=*)             # <<<<<<<<<<<<<<
+ *     cpdef Quantity make_qty(self, value)
+ *     cpdef Money notional_value(self, Quantity quantity, Price price, bint inverse_as_quote=*)
+ */
+struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_next_ask_price {
+  int __pyx_n;
+  int num_ticks;
+};
+
+/* "nautilus_trader/model/instruments/base.pxd":92
+ *     cpdef Price next_ask_price(self, double value, int num_ticks=*)
+ *     cpdef Quantity make_qty(self, value)
+ *     cpdef Money notional_value(self, Quantity quantity, Price price, bint inverse_as_quote=*)             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_notional_value {
+  int __pyx_n;
+  int inverse_as_quote;
+};
+
+/* "nautilus_trader/model/c_enums/position_side.pxd":17
+ * 
+ * 
+ * cpdef enum PositionSide:             # <<<<<<<<<<<<<<
+ *     FLAT = 1
+ *     LONG = 2
+ */
+enum __pyx_t_15nautilus_trader_5model_7c_enums_13position_side_PositionSide {
+  __pyx_e_15nautilus_trader_5model_7c_enums_13position_side_FLAT = 1,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13position_side_LONG = 2,
+  __pyx_e_15nautilus_trader_5model_7c_enums_13position_side_SHORT = 3
+};
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance;
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_total;
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_free;
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_locked;
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_update_balances;
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_calculate_commission;
+
+/* "nautilus_trader/accounting/accounts/base.pxd":62
+ *     cpdef dict balances_locked(self)
+ *     cpdef dict commissions(self)
+ *     cpdef AccountBalance balance(self, Currency currency=*)             # <<<<<<<<<<<<<<
+ *     cpdef Money balance_total(self, Currency currency=*)
+ *     cpdef Money balance_free(self, Currency currency=*)
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance {
+  int __pyx_n;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+};
+
+/* "nautilus_trader/accounting/accounts/base.pxd":63
+ *     cpdef dict commissions(self)
+ *     cpdef AccountBalance balance(self, Currency currency=*)
+ *     cpdef Money balance_total(self, Currency currency=*)             # <<<<<<<<<<<<<<
+ *     cpdef Money balance_free(self, Currency currency=*)
+ *     cpdef Money balance_locked(self, Currency currency=*)
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_total {
+  int __pyx_n;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+};
+
+/* "nautilus_trader/accounting/accounts/base.pxd":64
+ *     cpdef AccountBalance balance(self, Currency currency=*)
+ *     cpdef Money balance_total(self, Currency currency=*)
+ *     cpdef Money balance_free(self, Currency currency=*)             # <<<<<<<<<<<<<<
+ *     cpdef Money balance_locked(self, Currency currency=*)
+ *     cpdef Money commission(self, Currency currency)
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_free {
+  int __pyx_n;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+};
+
+/* "nautilus_trader/accounting/accounts/base.pxd":65
+ *     cpdef Money balance_total(self, Currency currency=*)
+ *     cpdef Money balance_free(self, Currency currency=*)
+ *     cpdef Money balance_locked(self, Currency currency=*)             # <<<<<<<<<<<<<<
+ *     cpdef Money commission(self, Currency currency)
+ * 
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_locked {
+  int __pyx_n;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+};
+
+/* "nautilus_trader/accounting/accounts/base.pxd":71
+ * 
+ *     cpdef void apply(self, AccountState event) except *
+ *     cpdef void update_balances(self, list balances, bint allow_zero=*) except *             # <<<<<<<<<<<<<<
+ *     cpdef void update_commissions(self, Money commission) except *
+ * 
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_update_balances {
+  int __pyx_n;
+  int allow_zero;
+};
+
+/* "nautilus_trader/accounting/accounts/base.pxd":78
+ *     cdef void _recalculate_balance(self, Currency currency) except *
+ * 
+ *     cpdef Money calculate_commission(             # <<<<<<<<<<<<<<
+ *         self,
+ *         Instrument instrument,
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_calculate_commission {
+  int __pyx_n;
+  int inverse_as_quote;
+};
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4cash_11CashAccount_calculate_balance_locked;
+
+/* "nautilus_trader/accounting/accounts/cash.pxd":35
+ * # -- CALCULATIONS ---------------------------------------------------------------------------------
+ * 
+ *     cpdef Money calculate_balance_locked(             # <<<<<<<<<<<<<<
+ *         self,
+ *         Instrument instrument,
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4cash_11CashAccount_calculate_balance_locked {
+  int __pyx_n;
+  int inverse_as_quote;
+};
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_7betting_14BettingAccount_calculate_balance_locked;
+
+/* "nautilus_trader/accounting/accounts/betting.pxd":25
+ * 
+ * cdef class BettingAccount(CashAccount):
+ *     cpdef Money calculate_balance_locked(             # <<<<<<<<<<<<<<
+ *         self,
+ *         Instrument instrument,
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_7betting_14BettingAccount_calculate_balance_locked {
+  int __pyx_n;
+  int inverse_as_quote;
+};
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_6margin_13MarginAccount_calculate_margin_init;
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_6margin_13MarginAccount_calculate_margin_maint;
+
+/* "nautilus_trader/accounting/accounts/margin.pxd":59
+ * # -- CALCULATIONS ---------------------------------------------------------------------------------
+ * 
+ *     cpdef Money calculate_margin_init(             # <<<<<<<<<<<<<<
+ *         self,
+ *         Instrument instrument,
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_6margin_13MarginAccount_calculate_margin_init {
+  int __pyx_n;
+  int inverse_as_quote;
+};
+
+/* "nautilus_trader/accounting/accounts/margin.pxd":67
+ *     )
+ * 
+ *     cpdef Money calculate_margin_maint(             # <<<<<<<<<<<<<<
+ *         self,
+ *         Instrument instrument,
+ */
+struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_6margin_13MarginAccount_calculate_margin_maint {
+  int __pyx_n;
+  int inverse_as_quote;
+};
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_true;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_false;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_none;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_none;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_type;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_type_or_none;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_callable;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_callable_or_none;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_equal;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_equal;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_list_type;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_dict_types;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_is_in;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_in;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_empty;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_empty;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_positive;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_positive_int;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_negative;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_negative_int;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_in_range;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_in_range_int;
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_valid_string;
+
+/* "nautilus_trader/core/correctness.pxd":26
+ * 
+ *     @staticmethod
+ *     cdef void true(bint predicate, str fail_msg, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_true {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":29
+ * 
+ *     @staticmethod
+ *     cdef void false(bint predicate, str fail_msg, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_false {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":32
+ * 
+ *     @staticmethod
+ *     cdef void none(object argument, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_none {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":35
+ * 
+ *     @staticmethod
+ *     cdef void not_none(object argument, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_none {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":38
+ * 
+ *     @staticmethod
+ *     cdef void type(             # <<<<<<<<<<<<<<
+ *         object argument,
+ *         object expected,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_type {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":46
+ * 
+ *     @staticmethod
+ *     cdef void type_or_none(             # <<<<<<<<<<<<<<
+ *         object argument,
+ *         object expected,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_type_or_none {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":54
+ * 
+ *     @staticmethod
+ *     cdef void callable(object argument, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_callable {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":57
+ * 
+ *     @staticmethod
+ *     cdef void callable_or_none(object argument, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_callable_or_none {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":60
+ * 
+ *     @staticmethod
+ *     cdef void equal(             # <<<<<<<<<<<<<<
+ *         object argument1,
+ *         object argument2,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_equal {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":69
+ * 
+ *     @staticmethod
+ *     cdef void not_equal(             # <<<<<<<<<<<<<<
+ *         object argument1,
+ *         object argument2,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_equal {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":78
+ * 
+ *     @staticmethod
+ *     cdef void list_type(             # <<<<<<<<<<<<<<
+ *         list argument,
+ *         type expected_type,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_list_type {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":86
+ * 
+ *     @staticmethod
+ *     cdef void dict_types(             # <<<<<<<<<<<<<<
+ *         dict argument,
+ *         type key_type,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_dict_types {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":95
+ * 
+ *     @staticmethod
+ *     cdef void is_in(             # <<<<<<<<<<<<<<
+ *         object element,
+ *         object collection,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_is_in {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":104
+ * 
+ *     @staticmethod
+ *     cdef void not_in(             # <<<<<<<<<<<<<<
+ *         object element,
+ *         object collection,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_in {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":113
+ * 
+ *     @staticmethod
+ *     cdef void empty(object collection, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_empty {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":116
+ * 
+ *     @staticmethod
+ *     cdef void not_empty(object collection, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_empty {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":119
+ * 
+ *     @staticmethod
+ *     cdef void positive(double value, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_positive {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":122
+ * 
+ *     @staticmethod
+ *     cdef void positive_int(int value, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_positive_int {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":125
+ * 
+ *     @staticmethod
+ *     cdef void not_negative(double value, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_negative {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":128
+ * 
+ *     @staticmethod
+ *     cdef void not_negative_int(int value, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_negative_int {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":131
+ * 
+ *     @staticmethod
+ *     cdef void in_range(             # <<<<<<<<<<<<<<
+ *         double value,
+ *         double start,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_in_range {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":140
+ * 
+ *     @staticmethod
+ *     cdef void in_range_int(             # <<<<<<<<<<<<<<
+ *         int value,
+ *         int start,
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_in_range_int {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/core/correctness.pxd":149
+ * 
+ *     @staticmethod
+ *     cdef void valid_string(str argument, str param, ex_type=*) except *             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_valid_string {
+  int __pyx_n;
+  PyObject *ex_type;
+};
+
+/* "nautilus_trader/accounting/factory.pxd":20
+ * 
+ * 
+ * cdef class AccountFactory:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_10accounting_7factory_AccountFactory *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/core/correctness.pxd":23
+ * 
+ * 
+ * cdef class Condition:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_4core_11correctness_Condition {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_4core_11correctness_Condition *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/accounting/accounts/base.pxd":30
+ * 
+ * 
+ * cdef class Account:             # <<<<<<<<<<<<<<
+ *     cdef list _events
+ *     cdef dict _balances
+ */
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_vtab;
+  PyObject *_events;
+  PyObject *_balances;
+  PyObject *_balances_starting;
+  PyObject *_commissions;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId *id;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_12account_type_AccountType type;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *base_currency;
+  int is_cash_account;
+  int is_margin_account;
+  int calculate_account_state;
+};
+
+
+/* "nautilus_trader/accounting/accounts/margin.pxd":28
+ * 
+ * 
+ * cdef class MarginAccount(Account):             # <<<<<<<<<<<<<<
+ *     cdef dict _leverages
+ *     cdef dict _margins
+ */
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount {
+  struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account __pyx_base;
+  PyObject *_leverages;
+  PyObject *_margins;
+  PyObject *default_leverage;
+};
+
+
+/* "nautilus_trader/accounting/accounts/cash.pxd":25
+ * 
+ * 
+ * cdef class CashAccount(Account):             # <<<<<<<<<<<<<<
+ *     cdef dict _balances_locked
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount {
+  struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account __pyx_base;
+  PyObject *_balances_locked;
+};
+
+
+/* "nautilus_trader/accounting/accounts/betting.pxd":24
+ * 
+ * 
+ * cdef class BettingAccount(CashAccount):             # <<<<<<<<<<<<<<
+ *     cpdef Money calculate_balance_locked(
+ *         self,
+ */
+struct __pyx_obj_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount {
+  struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount __pyx_base;
+};
+
+
+/* "nautilus_trader/model/position.pxd":35
+ * 
+ * 
+ * cdef class Position:             # <<<<<<<<<<<<<<
+ *     cdef list _events
+ *     cdef list _trade_ids
+ */
+struct __pyx_obj_15nautilus_trader_5model_8position_Position {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_8position_Position *__pyx_vtab;
+  PyObject *_events;
+  PyObject *_trade_ids;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *_buy_qty;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *_sell_qty;
+  PyObject *_commissions;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_TraderId *trader_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId *strategy_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *instrument_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId *id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId *account_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId *opening_order_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId *closing_order_id;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide entry;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_13position_side_PositionSide side;
+  double net_qty;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *quantity;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *peak_qty;
+  uint8_t price_precision;
+  uint8_t size_precision;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *multiplier;
+  int is_inverse;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *quote_currency;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *base_currency;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *cost_currency;
+  uint64_t ts_init;
+  uint64_t ts_opened;
+  uint64_t ts_last;
+  uint64_t ts_closed;
+  uint64_t duration_ns;
+  double avg_px_open;
+  double avg_px_close;
+  double realized_return;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *realized_pnl;
+};
+
+
+/* "nautilus_trader/model/c_enums/position_side.pxd":23
+ * 
+ * 
+ * cdef class PositionSideParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/tick_scheme/base.pxd":21
+ * cdef dict TICK_SCHEMES
+ * 
+ * cdef class TickScheme:             # <<<<<<<<<<<<<<
+ *     cdef readonly str name
+ *     """The name of the scheme.\n\n:returns: `str`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_11tick_scheme_4base_TickScheme {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11tick_scheme_4base_TickScheme *__pyx_vtab;
+  PyObject *name;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *min_price;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *max_price;
+};
+
+
+/* "nautilus_trader/model/c_enums/asset_type.pxd":27
+ * 
+ * 
+ * cdef class AssetTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/c_enums/asset_class.pxd":29
+ * 
+ * 
+ * cdef class AssetClassParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/core/data.pxd":19
+ * 
+ * 
+ * cdef class Data:             # <<<<<<<<<<<<<<
+ *     cdef readonly uint64_t ts_event
+ *     """The UNIX timestamp (nanoseconds) when the data event occurred.\n\n:returns: `uint64_t`"""
+ */
+struct __pyx_obj_15nautilus_trader_4core_4data_Data {
+  PyObject_HEAD
+  uint64_t ts_event;
+  uint64_t ts_init;
+};
+
+
+/* "nautilus_trader/model/instruments/base.pxd":28
+ * 
+ * 
+ * cdef class Instrument(Data):             # <<<<<<<<<<<<<<
+ *     cdef TickScheme _tick_scheme
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument {
+  struct __pyx_obj_15nautilus_trader_4core_4data_Data __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11instruments_4base_Instrument *__pyx_vtab;
+  struct __pyx_obj_15nautilus_trader_5model_11tick_scheme_4base_TickScheme *_tick_scheme;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Symbol *native_symbol;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_11asset_class_AssetClass asset_class;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10asset_type_AssetType asset_type;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *quote_currency;
+  int is_inverse;
+  int price_precision;
+  int size_precision;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *price_increment;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *size_increment;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *multiplier;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *lot_size;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *max_quantity;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *min_quantity;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *max_notional;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *min_notional;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *max_price;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *min_price;
+  PyObject *margin_init;
+  PyObject *margin_maint;
+  PyObject *maker_fee;
+  PyObject *taker_fee;
+  PyObject *tick_scheme_name;
+  PyObject *info;
+};
+
+
+/* "nautilus_trader/model/objects.pxd":165
+ * 
+ * 
+ * cdef class MarginBalance:             # <<<<<<<<<<<<<<
+ *     cdef readonly Money initial
+ *     """The initial margin requirement.\n\n:returns: `Money`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_MarginBalance *__pyx_vtab;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *initial;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *maintenance;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *instrument_id;
+};
+
+
+/* "nautilus_trader/model/objects.pxd":150
+ * 
+ * 
+ * cdef class AccountBalance:             # <<<<<<<<<<<<<<
+ *     cdef readonly Money total
+ *     """The total account balance.\n\n:returns: `Money`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_7objects_AccountBalance {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_AccountBalance *__pyx_vtab;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *total;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *locked;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *free;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+};
+
+
+/* "nautilus_trader/model/objects.pxd":115
+ * 
+ * 
+ * cdef class Money:             # <<<<<<<<<<<<<<
+ *     cdef Money_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_7objects_Money {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Money *__pyx_vtab;
+  struct Money_t _mem;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+};
+
+
+/* "nautilus_trader/model/objects.pxd":73
+ * 
+ * 
+ * cdef class Price:             # <<<<<<<<<<<<<<
+ *     cdef Price_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_7objects_Price {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Price *__pyx_vtab;
+  struct Price_t _mem;
+};
+
+
+/* "nautilus_trader/model/objects.pxd":27
+ * 
+ * 
+ * cdef class Quantity:             # <<<<<<<<<<<<<<
+ *     cdef Quantity_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Quantity *__pyx_vtab;
+  struct Quantity_t _mem;
+};
+
+
+/* "nautilus_trader/model/c_enums/time_in_force.pxd":27
+ * 
+ * 
+ * cdef class TimeInForceParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/c_enums/order_type.pxd":29
+ * 
+ * 
+ * cdef class OrderTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/c_enums/order_side.pxd":22
+ * 
+ * 
+ * cdef class OrderSideParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/c_enums/contingency_type.pxd":27
+ * 
+ * 
+ * cdef class ContingencyTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":28
+ * 
+ * 
+ * cdef class Identifier:             # <<<<<<<<<<<<<<
+ *     cdef str to_str(self)
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":100
+ * 
+ * 
+ * cdef class TradeId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef TradeId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_TradeId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct TradeId_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":92
+ * 
+ * 
+ * cdef class PositionId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef PositionId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct PositionId_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":88
+ * 
+ * 
+ * cdef class OrderListId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef OrderListId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_OrderListId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct OrderListId_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":84
+ * 
+ * 
+ * cdef class VenueOrderId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef VenueOrderId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_VenueOrderId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct VenueOrderId_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":80
+ * 
+ * 
+ * cdef class ClientOrderId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef ClientOrderId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct ClientOrderId_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":74
+ * 
+ * 
+ * cdef class AccountId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef AccountId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct AccountId_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":55
+ * 
+ * 
+ * cdef class ComponentId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef ComponentId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_ComponentId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct ComponentId_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":67
+ * 
+ * 
+ * cdef class StrategyId(ComponentId):             # <<<<<<<<<<<<<<
+ *     cpdef str get_tag(self)
+ *     cpdef bint is_external(self)
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_ComponentId __pyx_base;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":63
+ * 
+ * 
+ * cdef class TraderId(ComponentId):             # <<<<<<<<<<<<<<
+ *     cpdef str get_tag(self)
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_TraderId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_ComponentId __pyx_base;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":59
+ * 
+ * 
+ * cdef class ClientId(ComponentId):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_ComponentId __pyx_base;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":40
+ * 
+ * 
+ * cdef class InstrumentId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef InstrumentId_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct InstrumentId_t _mem;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Symbol *symbol;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Venue *venue;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":36
+ * 
+ * 
+ * cdef class Venue(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef Venue_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_Venue {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct Venue_t _mem;
+};
+
+
+/* "nautilus_trader/model/identifiers.pxd":32
+ * 
+ * 
+ * cdef class Symbol(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef Symbol_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_11identifiers_Symbol {
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct Symbol_t _mem;
+};
+
+
+/* "nautilus_trader/core/message.pxd":38
+ * 
+ * 
+ * cdef class Message:             # <<<<<<<<<<<<<<
+ *     cdef readonly MessageCategory category
+ *     """The message category.\n\n:returns: `MessageCategory`"""
+ */
+struct __pyx_obj_15nautilus_trader_4core_7message_Message {
+  PyObject_HEAD
+  enum __pyx_t_15nautilus_trader_4core_7message_MessageCategory category;
+  struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4 *id;
+  uint64_t ts_init;
+};
+
+
+/* "nautilus_trader/core/message.pxd":65
+ * 
+ * 
+ * cdef class Response(Message):             # <<<<<<<<<<<<<<
+ *     cdef readonly UUID4 correlation_id
+ *     """The response correlation ID.\n\n:returns: `UUID4`"""
+ */
+struct __pyx_obj_15nautilus_trader_4core_7message_Response {
+  struct __pyx_obj_15nautilus_trader_4core_7message_Message __pyx_base;
+  struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4 *correlation_id;
+};
+
+
+/* "nautilus_trader/core/message.pxd":60
+ * 
+ * 
+ * cdef class Request(Message):             # <<<<<<<<<<<<<<
+ *     cdef readonly object callback
+ *     """The callback for the response.\n\n:returns: `Callable`"""
+ */
+struct __pyx_obj_15nautilus_trader_4core_7message_Request {
+  struct __pyx_obj_15nautilus_trader_4core_7message_Message __pyx_base;
+  PyObject *callback;
+};
+
+
+/* "nautilus_trader/core/message.pxd":55
+ * 
+ * 
+ * cdef class Event(Message):             # <<<<<<<<<<<<<<
+ *     cdef readonly uint64_t ts_event
+ *     """The UNIX timestamp (nanoseconds) when the event occurred.\n\n:returns: `uint64_t`"""
+ */
+struct __pyx_obj_15nautilus_trader_4core_7message_Event {
+  struct __pyx_obj_15nautilus_trader_4core_7message_Message __pyx_base;
+  uint64_t ts_event;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":37
+ * 
+ * 
+ * cdef class OrderEvent(Event):             # <<<<<<<<<<<<<<
+ *     cdef readonly TraderId trader_id
+ *     """The trader ID associated with the event.\n\n:returns: `TraderId`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent {
+  struct __pyx_obj_15nautilus_trader_4core_7message_Event __pyx_base;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_TraderId *trader_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId *strategy_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId *account_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *instrument_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId *client_order_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_VenueOrderId *venue_order_id;
+  int reconciliation;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":209
+ * 
+ * 
+ * cdef class OrderFilled(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly TradeId trade_id
+ *     """The trade match ID (assigned by the venue).\n\n:returns: `TradeId`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderFilled *__pyx_vtab;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_TradeId *trade_id;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId *position_id;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide order_side;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_type_OrderType order_type;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *last_qty;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *last_px;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *currency;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *commission;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySide liquidity_side;
+  PyObject *info;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":194
+ * 
+ * 
+ * cdef class OrderUpdated(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly Quantity quantity
+ *     """The orders current quantity.\n\n:returns: `Quantity`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderUpdated {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderUpdated *__pyx_vtab;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *quantity;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *price;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *trigger_price;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":183
+ * 
+ * 
+ * cdef class OrderCancelRejected(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason for order cancel rejection.\n\n:returns: `str`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCancelRejected {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCancelRejected *__pyx_vtab;
+  PyObject *reason;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":172
+ * 
+ * 
+ * cdef class OrderModifyRejected(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason for modify order rejection.\n\n:returns: `str`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderModifyRejected {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderModifyRejected *__pyx_vtab;
+  PyObject *reason;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":163
+ * 
+ * 
+ * cdef class OrderPendingCancel(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingCancel {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingCancel *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":154
+ * 
+ * 
+ * cdef class OrderPendingUpdate(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingUpdate {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingUpdate *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":145
+ * 
+ * 
+ * cdef class OrderTriggered(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderTriggered {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderTriggered *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":136
+ * 
+ * 
+ * cdef class OrderExpired(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderExpired {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderExpired *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":127
+ * 
+ * 
+ * cdef class OrderCanceled(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCanceled {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCanceled *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":116
+ * 
+ * 
+ * cdef class OrderRejected(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason the order was rejected.\n\n:returns: `str`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderRejected {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderRejected *__pyx_vtab;
+  PyObject *reason;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":107
+ * 
+ * 
+ * cdef class OrderAccepted(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderAccepted {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderAccepted *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":98
+ * 
+ * 
+ * cdef class OrderSubmitted(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderSubmitted {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderSubmitted *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":87
+ * 
+ * 
+ * cdef class OrderDenied(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason the order was denied.\n\n:returns: `str`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderDenied {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderDenied *__pyx_vtab;
+  PyObject *reason;
+};
+
+
+/* "nautilus_trader/model/events/order.pxd":54
+ * 
+ * 
+ * cdef class OrderInitialized(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly OrderSide side
+ *     """The order side.\n\n:returns: `OrderSide`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderInitialized {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderInitialized *__pyx_vtab;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide side;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_type_OrderType type;
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *quantity;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForce time_in_force;
+  int post_only;
+  int reduce_only;
+  PyObject *options;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_OrderListId *order_list_id;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyType contingency_type;
+  PyObject *linked_order_ids;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId *parent_order_id;
+  PyObject *tags;
+};
+
+
+/* "nautilus_trader/model/events/account.pxd":22
+ * 
+ * 
+ * cdef class AccountState(Event):             # <<<<<<<<<<<<<<
+ *     cdef readonly AccountId account_id
+ *     """The account ID associated with the event.\n\n:returns: `AccountId`"""
+ */
+struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState {
+  struct __pyx_obj_15nautilus_trader_4core_7message_Event __pyx_base;
+  struct __pyx_vtabstruct_15nautilus_trader_5model_6events_7account_AccountState *__pyx_vtab;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId *account_id;
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_12account_type_AccountType account_type;
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *base_currency;
+  PyObject *balances;
+  PyObject *margins;
+  int is_reported;
+  PyObject *info;
+};
+
+
+/* "nautilus_trader/core/message.pxd":51
+ * 
+ * 
+ * cdef class Document(Message):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_4core_7message_Document {
+  struct __pyx_obj_15nautilus_trader_4core_7message_Message __pyx_base;
+};
+
+
+/* "nautilus_trader/core/message.pxd":47
+ * 
+ * 
+ * cdef class Command(Message):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_4core_7message_Command {
+  struct __pyx_obj_15nautilus_trader_4core_7message_Message __pyx_base;
+};
+
+
+/* "nautilus_trader/core/message.pxd":29
+ * 
+ * 
+ * cdef class MessageCategoryParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_4core_7message_MessageCategoryParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_4core_7message_MessageCategoryParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/core/uuid.pxd":19
+ * 
+ * 
+ * cdef class UUID4:             # <<<<<<<<<<<<<<
+ *     cdef UUID4_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4 {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_4core_4uuid_UUID4 *__pyx_vtab;
+  struct UUID4_t _mem;
+};
+
+
+/* "nautilus_trader/model/currency.pxd":21
+ * 
+ * 
+ * cdef class Currency:             # <<<<<<<<<<<<<<
+ *     cdef Currency_t _mem
+ * 
+ */
+struct __pyx_obj_15nautilus_trader_5model_8currency_Currency {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_8currency_Currency *__pyx_vtab;
+  struct Currency_t _mem;
+};
+
+
+/* "nautilus_trader/model/c_enums/liquidity_side.pxd":23
+ * 
+ * 
+ * cdef class LiquiditySideParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser *__pyx_vtab;
+};
+
+
+/* "nautilus_trader/model/c_enums/account_type.pxd":23
+ * 
+ * 
+ * cdef class AccountTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+struct __pyx_obj_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser *__pyx_vtab;
+};
+
+
+
+/* "nautilus_trader/accounting/factory.pyx":28
+ * 
+ * 
+ * cdef class AccountFactory:             # <<<<<<<<<<<<<<
+ *     """
+ *     Provides a factory for creating different account types.
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_10accounting_7factory_AccountFactory {
+  struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *(*create_c)(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_10accounting_7factory_AccountFactory *__pyx_vtabptr_15nautilus_trader_10accounting_7factory_AccountFactory;
+
+
+/* "nautilus_trader/core/correctness.pxd":23
+ * 
+ * 
+ * cdef class Condition:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_4core_11correctness_Condition {
+  void (*true)(int, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_true *__pyx_optional_args);
+  void (*false)(int, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_false *__pyx_optional_args);
+  void (*none)(PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_none *__pyx_optional_args);
+  void (*not_none)(PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_none *__pyx_optional_args);
+  void (*type)(PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_type *__pyx_optional_args);
+  void (*type_or_none)(PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_type_or_none *__pyx_optional_args);
+  void (*callable)(PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_callable *__pyx_optional_args);
+  void (*callable_or_none)(PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_callable_or_none *__pyx_optional_args);
+  void (*equal)(PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_equal *__pyx_optional_args);
+  void (*not_equal)(PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_equal *__pyx_optional_args);
+  void (*list_type)(PyObject *, PyTypeObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_list_type *__pyx_optional_args);
+  void (*dict_types)(PyObject *, PyTypeObject *, PyTypeObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_dict_types *__pyx_optional_args);
+  void (*is_in)(PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_is_in *__pyx_optional_args);
+  void (*not_in)(PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_in *__pyx_optional_args);
+  void (*empty)(PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_empty *__pyx_optional_args);
+  void (*not_empty)(PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_empty *__pyx_optional_args);
+  void (*positive)(double, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_positive *__pyx_optional_args);
+  void (*positive_int)(int, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_positive_int *__pyx_optional_args);
+  void (*not_negative)(double, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_negative *__pyx_optional_args);
+  void (*not_negative_int)(int, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_not_negative_int *__pyx_optional_args);
+  void (*in_range)(double, double, double, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_in_range *__pyx_optional_args);
+  void (*in_range_int)(int, int, int, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_in_range_int *__pyx_optional_args);
+  void (*valid_string)(PyObject *, PyObject *, struct __pyx_opt_args_15nautilus_trader_4core_11correctness_9Condition_valid_string *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_4core_11correctness_Condition *__pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition;
+
+
+/* "nautilus_trader/accounting/accounts/base.pxd":30
+ * 
+ * 
+ * cdef class Account:             # <<<<<<<<<<<<<<
+ *     cdef list _events
+ *     cdef dict _balances
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4base_Account {
+  struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *(*last_event_c)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *);
+  PyObject *(*events_c)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *);
+  int (*event_count_c)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *);
+  PyObject *(*currencies)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch);
+  PyObject *(*starting_balances)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch);
+  PyObject *(*balances)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch);
+  PyObject *(*balances_total)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch);
+  PyObject *(*balances_free)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch);
+  PyObject *(*balances_locked)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch);
+  PyObject *(*commissions)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_AccountBalance *(*balance)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*balance_total)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_total *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*balance_free)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_free *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*balance_locked)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_balance_locked *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*commission)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *, int __pyx_skip_dispatch);
+  void (*apply)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *, int __pyx_skip_dispatch);
+  void (*update_balances)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_update_balances *__pyx_optional_args);
+  void (*update_commissions)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, int __pyx_skip_dispatch);
+  void (*_recalculate_balance)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*calculate_commission)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, enum __pyx_t_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySide, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4base_7Account_calculate_commission *__pyx_optional_args);
+  PyObject *(*calculate_pnls)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *, struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_4base_Account;
+
+
+/* "nautilus_trader/accounting/accounts/margin.pxd":28
+ * 
+ * 
+ * cdef class MarginAccount(Account):             # <<<<<<<<<<<<<<
+ *     cdef dict _leverages
+ *     cdef dict _margins
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount {
+  struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4base_Account __pyx_base;
+  PyObject *(*margins)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, int __pyx_skip_dispatch);
+  PyObject *(*margins_init)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, int __pyx_skip_dispatch);
+  PyObject *(*margins_maint)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, int __pyx_skip_dispatch);
+  PyObject *(*leverages)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, int __pyx_skip_dispatch);
+  PyObject *(*leverage)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*margin_init)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*margin_maint)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance *(*margin)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  void (*set_default_leverage)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, PyObject *, int __pyx_skip_dispatch);
+  void (*set_leverage)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, PyObject *, int __pyx_skip_dispatch);
+  void (*update_margin_init)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, int __pyx_skip_dispatch);
+  void (*update_margin_maint)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, int __pyx_skip_dispatch);
+  void (*update_margin)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance *, int __pyx_skip_dispatch);
+  void (*clear_margin_init)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  void (*clear_margin_maint)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  void (*clear_margin)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*calculate_margin_init)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_6margin_13MarginAccount_calculate_margin_init *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*calculate_margin_maint)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *, struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, enum __pyx_t_15nautilus_trader_5model_7c_enums_13position_side_PositionSide, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_6margin_13MarginAccount_calculate_margin_maint *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount *__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount;
+
+
+/* "nautilus_trader/accounting/accounts/cash.pxd":25
+ * 
+ * 
+ * cdef class CashAccount(Account):             # <<<<<<<<<<<<<<
+ *     cdef dict _balances_locked
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4cash_CashAccount {
+  struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4base_Account __pyx_base;
+  void (*update_balance_locked)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, int __pyx_skip_dispatch);
+  void (*clear_balance_locked)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount *, struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*calculate_balance_locked)(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount *, struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_10accounting_8accounts_4cash_11CashAccount_calculate_balance_locked *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4cash_CashAccount *__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_4cash_CashAccount;
+
+
+/* "nautilus_trader/accounting/accounts/betting.pxd":24
+ * 
+ * 
+ * cdef class BettingAccount(CashAccount):             # <<<<<<<<<<<<<<
+ *     cpdef Money calculate_balance_locked(
+ *         self,
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount {
+  struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4cash_CashAccount __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount *__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount;
+
+
+/* "nautilus_trader/model/position.pxd":35
+ * 
+ * 
+ * cdef class Position:             # <<<<<<<<<<<<<<
+ *     cdef list _events
+ *     cdef list _trade_ids
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_8position_Position {
+  PyObject *(*info)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, int __pyx_skip_dispatch);
+  PyObject *(*to_dict)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, int __pyx_skip_dispatch);
+  PyObject *(*client_order_ids_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  PyObject *(*venue_order_ids_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  PyObject *(*trade_ids_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  PyObject *(*events_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *(*last_event_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_TradeId *(*last_trade_id_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  int (*event_count_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  int (*is_long_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  int (*is_short_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  int (*is_open_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  int (*is_closed_c)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_13position_side_PositionSide (*side_from_order_side_c)(enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide);
+  int (*is_opposite_side)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide, int __pyx_skip_dispatch);
+  void (*apply)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*notional_value)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*calculate_pnl)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, double, double, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*unrealized_pnl)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*total_pnl)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch);
+  PyObject *(*commissions)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, int __pyx_skip_dispatch);
+  void (*_handle_buy_order_fill)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+  void (*_handle_sell_order_fill)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+  double (*_calculate_avg_px)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, double, double, struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+  double (*_calculate_avg_px_open_px)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+  double (*_calculate_avg_px_close_px)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+  double (*_calculate_points)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, double, double);
+  double (*_calculate_points_inverse)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, double, double);
+  double (*_calculate_return)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, double, double);
+  double (*_calculate_pnl)(struct __pyx_obj_15nautilus_trader_5model_8position_Position *, double, double, double);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_8position_Position *__pyx_vtabptr_15nautilus_trader_5model_8position_Position;
+
+
+/* "nautilus_trader/model/c_enums/position_side.pxd":23
+ * 
+ * 
+ * cdef class PositionSideParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_13position_side_PositionSide (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser;
+
+
+/* "nautilus_trader/model/instruments/base.pxd":28
+ * 
+ * 
+ * cdef class Instrument(Data):             # <<<<<<<<<<<<<<
+ *     cdef TickScheme _tick_scheme
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11instruments_4base_Instrument {
+  struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *(*base_from_dict_c)(PyObject *);
+  PyObject *(*base_to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *);
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *(*get_base_currency)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *(*get_cost_currency)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*make_price)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, PyObject *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*next_bid_price)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_next_bid_price *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*next_ask_price)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_next_ask_price *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *(*make_qty)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, PyObject *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*notional_value)(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_5model_11instruments_4base_10Instrument_notional_value *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11instruments_4base_Instrument *__pyx_vtabptr_15nautilus_trader_5model_11instruments_4base_Instrument;
+
+
+/* "nautilus_trader/model/tick_scheme/base.pxd":21
+ * cdef dict TICK_SCHEMES
+ * 
+ * cdef class TickScheme:             # <<<<<<<<<<<<<<
+ *     cdef readonly str name
+ *     """The name of the scheme.\n\n:returns: `str`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11tick_scheme_4base_TickScheme {
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*next_ask_price)(struct __pyx_obj_15nautilus_trader_5model_11tick_scheme_4base_TickScheme *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_5model_11tick_scheme_4base_10TickScheme_next_ask_price *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*next_bid_price)(struct __pyx_obj_15nautilus_trader_5model_11tick_scheme_4base_TickScheme *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_15nautilus_trader_5model_11tick_scheme_4base_10TickScheme_next_bid_price *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11tick_scheme_4base_TickScheme *__pyx_vtabptr_15nautilus_trader_5model_11tick_scheme_4base_TickScheme;
+
+
+/* "nautilus_trader/model/c_enums/asset_type.pxd":27
+ * 
+ * 
+ * cdef class AssetTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10asset_type_AssetType (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser;
+
+
+/* "nautilus_trader/model/c_enums/asset_class.pxd":29
+ * 
+ * 
+ * cdef class AssetClassParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_11asset_class_AssetClass (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser;
+
+
+/* "nautilus_trader/model/events/order.pxd":209
+ * 
+ * 
+ * cdef class OrderFilled(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly TradeId trade_id
+ *     """The trade match ID (assigned by the venue).\n\n:returns: `TradeId`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderFilled {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+  int (*is_buy_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+  int (*is_sell_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderFilled *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderFilled;
+
+
+/* "nautilus_trader/model/events/order.pxd":194
+ * 
+ * 
+ * cdef class OrderUpdated(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly Quantity quantity
+ *     """The orders current quantity.\n\n:returns: `Quantity`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderUpdated {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderUpdated *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderUpdated *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderUpdated *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderUpdated;
+
+
+/* "nautilus_trader/model/events/order.pxd":183
+ * 
+ * 
+ * cdef class OrderCancelRejected(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason for order cancel rejection.\n\n:returns: `str`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCancelRejected {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCancelRejected *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCancelRejected *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCancelRejected *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderCancelRejected;
+
+
+/* "nautilus_trader/model/events/order.pxd":172
+ * 
+ * 
+ * cdef class OrderModifyRejected(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason for modify order rejection.\n\n:returns: `str`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderModifyRejected {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderModifyRejected *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderModifyRejected *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderModifyRejected *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderModifyRejected;
+
+
+/* "nautilus_trader/model/events/order.pxd":163
+ * 
+ * 
+ * cdef class OrderPendingCancel(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingCancel {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingCancel *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingCancel *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingCancel *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderPendingCancel;
+
+
+/* "nautilus_trader/model/events/order.pxd":154
+ * 
+ * 
+ * cdef class OrderPendingUpdate(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingUpdate {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingUpdate *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingUpdate *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingUpdate *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderPendingUpdate;
+
+
+/* "nautilus_trader/model/events/order.pxd":145
+ * 
+ * 
+ * cdef class OrderTriggered(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderTriggered {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderTriggered *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderTriggered *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderTriggered *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderTriggered;
+
+
+/* "nautilus_trader/model/events/order.pxd":136
+ * 
+ * 
+ * cdef class OrderExpired(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderExpired {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderExpired *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderExpired *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderExpired *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderExpired;
+
+
+/* "nautilus_trader/model/events/order.pxd":127
+ * 
+ * 
+ * cdef class OrderCanceled(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCanceled {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCanceled *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCanceled *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCanceled *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderCanceled;
+
+
+/* "nautilus_trader/model/events/order.pxd":116
+ * 
+ * 
+ * cdef class OrderRejected(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason the order was rejected.\n\n:returns: `str`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderRejected {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderRejected *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderRejected *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderRejected *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderRejected;
+
+
+/* "nautilus_trader/model/events/order.pxd":107
+ * 
+ * 
+ * cdef class OrderAccepted(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderAccepted {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderAccepted *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderAccepted *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderAccepted *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderAccepted;
+
+
+/* "nautilus_trader/model/events/order.pxd":98
+ * 
+ * 
+ * cdef class OrderSubmitted(OrderEvent):             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderSubmitted {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderSubmitted *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderSubmitted *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderSubmitted *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderSubmitted;
+
+
+/* "nautilus_trader/model/events/order.pxd":87
+ * 
+ * 
+ * cdef class OrderDenied(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly str reason
+ *     """The reason the order was denied.\n\n:returns: `str`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderDenied {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderDenied *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderDenied *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderDenied *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderDenied;
+
+
+/* "nautilus_trader/model/events/order.pxd":54
+ * 
+ * 
+ * cdef class OrderInitialized(OrderEvent):             # <<<<<<<<<<<<<<
+ *     cdef readonly OrderSide side
+ *     """The order side.\n\n:returns: `OrderSide`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderInitialized {
+  struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderInitialized *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderInitialized *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderInitialized *__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderInitialized;
+
+
+/* "nautilus_trader/model/objects.pxd":165
+ * 
+ * 
+ * cdef class MarginBalance:             # <<<<<<<<<<<<<<
+ *     cdef readonly Money initial
+ *     """The initial margin requirement.\n\n:returns: `Money`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_MarginBalance {
+  struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict)(struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_MarginBalance *__pyx_vtabptr_15nautilus_trader_5model_7objects_MarginBalance;
+
+
+/* "nautilus_trader/model/objects.pxd":150
+ * 
+ * 
+ * cdef class AccountBalance:             # <<<<<<<<<<<<<<
+ *     cdef readonly Money total
+ *     """The total account balance.\n\n:returns: `Money`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_AccountBalance {
+  struct __pyx_obj_15nautilus_trader_5model_7objects_AccountBalance *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict)(struct __pyx_obj_15nautilus_trader_5model_7objects_AccountBalance *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_AccountBalance *__pyx_vtabptr_15nautilus_trader_5model_7objects_AccountBalance;
+
+
+/* "nautilus_trader/model/objects.pxd":115
+ * 
+ * 
+ * cdef class Money:             # <<<<<<<<<<<<<<
+ *     cdef Money_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Money {
+  int (*is_zero)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  int (*is_negative)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  int (*is_positive)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  int64_t (*raw_int64_c)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  double (*as_f64_c)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  double (*raw_to_f64_c)(uint64_t);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*from_raw_c)(uint64_t, struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*from_str_c)(PyObject *);
+  PyObject *(*to_str)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, int __pyx_skip_dispatch);
+  PyObject *(*_extract_decimal)(PyObject *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*add)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Money *(*sub)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  void (*add_assign)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  void (*sub_assign)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, struct __pyx_obj_15nautilus_trader_5model_7objects_Money *);
+  PyObject *(*as_decimal)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, int __pyx_skip_dispatch);
+  double (*as_double)(struct __pyx_obj_15nautilus_trader_5model_7objects_Money *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Money *__pyx_vtabptr_15nautilus_trader_5model_7objects_Money;
+
+
+/* "nautilus_trader/model/objects.pxd":73
+ * 
+ * 
+ * cdef class Price:             # <<<<<<<<<<<<<<
+ *     cdef Price_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Price {
+  int (*eq)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*ne)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*lt)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*le)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*gt)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*ge)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*is_zero)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*is_negative)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int (*is_positive)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  int64_t (*raw_int64_c)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  double (*as_f64_c)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*add)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*sub)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  void (*add_assign)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  void (*sub_assign)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, struct __pyx_obj_15nautilus_trader_5model_7objects_Price *);
+  PyObject *(*_extract_decimal)(PyObject *);
+  int (*_compare)(PyObject *, PyObject *, int);
+  double (*raw_to_f64_c)(uint64_t);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*from_raw_c)(int64_t, uint8_t);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*from_str_c)(PyObject *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Price *(*from_int_c)(int);
+  PyObject *(*as_decimal)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch);
+  double (*as_double)(struct __pyx_obj_15nautilus_trader_5model_7objects_Price *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Price *__pyx_vtabptr_15nautilus_trader_5model_7objects_Price;
+
+
+/* "nautilus_trader/model/objects.pxd":27
+ * 
+ * 
+ * cdef class Quantity:             # <<<<<<<<<<<<<<
+ *     cdef Quantity_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Quantity {
+  int (*eq)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*ne)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*lt)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*le)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*gt)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*ge)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*is_zero)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*is_negative)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  int (*is_positive)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  uint64_t (*raw_uint64_c)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  double (*as_f64_c)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *(*add)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *(*sub)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  void (*add_assign)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  void (*sub_assign)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *);
+  PyObject *(*_extract_decimal)(PyObject *);
+  int (*_compare)(PyObject *, PyObject *, int);
+  double (*raw_to_f64_c)(uint64_t);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *(*from_raw_c)(uint64_t, uint8_t);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *(*zero_c)(uint8_t);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *(*from_str_c)(PyObject *);
+  struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *(*from_int_c)(int);
+  PyObject *(*to_str)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, int __pyx_skip_dispatch);
+  PyObject *(*as_decimal)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, int __pyx_skip_dispatch);
+  double (*as_double)(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Quantity *__pyx_vtabptr_15nautilus_trader_5model_7objects_Quantity;
+
+
+/* "nautilus_trader/model/c_enums/time_in_force.pxd":27
+ * 
+ * 
+ * cdef class TimeInForceParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForce (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser;
+
+
+/* "nautilus_trader/model/c_enums/order_type.pxd":29
+ * 
+ * 
+ * cdef class OrderTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_type_OrderType (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser;
+
+
+/* "nautilus_trader/model/c_enums/order_side.pxd":22
+ * 
+ * 
+ * cdef class OrderSideParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_10order_side_OrderSide (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser;
+
+
+/* "nautilus_trader/model/c_enums/contingency_type.pxd":27
+ * 
+ * 
+ * cdef class ContingencyTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyType (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser;
+
+
+/* "nautilus_trader/model/events/account.pxd":22
+ * 
+ * 
+ * cdef class AccountState(Event):             # <<<<<<<<<<<<<<
+ *     cdef readonly AccountId account_id
+ *     """The account ID associated with the event.\n\n:returns: `AccountId`"""
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_6events_7account_AccountState {
+  struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *(*from_dict_c)(PyObject *);
+  PyObject *(*to_dict_c)(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_6events_7account_AccountState *__pyx_vtabptr_15nautilus_trader_5model_6events_7account_AccountState;
+
+
+/* "nautilus_trader/model/identifiers.pxd":28
+ * 
+ * 
+ * cdef class Identifier:             # <<<<<<<<<<<<<<
+ *     cdef str to_str(self)
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier {
+  PyObject *(*to_str)(struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_Identifier;
+
+
+/* "nautilus_trader/model/identifiers.pxd":100
+ * 
+ * 
+ * cdef class TradeId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef TradeId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_TradeId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_TradeId *(*from_raw_c)(struct TradeId_t);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_TradeId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_TradeId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":92
+ * 
+ * 
+ * cdef class PositionId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef PositionId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_PositionId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId *(*from_raw_c)(struct PositionId_t);
+  int (*is_virtual_c)(struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_PositionId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_PositionId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":88
+ * 
+ * 
+ * cdef class OrderListId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef OrderListId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_OrderListId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_OrderListId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_OrderListId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":84
+ * 
+ * 
+ * cdef class VenueOrderId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef VenueOrderId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_VenueOrderId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_VenueOrderId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_VenueOrderId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":80
+ * 
+ * 
+ * cdef class ClientOrderId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef ClientOrderId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ClientOrderId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ClientOrderId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_ClientOrderId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":74
+ * 
+ * 
+ * cdef class AccountId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef AccountId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_AccountId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  PyObject *(*get_issuer)(struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_AccountId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_AccountId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":55
+ * 
+ * 
+ * cdef class ComponentId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef ComponentId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ComponentId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ComponentId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_ComponentId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":67
+ * 
+ * 
+ * cdef class StrategyId(ComponentId):             # <<<<<<<<<<<<<<
+ *     cpdef str get_tag(self)
+ *     cpdef bint is_external(self)
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_StrategyId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ComponentId __pyx_base;
+  PyObject *(*get_tag)(struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId *, int __pyx_skip_dispatch);
+  int (*is_external)(struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId *, int __pyx_skip_dispatch);
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId *(*external_c)(void);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_StrategyId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_StrategyId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":63
+ * 
+ * 
+ * cdef class TraderId(ComponentId):             # <<<<<<<<<<<<<<
+ *     cpdef str get_tag(self)
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_TraderId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ComponentId __pyx_base;
+  PyObject *(*get_tag)(struct __pyx_obj_15nautilus_trader_5model_11identifiers_TraderId *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_TraderId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_TraderId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":59
+ * 
+ * 
+ * cdef class ClientId(ComponentId):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ClientId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ComponentId __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ClientId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_ClientId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":40
+ * 
+ * 
+ * cdef class InstrumentId(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef InstrumentId_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_InstrumentId {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *(*from_raw_c)(struct InstrumentId_t);
+  struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId *(*from_str_c)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_InstrumentId *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_InstrumentId;
+
+
+/* "nautilus_trader/model/identifiers.pxd":36
+ * 
+ * 
+ * cdef class Venue(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef Venue_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Venue {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Venue *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_Venue;
+
+
+/* "nautilus_trader/model/identifiers.pxd":32
+ * 
+ * 
+ * cdef class Symbol(Identifier):             # <<<<<<<<<<<<<<
+ *     cdef Symbol_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Symbol {
+  struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier __pyx_base;
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Symbol *__pyx_vtabptr_15nautilus_trader_5model_11identifiers_Symbol;
+
+
+/* "nautilus_trader/core/message.pxd":29
+ * 
+ * 
+ * cdef class MessageCategoryParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_4core_7message_MessageCategoryParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_4core_7message_MessageCategory (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_4core_7message_MessageCategoryParser *__pyx_vtabptr_15nautilus_trader_4core_7message_MessageCategoryParser;
+
+
+/* "nautilus_trader/core/uuid.pxd":19
+ * 
+ * 
+ * cdef class UUID4:             # <<<<<<<<<<<<<<
+ *     cdef UUID4_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_4core_4uuid_UUID4 {
+  struct UUID4_t (*_uuid4_from_pystr)(struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4 *, PyObject *);
+  PyObject *(*to_str)(struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4 *);
+  struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4 *(*from_raw_c)(struct UUID4_t);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_4core_4uuid_UUID4 *__pyx_vtabptr_15nautilus_trader_4core_4uuid_UUID4;
+
+
+/* "nautilus_trader/model/currency.pxd":21
+ * 
+ * 
+ * cdef class Currency:             # <<<<<<<<<<<<<<
+ *     cdef Currency_t _mem
+ * 
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_8currency_Currency {
+  uint8_t (*get_precision)(struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *);
+  void (*register_c)(struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *, struct __pyx_opt_args_15nautilus_trader_5model_8currency_8Currency_register_c *__pyx_optional_args);
+  struct __pyx_obj_15nautilus_trader_5model_8currency_Currency *(*from_str_c)(PyObject *, struct __pyx_opt_args_15nautilus_trader_5model_8currency_8Currency_from_str_c *__pyx_optional_args);
+  int (*is_fiat_c)(PyObject *);
+  int (*is_crypto_c)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_8currency_Currency *__pyx_vtabptr_15nautilus_trader_5model_8currency_Currency;
+
+
+/* "nautilus_trader/model/c_enums/liquidity_side.pxd":23
+ * 
+ * 
+ * cdef class LiquiditySideParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySide (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser;
+
+
+/* "nautilus_trader/model/c_enums/account_type.pxd":23
+ * 
+ * 
+ * cdef class AccountTypeParser:             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+
+struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser {
+  PyObject *(*to_str)(int);
+  enum __pyx_t_15nautilus_trader_5model_7c_enums_12account_type_AccountType (*from_str)(PyObject *);
+};
+static struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser *__pyx_vtabptr_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser;
+/* #### Code section: utility_code_proto ### */
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, Py_ssize_t);
+    void (*DECREF)(void*, PyObject*, Py_ssize_t);
+    void (*GOTREF)(void*, PyObject*, Py_ssize_t);
+    void (*GIVEREF)(void*, PyObject*, Py_ssize_t);
+    void* (*SetupContext)(const char*, Py_ssize_t, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__))
+  #define __Pyx_RefNannyFinishContextNogil() __Pyx_RefNannyFinishContext()
+#endif
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_XINCREF(r)  do { if((r) == NULL); else {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) == NULL); else {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) == NULL); else {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) == NULL); else {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContextNogil()
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_Py_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; Py_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* TupleAndListFromArray.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* fastcall.proto */
+#define __Pyx_Arg_VARARGS(args, i) PyTuple_GET_ITEM(args, i)
+#define __Pyx_NumKwargs_VARARGS(kwds) PyDict_Size(kwds)
+#define __Pyx_KwValues_VARARGS(args, nargs) NULL
+#define __Pyx_GetKwValue_VARARGS(kw, kwvalues, s) __Pyx_PyDict_GetItemStrWithError(kw, s)
+#define __Pyx_KwargsAsDict_VARARGS(kw, kwvalues) PyDict_Copy(kw)
+#if CYTHON_METH_FASTCALL
+    #define __Pyx_Arg_FASTCALL(args, i) args[i]
+    #define __Pyx_NumKwargs_FASTCALL(kwds) PyTuple_GET_SIZE(kwds)
+    #define __Pyx_KwValues_FASTCALL(args, nargs) ((args) + (nargs))
+    static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s);
+    #define __Pyx_KwargsAsDict_FASTCALL(kw, kwvalues) _PyStack_AsDict(kwvalues, kw)
+#else
+    #define __Pyx_Arg_FASTCALL __Pyx_Arg_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL __Pyx_KwargsAsDict_VARARGS
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_ArgsSlice_VARARGS(args, start, stop) __Pyx_PyTuple_FromArray(&__Pyx_Arg_VARARGS(args, start), stop - start)
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) __Pyx_PyTuple_FromArray(&__Pyx_Arg_FASTCALL(args, start), stop - start)
+#else
+#define __Pyx_ArgsSlice_VARARGS(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#endif
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject *const *kwvalues,
+    PyObject **argnames[],
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,
+    const char* function_name);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* UnpackUnboundCMethod.proto */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+} __Pyx_CachedCFunction;
+
+/* CallUnboundCMethod1.proto */
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* CallUnboundCMethod2.proto */
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* RaiseUnexpectedTypeError.proto */
+static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kw, const char* function_name, int kw_allowed);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#if !CYTHON_VECTORCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if !CYTHON_VECTORCALL
+#if PY_VERSION_HEX >= 0x03080000
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()
+  #define __Pyx_PyFrame_GetLocalsplus(frame)  ((frame)->f_localsplus)
+#else
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif
+#endif
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectFastCall.proto */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs);
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* IncludeStructmemberH.proto */
+#include <structmember.h>
+
+/* FixUpExtensionType.proto */
+#if CYTHON_USE_TYPE_SPECS
+static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type);
+#endif
+
+/* PyObjectCallNoArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* ValidateBasesTuple.proto */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases);
+#endif
+
+/* PyType_Ready.proto */
+CYTHON_UNUSED static int __Pyx_PyType_Ready(PyTypeObject *t);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyTypeObject *type);
+
+/* MergeVTables.proto */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_MergeVtables(PyTypeObject *type);
+#endif
+
+/* SetupReduce.proto */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_setup_reduce(PyObject* type_obj);
+#endif
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto
+#define __PYX_HAVE_RT_ImportType_proto
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize {
+   __Pyx_ImportType_CheckSize_Error = 0,
+   __Pyx_ImportType_CheckSize_Warn = 1,
+   __Pyx_ImportType_CheckSize_Ignore = 2
+};
+static PyTypeObject *__Pyx_ImportType(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize check_size);
+#endif
+
+/* FetchSharedCythonModule.proto */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void);
+
+/* FetchCommonType.proto */
+#if !CYTHON_USE_TYPE_SPECS
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+#else
+static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyObject *module, PyType_Spec *spec, PyObject *bases);
+#endif
+
+/* PyMethodNew.proto */
+#if PY_MAJOR_VERSION >= 3
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    return PyMethod_New(func, self);
+}
+#else
+    #define __Pyx_PyMethod_New PyMethod_New
+#endif
+
+/* PyVectorcallFastCallDict.proto */
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw);
+#endif
+
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CYFUNCTION_COROUTINE     0x08
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#if PY_VERSION_HEX < 0x030900B1
+  #define __Pyx_CyFunction_GetClassObj(f)\
+      (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#else
+  #define __Pyx_CyFunction_GetClassObj(f)\
+      ((PyObject*) ((PyCMethodObject *) (f))->mm_class)
+#endif
+#define __Pyx_CyFunction_SetClassObj(f, classobj)\
+    __Pyx__CyFunction_SetClassObj((__pyx_CyFunctionObject *) (f), (classobj))
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+#if PY_VERSION_HEX < 0x030900B1
+    PyCFunctionObject func;
+#else
+    PyCMethodObject func;
+#endif
+#if CYTHON_BACKPORT_VECTORCALL
+    __pyx_vectorcallfunc func_vectorcall;
+#endif
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+#if PY_VERSION_HEX < 0x030900B1
+    PyObject *func_classobj;
+#endif
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;  // used by FusedFunction for copying defaults
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+    PyObject *func_is_coroutine;
+} __pyx_CyFunctionObject;
+#define __Pyx_CyFunction_Check(obj)  __Pyx_TypeCheck(obj, __pyx_CyFunctionType)
+#define __Pyx_IsCyOrPyCFunction(obj)  __Pyx_TypeCheck2(obj, __pyx_CyFunctionType, &PyCFunction_Type)
+#define __Pyx_CyFunction_CheckExact(obj)  __Pyx_IS_TYPE(obj, __pyx_CyFunctionType)
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(PyObject *module);
+#if CYTHON_METH_FASTCALL
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#if CYTHON_BACKPORT_VECTORCALL
+#define __Pyx_CyFunction_func_vectorcall(f) (((__pyx_CyFunctionObject*)f)->func_vectorcall)
+#else
+#define __Pyx_CyFunction_func_vectorcall(f) (((PyCFunctionObject*)f)->vectorcall)
+#endif
+#endif
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* GetNameInClass.proto */
+#define __Pyx_GetNameInClass(var, nmspace, name)  (var) = __Pyx__GetNameInClass(nmspace, name)
+static PyObject *__Pyx__GetNameInClass(PyObject *nmspace, PyObject *name);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+#endif
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* FormatTypeName.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+static __Pyx_TypeName __Pyx_PyType_GetName(PyTypeObject* tp);
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+#else
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_Occurred(), err1, err2)
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* VoidPtrImport.proto */
+static int __Pyx_ImportVoidPtr(PyObject *module, const char *name, void **p, const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+/* #### Code section: module_declarations ### */
+static struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_f_15nautilus_trader_10accounting_7factory_14AccountFactory_create_c(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *__pyx_v_event); /* proto*/
+
+/* Module declarations from "nautilus_trader.model.c_enums.account_type" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.liquidity_side" */
+
+/* Module declarations from "libc.stdint" */
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "libc.stdio" */
+
+/* Module declarations from "__builtin__" */
+
+/* Module declarations from "cpython.type" */
+
+/* Module declarations from "cpython" */
+
+/* Module declarations from "cpython.object" */
+
+/* Module declarations from "nautilus_trader.core.rust.model" */
+
+/* Module declarations from "nautilus_trader.model.currency" */
+
+/* Module declarations from "nautilus_trader.core.rust.core" */
+
+/* Module declarations from "nautilus_trader.core.uuid" */
+
+/* Module declarations from "nautilus_trader.core.message" */
+
+/* Module declarations from "nautilus_trader.model.identifiers" */
+
+/* Module declarations from "nautilus_trader.model.events.account" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.contingency_type" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.order_side" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.order_type" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.time_in_force" */
+
+/* Module declarations from "nautilus_trader.model.objects" */
+
+/* Module declarations from "nautilus_trader.model.events.order" */
+
+/* Module declarations from "nautilus_trader.core.data" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.asset_class" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.asset_type" */
+
+/* Module declarations from "nautilus_trader.model.tick_scheme.base" */
+static PyObject **__pyx_vp_15nautilus_trader_5model_11tick_scheme_4base_TICK_SCHEMES = 0;
+#define __pyx_v_15nautilus_trader_5model_11tick_scheme_4base_TICK_SCHEMES (*__pyx_vp_15nautilus_trader_5model_11tick_scheme_4base_TICK_SCHEMES)
+
+/* Module declarations from "nautilus_trader.model.instruments.base" */
+
+/* Module declarations from "nautilus_trader.model.c_enums.position_side" */
+
+/* Module declarations from "nautilus_trader.model.position" */
+
+/* Module declarations from "nautilus_trader.accounting.accounts.base" */
+
+/* Module declarations from "nautilus_trader.accounting.accounts.cash" */
+
+/* Module declarations from "nautilus_trader.accounting.accounts.betting" */
+
+/* Module declarations from "nautilus_trader.accounting.accounts.margin" */
+
+/* Module declarations from "nautilus_trader.core.correctness" */
+
+/* Module declarations from "nautilus_trader.accounting.factory" */
+static PyObject *__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE = 0;
+static PyObject *__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED = 0;
+static PyObject *__pyx_f_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory__set_state(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *, PyObject *); /*proto*/
+/* #### Code section: typeinfo ### */
+/* #### Code section: before_global_var ### */
+#define __Pyx_MODULE_NAME "nautilus_trader.accounting.factory"
+extern int __pyx_module_is_main_nautilus_trader__accounting__factory;
+int __pyx_module_is_main_nautilus_trader__accounting__factory = 0;
+
+/* Implementation of "nautilus_trader.accounting.factory" */
+/* #### Code section: global_var ### */
+static PyObject *__pyx_builtin_staticmethod;
+static PyObject *__pyx_builtin_RuntimeError;
+/* #### Code section: string_decls ### */
+static const char __pyx_k__3[] = ".";
+static const char __pyx_k_gc[] = "gc";
+static const char __pyx_k__16[] = "?";
+static const char __pyx_k_get[] = "get";
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_self[] = "self";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_event[] = "event";
+static const char __pyx_k_state[] = "state";
+static const char __pyx_k_create[] = "create";
+static const char __pyx_k_dict_2[] = "_dict";
+static const char __pyx_k_enable[] = "enable";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_issuer[] = "issuer";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_return[] = "return";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_Account[] = "Account";
+static const char __pyx_k_disable[] = "disable";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_isenabled[] = "isenabled";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_account_cls[] = "account_cls";
+static const char __pyx_k_RuntimeError[] = "RuntimeError";
+static const char __pyx_k_is_coroutine[] = "_is_coroutine";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_staticmethod[] = "staticmethod";
+static const char __pyx_k_stringsource[] = "<stringsource>";
+static const char __pyx_k_use_setstate[] = "use_setstate";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_AccountFactory[] = "AccountFactory";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_ISSUER_ACCOUNT_TYPE[] = "_ISSUER_ACCOUNT_TYPE";
+static const char __pyx_k_invalid_account_type[] = "invalid account type";
+static const char __pyx_k_AccountFactory_create[] = "AccountFactory.create";
+static const char __pyx_k_register_account_type[] = "register_account_type";
+static const char __pyx_k_pyx_unpickle_AccountFactory[] = "__pyx_unpickle_AccountFactory";
+static const char __pyx_k_register_calculated_account[] = "register_calculated_account";
+static const char __pyx_k_AccountFactory___reduce_cython[] = "AccountFactory.__reduce_cython__";
+static const char __pyx_k_AccountFactory_register_account[] = "AccountFactory.register_account_type";
+static const char __pyx_k_AccountFactory___setstate_cython[] = "AccountFactory.__setstate_cython__";
+static const char __pyx_k_AccountFactory_register_calculat[] = "AccountFactory.register_calculated_account";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())";
+static const char __pyx_k_nautilus_trader_accounting_facto[] = "nautilus_trader/accounting/factory.pyx";
+static const char __pyx_k_nautilus_trader_accounting_facto_2[] = "nautilus_trader.accounting.factory";
+/* #### Code section: decls ### */
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_register_account_type(PyObject *__pyx_v_issuer, PyTypeObject *__pyx_v_account_cls); /* proto */
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_2register_calculated_account(PyObject *__pyx_v_issuer); /* proto */
+static struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_4create(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *__pyx_v_event); /* proto */
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_6__reduce_cython__(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_8__setstate_cython__(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_15nautilus_trader_10accounting_7factory_AccountFactory(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get = {0, 0, 0, 0, 0};
+/* #### Code section: late_includes ### */
+/* #### Code section: module_state ### */
+typedef struct {
+  PyObject *__pyx_d;
+  PyObject *__pyx_b;
+  PyObject *__pyx_cython_runtime;
+  PyObject *__pyx_empty_tuple;
+  PyObject *__pyx_empty_bytes;
+  PyObject *__pyx_empty_unicode;
+  #ifdef __Pyx_CyFunction_USED
+  PyTypeObject *__pyx_CyFunctionType;
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  PyTypeObject *__pyx_FusedFunctionType;
+  #endif
+  #ifdef __Pyx_Generator_USED
+  PyTypeObject *__pyx_GeneratorType;
+  #endif
+  #ifdef __Pyx_IterableCoroutine_USED
+  PyTypeObject *__pyx_IterableCoroutineType;
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  PyTypeObject *__pyx_CoroutineAwaitType;
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  PyTypeObject *__pyx_CoroutineType;
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_7cpython_4type_type;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_8currency_Currency;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_4uuid_UUID4;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_7message_Message;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_7message_Command;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_7message_Document;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_7message_Event;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_7message_Request;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_7message_Response;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_Venue;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7objects_Quantity;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7objects_Price;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7objects_Money;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderEvent;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated;
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_4data_Data;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_5model_8position_Position;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount;
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_4core_11correctness_Condition;
+  #if CYTHON_USE_MODULE_STATE
+  PyObject *__pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory;
+  #endif
+  PyTypeObject *__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory;
+  PyObject *__pyx_n_s_Account;
+  PyObject *__pyx_n_s_AccountFactory;
+  PyObject *__pyx_n_s_AccountFactory___reduce_cython;
+  PyObject *__pyx_n_s_AccountFactory___setstate_cython;
+  PyObject *__pyx_n_s_AccountFactory_create;
+  PyObject *__pyx_n_s_AccountFactory_register_account;
+  PyObject *__pyx_n_s_AccountFactory_register_calculat;
+  PyObject *__pyx_n_u_ISSUER_ACCOUNT_TYPE;
+  PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+  PyObject *__pyx_n_s_PickleError;
+  PyObject *__pyx_n_s_RuntimeError;
+  PyObject *__pyx_n_s__16;
+  PyObject *__pyx_kp_u__3;
+  PyObject *__pyx_n_s_account_cls;
+  PyObject *__pyx_n_u_account_cls;
+  PyObject *__pyx_n_s_asyncio_coroutines;
+  PyObject *__pyx_n_s_cline_in_traceback;
+  PyObject *__pyx_n_s_create;
+  PyObject *__pyx_n_s_dict;
+  PyObject *__pyx_n_s_dict_2;
+  PyObject *__pyx_kp_u_disable;
+  PyObject *__pyx_kp_u_enable;
+  PyObject *__pyx_n_s_event;
+  PyObject *__pyx_n_u_event;
+  PyObject *__pyx_kp_u_gc;
+  PyObject *__pyx_n_s_get;
+  PyObject *__pyx_n_s_getstate;
+  PyObject *__pyx_n_s_import;
+  PyObject *__pyx_kp_u_invalid_account_type;
+  PyObject *__pyx_n_s_is_coroutine;
+  PyObject *__pyx_kp_u_isenabled;
+  PyObject *__pyx_n_s_issuer;
+  PyObject *__pyx_n_u_issuer;
+  PyObject *__pyx_n_s_main;
+  PyObject *__pyx_n_s_name;
+  PyObject *__pyx_kp_s_nautilus_trader_accounting_facto;
+  PyObject *__pyx_n_s_nautilus_trader_accounting_facto_2;
+  PyObject *__pyx_n_s_new;
+  PyObject *__pyx_n_s_pickle;
+  PyObject *__pyx_n_s_pyx_PickleError;
+  PyObject *__pyx_n_s_pyx_checksum;
+  PyObject *__pyx_n_s_pyx_result;
+  PyObject *__pyx_n_s_pyx_state;
+  PyObject *__pyx_n_s_pyx_type;
+  PyObject *__pyx_n_s_pyx_unpickle_AccountFactory;
+  PyObject *__pyx_n_s_pyx_vtable;
+  PyObject *__pyx_n_s_reduce;
+  PyObject *__pyx_n_s_reduce_cython;
+  PyObject *__pyx_n_s_reduce_ex;
+  PyObject *__pyx_n_s_register_account_type;
+  PyObject *__pyx_n_s_register_calculated_account;
+  PyObject *__pyx_n_s_return;
+  PyObject *__pyx_n_s_self;
+  PyObject *__pyx_n_s_setstate;
+  PyObject *__pyx_n_s_setstate_cython;
+  PyObject *__pyx_n_s_state;
+  PyObject *__pyx_n_s_staticmethod;
+  PyObject *__pyx_kp_s_stringsource;
+  PyObject *__pyx_n_s_test;
+  PyObject *__pyx_n_s_update;
+  PyObject *__pyx_n_s_use_setstate;
+  PyObject *__pyx_int_222419149;
+  PyObject *__pyx_int_228825662;
+  PyObject *__pyx_int_238750788;
+  PyObject *__pyx_tuple_;
+  PyObject *__pyx_tuple__2;
+  PyObject *__pyx_tuple__4;
+  PyObject *__pyx_tuple__6;
+  PyObject *__pyx_tuple__8;
+  PyObject *__pyx_tuple__10;
+  PyObject *__pyx_tuple__12;
+  PyObject *__pyx_tuple__14;
+  PyObject *__pyx_codeobj__5;
+  PyObject *__pyx_codeobj__7;
+  PyObject *__pyx_codeobj__9;
+  PyObject *__pyx_codeobj__11;
+  PyObject *__pyx_codeobj__13;
+  PyObject *__pyx_codeobj__15;
+} __pyx_mstate;
+
+#if CYTHON_USE_MODULE_STATE
+#ifdef __cplusplus
+namespace {
+  extern struct PyModuleDef __pyx_moduledef;
+} /* anonymous namespace */
+#else
+static struct PyModuleDef __pyx_moduledef;
+#endif
+
+#define __pyx_mstate(o) ((__pyx_mstate *)__Pyx_PyModule_GetState(o))
+
+#define __pyx_mstate_global (__pyx_mstate(PyState_FindModule(&__pyx_moduledef)))
+
+#define __pyx_m (PyState_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstate __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstate *__pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: module_state_clear ### */
+#if CYTHON_USE_MODULE_STATE
+static int __pyx_m_clear(PyObject *m) {
+  __pyx_mstate *clear_module_state = __pyx_mstate(m);
+  if (!clear_module_state) return 0;
+  Py_CLEAR(clear_module_state->__pyx_d);
+  Py_CLEAR(clear_module_state->__pyx_b);
+  Py_CLEAR(clear_module_state->__pyx_cython_runtime);
+  Py_CLEAR(clear_module_state->__pyx_empty_tuple);
+  Py_CLEAR(clear_module_state->__pyx_empty_bytes);
+  Py_CLEAR(clear_module_state->__pyx_empty_unicode);
+  #ifdef __Pyx_CyFunction_USED
+  Py_CLEAR(clear_module_state->__pyx_CyFunctionType);
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  Py_CLEAR(clear_module_state->__pyx_FusedFunctionType);
+  #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_7cpython_4type_type);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_8currency_Currency);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_4uuid_UUID4);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Message);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Command);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Document);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Event);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Request);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Response);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_Venue);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_Quantity);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_Price);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_Money);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderEvent);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_4data_Data);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_5model_8position_Position);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_4core_11correctness_Condition);
+  Py_CLEAR(clear_module_state->__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+  Py_CLEAR(clear_module_state->__pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Account);
+  Py_CLEAR(clear_module_state->__pyx_n_s_AccountFactory);
+  Py_CLEAR(clear_module_state->__pyx_n_s_AccountFactory___reduce_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_AccountFactory___setstate_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_AccountFactory_create);
+  Py_CLEAR(clear_module_state->__pyx_n_s_AccountFactory_register_account);
+  Py_CLEAR(clear_module_state->__pyx_n_s_AccountFactory_register_calculat);
+  Py_CLEAR(clear_module_state->__pyx_n_u_ISSUER_ACCOUNT_TYPE);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0);
+  Py_CLEAR(clear_module_state->__pyx_n_s_PickleError);
+  Py_CLEAR(clear_module_state->__pyx_n_s_RuntimeError);
+  Py_CLEAR(clear_module_state->__pyx_n_s__16);
+  Py_CLEAR(clear_module_state->__pyx_kp_u__3);
+  Py_CLEAR(clear_module_state->__pyx_n_s_account_cls);
+  Py_CLEAR(clear_module_state->__pyx_n_u_account_cls);
+  Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
+  Py_CLEAR(clear_module_state->__pyx_n_s_create);
+  Py_CLEAR(clear_module_state->__pyx_n_s_dict);
+  Py_CLEAR(clear_module_state->__pyx_n_s_dict_2);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_disable);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_enable);
+  Py_CLEAR(clear_module_state->__pyx_n_s_event);
+  Py_CLEAR(clear_module_state->__pyx_n_u_event);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_gc);
+  Py_CLEAR(clear_module_state->__pyx_n_s_get);
+  Py_CLEAR(clear_module_state->__pyx_n_s_getstate);
+  Py_CLEAR(clear_module_state->__pyx_n_s_import);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_invalid_account_type);
+  Py_CLEAR(clear_module_state->__pyx_n_s_is_coroutine);
+  Py_CLEAR(clear_module_state->__pyx_kp_u_isenabled);
+  Py_CLEAR(clear_module_state->__pyx_n_s_issuer);
+  Py_CLEAR(clear_module_state->__pyx_n_u_issuer);
+  Py_CLEAR(clear_module_state->__pyx_n_s_main);
+  Py_CLEAR(clear_module_state->__pyx_n_s_name);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_nautilus_trader_accounting_facto);
+  Py_CLEAR(clear_module_state->__pyx_n_s_nautilus_trader_accounting_facto_2);
+  Py_CLEAR(clear_module_state->__pyx_n_s_new);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pickle);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_PickleError);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_checksum);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_result);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_state);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_type);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_unpickle_AccountFactory);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_vtable);
+  Py_CLEAR(clear_module_state->__pyx_n_s_reduce);
+  Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
+  Py_CLEAR(clear_module_state->__pyx_n_s_register_account_type);
+  Py_CLEAR(clear_module_state->__pyx_n_s_register_calculated_account);
+  Py_CLEAR(clear_module_state->__pyx_n_s_return);
+  Py_CLEAR(clear_module_state->__pyx_n_s_self);
+  Py_CLEAR(clear_module_state->__pyx_n_s_setstate);
+  Py_CLEAR(clear_module_state->__pyx_n_s_setstate_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_state);
+  Py_CLEAR(clear_module_state->__pyx_n_s_staticmethod);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_stringsource);
+  Py_CLEAR(clear_module_state->__pyx_n_s_test);
+  Py_CLEAR(clear_module_state->__pyx_n_s_update);
+  Py_CLEAR(clear_module_state->__pyx_n_s_use_setstate);
+  Py_CLEAR(clear_module_state->__pyx_int_222419149);
+  Py_CLEAR(clear_module_state->__pyx_int_228825662);
+  Py_CLEAR(clear_module_state->__pyx_int_238750788);
+  Py_CLEAR(clear_module_state->__pyx_tuple_);
+  Py_CLEAR(clear_module_state->__pyx_tuple__2);
+  Py_CLEAR(clear_module_state->__pyx_tuple__4);
+  Py_CLEAR(clear_module_state->__pyx_tuple__6);
+  Py_CLEAR(clear_module_state->__pyx_tuple__8);
+  Py_CLEAR(clear_module_state->__pyx_tuple__10);
+  Py_CLEAR(clear_module_state->__pyx_tuple__12);
+  Py_CLEAR(clear_module_state->__pyx_tuple__14);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__5);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__7);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__9);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__11);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__13);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__15);
+  return 0;
+}
+#endif
+/* #### Code section: module_state_traverse ### */
+#if CYTHON_USE_MODULE_STATE
+static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstate *traverse_module_state = __pyx_mstate(m);
+  if (!traverse_module_state) return 0;
+  Py_VISIT(traverse_module_state->__pyx_d);
+  Py_VISIT(traverse_module_state->__pyx_b);
+  Py_VISIT(traverse_module_state->__pyx_cython_runtime);
+  Py_VISIT(traverse_module_state->__pyx_empty_tuple);
+  Py_VISIT(traverse_module_state->__pyx_empty_bytes);
+  Py_VISIT(traverse_module_state->__pyx_empty_unicode);
+  #ifdef __Pyx_CyFunction_USED
+  Py_VISIT(traverse_module_state->__pyx_CyFunctionType);
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  Py_VISIT(traverse_module_state->__pyx_FusedFunctionType);
+  #endif
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7cpython_4type_type);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_8currency_Currency);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_4uuid_UUID4);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Message);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Command);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Document);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Event);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Request);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_7message_Response);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_Venue);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_Quantity);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_Price);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_Money);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderEvent);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_4data_Data);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_5model_8position_Position);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_4core_11correctness_Condition);
+  Py_VISIT(traverse_module_state->__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+  Py_VISIT(traverse_module_state->__pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Account);
+  Py_VISIT(traverse_module_state->__pyx_n_s_AccountFactory);
+  Py_VISIT(traverse_module_state->__pyx_n_s_AccountFactory___reduce_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_AccountFactory___setstate_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_AccountFactory_create);
+  Py_VISIT(traverse_module_state->__pyx_n_s_AccountFactory_register_account);
+  Py_VISIT(traverse_module_state->__pyx_n_s_AccountFactory_register_calculat);
+  Py_VISIT(traverse_module_state->__pyx_n_u_ISSUER_ACCOUNT_TYPE);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0);
+  Py_VISIT(traverse_module_state->__pyx_n_s_PickleError);
+  Py_VISIT(traverse_module_state->__pyx_n_s_RuntimeError);
+  Py_VISIT(traverse_module_state->__pyx_n_s__16);
+  Py_VISIT(traverse_module_state->__pyx_kp_u__3);
+  Py_VISIT(traverse_module_state->__pyx_n_s_account_cls);
+  Py_VISIT(traverse_module_state->__pyx_n_u_account_cls);
+  Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
+  Py_VISIT(traverse_module_state->__pyx_n_s_create);
+  Py_VISIT(traverse_module_state->__pyx_n_s_dict);
+  Py_VISIT(traverse_module_state->__pyx_n_s_dict_2);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_disable);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_enable);
+  Py_VISIT(traverse_module_state->__pyx_n_s_event);
+  Py_VISIT(traverse_module_state->__pyx_n_u_event);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_gc);
+  Py_VISIT(traverse_module_state->__pyx_n_s_get);
+  Py_VISIT(traverse_module_state->__pyx_n_s_getstate);
+  Py_VISIT(traverse_module_state->__pyx_n_s_import);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_invalid_account_type);
+  Py_VISIT(traverse_module_state->__pyx_n_s_is_coroutine);
+  Py_VISIT(traverse_module_state->__pyx_kp_u_isenabled);
+  Py_VISIT(traverse_module_state->__pyx_n_s_issuer);
+  Py_VISIT(traverse_module_state->__pyx_n_u_issuer);
+  Py_VISIT(traverse_module_state->__pyx_n_s_main);
+  Py_VISIT(traverse_module_state->__pyx_n_s_name);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_nautilus_trader_accounting_facto);
+  Py_VISIT(traverse_module_state->__pyx_n_s_nautilus_trader_accounting_facto_2);
+  Py_VISIT(traverse_module_state->__pyx_n_s_new);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pickle);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_PickleError);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_checksum);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_result);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_state);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_type);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_unpickle_AccountFactory);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_vtable);
+  Py_VISIT(traverse_module_state->__pyx_n_s_reduce);
+  Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
+  Py_VISIT(traverse_module_state->__pyx_n_s_register_account_type);
+  Py_VISIT(traverse_module_state->__pyx_n_s_register_calculated_account);
+  Py_VISIT(traverse_module_state->__pyx_n_s_return);
+  Py_VISIT(traverse_module_state->__pyx_n_s_self);
+  Py_VISIT(traverse_module_state->__pyx_n_s_setstate);
+  Py_VISIT(traverse_module_state->__pyx_n_s_setstate_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_state);
+  Py_VISIT(traverse_module_state->__pyx_n_s_staticmethod);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_stringsource);
+  Py_VISIT(traverse_module_state->__pyx_n_s_test);
+  Py_VISIT(traverse_module_state->__pyx_n_s_update);
+  Py_VISIT(traverse_module_state->__pyx_n_s_use_setstate);
+  Py_VISIT(traverse_module_state->__pyx_int_222419149);
+  Py_VISIT(traverse_module_state->__pyx_int_228825662);
+  Py_VISIT(traverse_module_state->__pyx_int_238750788);
+  Py_VISIT(traverse_module_state->__pyx_tuple_);
+  Py_VISIT(traverse_module_state->__pyx_tuple__2);
+  Py_VISIT(traverse_module_state->__pyx_tuple__4);
+  Py_VISIT(traverse_module_state->__pyx_tuple__6);
+  Py_VISIT(traverse_module_state->__pyx_tuple__8);
+  Py_VISIT(traverse_module_state->__pyx_tuple__10);
+  Py_VISIT(traverse_module_state->__pyx_tuple__12);
+  Py_VISIT(traverse_module_state->__pyx_tuple__14);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__5);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__7);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__9);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__11);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__13);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__15);
+  return 0;
+}
+#endif
+/* #### Code section: module_state_defines ### */
+#define __pyx_d __pyx_mstate_global->__pyx_d
+#define __pyx_b __pyx_mstate_global->__pyx_b
+#define __pyx_cython_runtime __pyx_mstate_global->__pyx_cython_runtime
+#define __pyx_empty_tuple __pyx_mstate_global->__pyx_empty_tuple
+#define __pyx_empty_bytes __pyx_mstate_global->__pyx_empty_bytes
+#define __pyx_empty_unicode __pyx_mstate_global->__pyx_empty_unicode
+#ifdef __Pyx_CyFunction_USED
+#define __pyx_CyFunctionType __pyx_mstate_global->__pyx_CyFunctionType
+#endif
+#ifdef __Pyx_FusedFunction_USED
+#define __pyx_FusedFunctionType __pyx_mstate_global->__pyx_FusedFunctionType
+#endif
+#ifdef __Pyx_Generator_USED
+#define __pyx_GeneratorType __pyx_mstate_global->__pyx_GeneratorType
+#endif
+#ifdef __Pyx_IterableCoroutine_USED
+#define __pyx_IterableCoroutineType __pyx_mstate_global->__pyx_IterableCoroutineType
+#endif
+#ifdef __Pyx_Coroutine_USED
+#define __pyx_CoroutineAwaitType __pyx_mstate_global->__pyx_CoroutineAwaitType
+#endif
+#ifdef __Pyx_Coroutine_USED
+#define __pyx_CoroutineType __pyx_mstate_global->__pyx_CoroutineType
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_7cpython_4type_type __pyx_mstate_global->__pyx_ptype_7cpython_4type_type
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_8currency_Currency __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_8currency_Currency
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_4core_4uuid_UUID4 __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_4uuid_UUID4
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser
+#define __pyx_ptype_15nautilus_trader_4core_7message_Message __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_7message_Message
+#define __pyx_ptype_15nautilus_trader_4core_7message_Command __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_7message_Command
+#define __pyx_ptype_15nautilus_trader_4core_7message_Document __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_7message_Document
+#define __pyx_ptype_15nautilus_trader_4core_7message_Event __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_7message_Event
+#define __pyx_ptype_15nautilus_trader_4core_7message_Request __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_7message_Request
+#define __pyx_ptype_15nautilus_trader_4core_7message_Response __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_7message_Response
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_Venue __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_Venue
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId
+#define __pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7objects_Quantity __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7objects_Quantity
+#define __pyx_ptype_15nautilus_trader_5model_7objects_Price __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7objects_Price
+#define __pyx_ptype_15nautilus_trader_5model_7objects_Money __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7objects_Money
+#define __pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance
+#define __pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderEvent __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderEvent
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated
+#define __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_4core_4data_Data __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_4data_Data
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_5model_8position_Position __pyx_mstate_global->__pyx_ptype_15nautilus_trader_5model_8position_Position
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account __pyx_mstate_global->__pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount __pyx_mstate_global->__pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount __pyx_mstate_global->__pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount __pyx_mstate_global->__pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount
+#if CYTHON_USE_MODULE_STATE
+#endif
+#define __pyx_ptype_15nautilus_trader_4core_11correctness_Condition __pyx_mstate_global->__pyx_ptype_15nautilus_trader_4core_11correctness_Condition
+#if CYTHON_USE_MODULE_STATE
+#define __pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory __pyx_mstate_global->__pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory
+#endif
+#define __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory __pyx_mstate_global->__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory
+#define __pyx_n_s_Account __pyx_mstate_global->__pyx_n_s_Account
+#define __pyx_n_s_AccountFactory __pyx_mstate_global->__pyx_n_s_AccountFactory
+#define __pyx_n_s_AccountFactory___reduce_cython __pyx_mstate_global->__pyx_n_s_AccountFactory___reduce_cython
+#define __pyx_n_s_AccountFactory___setstate_cython __pyx_mstate_global->__pyx_n_s_AccountFactory___setstate_cython
+#define __pyx_n_s_AccountFactory_create __pyx_mstate_global->__pyx_n_s_AccountFactory_create
+#define __pyx_n_s_AccountFactory_register_account __pyx_mstate_global->__pyx_n_s_AccountFactory_register_account
+#define __pyx_n_s_AccountFactory_register_calculat __pyx_mstate_global->__pyx_n_s_AccountFactory_register_calculat
+#define __pyx_n_u_ISSUER_ACCOUNT_TYPE __pyx_mstate_global->__pyx_n_u_ISSUER_ACCOUNT_TYPE
+#define __pyx_kp_s_Incompatible_checksums_0x_x_vs_0 __pyx_mstate_global->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0
+#define __pyx_n_s_PickleError __pyx_mstate_global->__pyx_n_s_PickleError
+#define __pyx_n_s_RuntimeError __pyx_mstate_global->__pyx_n_s_RuntimeError
+#define __pyx_n_s__16 __pyx_mstate_global->__pyx_n_s__16
+#define __pyx_kp_u__3 __pyx_mstate_global->__pyx_kp_u__3
+#define __pyx_n_s_account_cls __pyx_mstate_global->__pyx_n_s_account_cls
+#define __pyx_n_u_account_cls __pyx_mstate_global->__pyx_n_u_account_cls
+#define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
+#define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
+#define __pyx_n_s_create __pyx_mstate_global->__pyx_n_s_create
+#define __pyx_n_s_dict __pyx_mstate_global->__pyx_n_s_dict
+#define __pyx_n_s_dict_2 __pyx_mstate_global->__pyx_n_s_dict_2
+#define __pyx_kp_u_disable __pyx_mstate_global->__pyx_kp_u_disable
+#define __pyx_kp_u_enable __pyx_mstate_global->__pyx_kp_u_enable
+#define __pyx_n_s_event __pyx_mstate_global->__pyx_n_s_event
+#define __pyx_n_u_event __pyx_mstate_global->__pyx_n_u_event
+#define __pyx_kp_u_gc __pyx_mstate_global->__pyx_kp_u_gc
+#define __pyx_n_s_get __pyx_mstate_global->__pyx_n_s_get
+#define __pyx_n_s_getstate __pyx_mstate_global->__pyx_n_s_getstate
+#define __pyx_n_s_import __pyx_mstate_global->__pyx_n_s_import
+#define __pyx_kp_u_invalid_account_type __pyx_mstate_global->__pyx_kp_u_invalid_account_type
+#define __pyx_n_s_is_coroutine __pyx_mstate_global->__pyx_n_s_is_coroutine
+#define __pyx_kp_u_isenabled __pyx_mstate_global->__pyx_kp_u_isenabled
+#define __pyx_n_s_issuer __pyx_mstate_global->__pyx_n_s_issuer
+#define __pyx_n_u_issuer __pyx_mstate_global->__pyx_n_u_issuer
+#define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
+#define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
+#define __pyx_kp_s_nautilus_trader_accounting_facto __pyx_mstate_global->__pyx_kp_s_nautilus_trader_accounting_facto
+#define __pyx_n_s_nautilus_trader_accounting_facto_2 __pyx_mstate_global->__pyx_n_s_nautilus_trader_accounting_facto_2
+#define __pyx_n_s_new __pyx_mstate_global->__pyx_n_s_new
+#define __pyx_n_s_pickle __pyx_mstate_global->__pyx_n_s_pickle
+#define __pyx_n_s_pyx_PickleError __pyx_mstate_global->__pyx_n_s_pyx_PickleError
+#define __pyx_n_s_pyx_checksum __pyx_mstate_global->__pyx_n_s_pyx_checksum
+#define __pyx_n_s_pyx_result __pyx_mstate_global->__pyx_n_s_pyx_result
+#define __pyx_n_s_pyx_state __pyx_mstate_global->__pyx_n_s_pyx_state
+#define __pyx_n_s_pyx_type __pyx_mstate_global->__pyx_n_s_pyx_type
+#define __pyx_n_s_pyx_unpickle_AccountFactory __pyx_mstate_global->__pyx_n_s_pyx_unpickle_AccountFactory
+#define __pyx_n_s_pyx_vtable __pyx_mstate_global->__pyx_n_s_pyx_vtable
+#define __pyx_n_s_reduce __pyx_mstate_global->__pyx_n_s_reduce
+#define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
+#define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
+#define __pyx_n_s_register_account_type __pyx_mstate_global->__pyx_n_s_register_account_type
+#define __pyx_n_s_register_calculated_account __pyx_mstate_global->__pyx_n_s_register_calculated_account
+#define __pyx_n_s_return __pyx_mstate_global->__pyx_n_s_return
+#define __pyx_n_s_self __pyx_mstate_global->__pyx_n_s_self
+#define __pyx_n_s_setstate __pyx_mstate_global->__pyx_n_s_setstate
+#define __pyx_n_s_setstate_cython __pyx_mstate_global->__pyx_n_s_setstate_cython
+#define __pyx_n_s_state __pyx_mstate_global->__pyx_n_s_state
+#define __pyx_n_s_staticmethod __pyx_mstate_global->__pyx_n_s_staticmethod
+#define __pyx_kp_s_stringsource __pyx_mstate_global->__pyx_kp_s_stringsource
+#define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
+#define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
+#define __pyx_n_s_use_setstate __pyx_mstate_global->__pyx_n_s_use_setstate
+#define __pyx_int_222419149 __pyx_mstate_global->__pyx_int_222419149
+#define __pyx_int_228825662 __pyx_mstate_global->__pyx_int_228825662
+#define __pyx_int_238750788 __pyx_mstate_global->__pyx_int_238750788
+#define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
+#define __pyx_tuple__2 __pyx_mstate_global->__pyx_tuple__2
+#define __pyx_tuple__4 __pyx_mstate_global->__pyx_tuple__4
+#define __pyx_tuple__6 __pyx_mstate_global->__pyx_tuple__6
+#define __pyx_tuple__8 __pyx_mstate_global->__pyx_tuple__8
+#define __pyx_tuple__10 __pyx_mstate_global->__pyx_tuple__10
+#define __pyx_tuple__12 __pyx_mstate_global->__pyx_tuple__12
+#define __pyx_tuple__14 __pyx_mstate_global->__pyx_tuple__14
+#define __pyx_codeobj__5 __pyx_mstate_global->__pyx_codeobj__5
+#define __pyx_codeobj__7 __pyx_mstate_global->__pyx_codeobj__7
+#define __pyx_codeobj__9 __pyx_mstate_global->__pyx_codeobj__9
+#define __pyx_codeobj__11 __pyx_mstate_global->__pyx_codeobj__11
+#define __pyx_codeobj__13 __pyx_mstate_global->__pyx_codeobj__13
+#define __pyx_codeobj__15 __pyx_mstate_global->__pyx_codeobj__15
+/* #### Code section: module_code ### */
+
+/* "nautilus_trader/accounting/factory.pyx":33
+ *     """
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_account_type(str issuer, type account_cls):
+ *         """
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_1register_account_type(CYTHON_UNUSED PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_register_account_type, "AccountFactory.register_account_type(unicode issuer, type account_cls)\n\n        Register the given custom account type for the issuer.\n\n        Parameters\n        ----------\n        issuer : str\n            The issuer for the account.\n        account_cls : type\n            The custom account type.\n\n        Raises\n        ------\n        KeyError\n            If `issuer` has already registered a custom account type.\n\n        ");
+static PyMethodDef __pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_1register_account_type = {"register_account_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_1register_account_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_register_account_type};
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_1register_account_type(CYTHON_UNUSED PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_issuer = 0;
+  PyTypeObject *__pyx_v_account_cls = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED const Py_ssize_t __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("register_account_type (wrapper)", 0);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_issuer,&__pyx_n_s_account_cls,0};
+    PyObject* values[2] = {0,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_issuer)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_account_cls)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 33, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("register_account_type", 1, 2, 2, 1); __PYX_ERR(0, 33, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "register_account_type") < 0)) __PYX_ERR(0, 33, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_issuer = ((PyObject*)values[0]);
+    __pyx_v_account_cls = ((PyTypeObject*)values[1]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("register_account_type", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 33, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.register_account_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_issuer), (&PyUnicode_Type), 1, "issuer", 1))) __PYX_ERR(0, 34, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_account_cls), (&PyType_Type), 1, "account_cls", 1))) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_r = __pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_register_account_type(__pyx_v_issuer, __pyx_v_account_cls);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_register_account_type(PyObject *__pyx_v_issuer, PyTypeObject *__pyx_v_account_cls) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("register_account_type", 0);
+
+  /* "nautilus_trader/accounting/factory.pyx":51
+ * 
+ *         """
+ *         Condition.not_none(issuer, "issuer")             # <<<<<<<<<<<<<<
+ *         Condition.not_none(account_cls, "account_cls")
+ *         Condition.not_in(issuer, _ISSUER_ACCOUNT_TYPE, "issuer", "_ISSUER_ACCOUNT_TYPE")
+ */
+  __pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition->not_none(__pyx_v_issuer, __pyx_n_u_issuer, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 51, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":52
+ *         """
+ *         Condition.not_none(issuer, "issuer")
+ *         Condition.not_none(account_cls, "account_cls")             # <<<<<<<<<<<<<<
+ *         Condition.not_in(issuer, _ISSUER_ACCOUNT_TYPE, "issuer", "_ISSUER_ACCOUNT_TYPE")
+ * 
+ */
+  __pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition->not_none(((PyObject *)__pyx_v_account_cls), __pyx_n_u_account_cls, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 52, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":53
+ *         Condition.not_none(issuer, "issuer")
+ *         Condition.not_none(account_cls, "account_cls")
+ *         Condition.not_in(issuer, _ISSUER_ACCOUNT_TYPE, "issuer", "_ISSUER_ACCOUNT_TYPE")             # <<<<<<<<<<<<<<
+ * 
+ *         _ISSUER_ACCOUNT_TYPE[issuer] = account_cls
+ */
+  __pyx_t_1 = __pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition->not_in(__pyx_v_issuer, __pyx_t_1, __pyx_n_u_issuer, __pyx_n_u_ISSUER_ACCOUNT_TYPE, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 53, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "nautilus_trader/accounting/factory.pyx":55
+ *         Condition.not_in(issuer, _ISSUER_ACCOUNT_TYPE, "issuer", "_ISSUER_ACCOUNT_TYPE")
+ * 
+ *         _ISSUER_ACCOUNT_TYPE[issuer] = account_cls             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+  if (unlikely(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 55, __pyx_L1_error)
+  }
+  if (unlikely((PyDict_SetItem(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE, __pyx_v_issuer, ((PyObject *)__pyx_v_account_cls)) < 0))) __PYX_ERR(0, 55, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":33
+ *     """
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_account_type(str issuer, type account_cls):
+ *         """
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.register_account_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nautilus_trader/accounting/factory.pyx":57
+ *         _ISSUER_ACCOUNT_TYPE[issuer] = account_cls
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_calculated_account(str issuer):
+ *         """
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_3register_calculated_account(CYTHON_UNUSED PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_2register_calculated_account, "AccountFactory.register_calculated_account(unicode issuer)\n\n        Register for account state of the given issuer to be calculated from\n        order fills.\n\n        Parameters\n        ----------\n        issuer : str\n            The issuer for the account.\n\n        Raises\n        ------\n        KeyError\n            If an issuer has already been registered for the `issuer`.\n\n        ");
+static PyMethodDef __pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_3register_calculated_account = {"register_calculated_account", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_3register_calculated_account, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_2register_calculated_account};
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_3register_calculated_account(CYTHON_UNUSED PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_issuer = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED const Py_ssize_t __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("register_calculated_account (wrapper)", 0);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_issuer,0};
+    PyObject* values[1] = {0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_issuer)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "register_calculated_account") < 0)) __PYX_ERR(0, 57, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_issuer = ((PyObject*)values[0]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("register_calculated_account", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 57, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.register_calculated_account", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_issuer), (&PyUnicode_Type), 1, "issuer", 1))) __PYX_ERR(0, 58, __pyx_L1_error)
+  __pyx_r = __pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_2register_calculated_account(__pyx_v_issuer);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_2register_calculated_account(PyObject *__pyx_v_issuer) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("register_calculated_account", 0);
+
+  /* "nautilus_trader/accounting/factory.pyx":74
+ * 
+ *         """
+ *         Condition.not_none(issuer, "issuer")             # <<<<<<<<<<<<<<
+ *         Condition.not_in(issuer, _ISSUER_ACCOUNT_TYPE, "issuer", "_ISSUER_ACCOUNT_TYPE")
+ * 
+ */
+  __pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition->not_none(__pyx_v_issuer, __pyx_n_u_issuer, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 74, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":75
+ *         """
+ *         Condition.not_none(issuer, "issuer")
+ *         Condition.not_in(issuer, _ISSUER_ACCOUNT_TYPE, "issuer", "_ISSUER_ACCOUNT_TYPE")             # <<<<<<<<<<<<<<
+ * 
+ *         _ISSUER_ACCOUNT_CALCULATED[issuer] = True
+ */
+  __pyx_t_1 = __pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition->not_in(__pyx_v_issuer, __pyx_t_1, __pyx_n_u_issuer, __pyx_n_u_ISSUER_ACCOUNT_TYPE, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "nautilus_trader/accounting/factory.pyx":77
+ *         Condition.not_in(issuer, _ISSUER_ACCOUNT_TYPE, "issuer", "_ISSUER_ACCOUNT_TYPE")
+ * 
+ *         _ISSUER_ACCOUNT_CALCULATED[issuer] = True             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+  if (unlikely(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 77, __pyx_L1_error)
+  }
+  if (unlikely((PyDict_SetItem(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED, __pyx_v_issuer, Py_True) < 0))) __PYX_ERR(0, 77, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":57
+ *         _ISSUER_ACCOUNT_TYPE[issuer] = account_cls
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_calculated_account(str issuer):
+ *         """
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.register_calculated_account", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nautilus_trader/accounting/factory.pyx":80
+ * 
+ *     @staticmethod
+ *     cdef Account create_c(AccountState event):             # <<<<<<<<<<<<<<
+ *         Condition.not_none(event, "event")
+ * 
+ */
+
+static struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_f_15nautilus_trader_10accounting_7factory_14AccountFactory_create_c(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *__pyx_v_event) {
+  PyObject *__pyx_v_issuer = 0;
+  PyTypeObject *__pyx_v_account_cls = 0;
+  int __pyx_v_calculated;
+  struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("create_c", 0);
+
+  /* "nautilus_trader/accounting/factory.pyx":81
+ *     @staticmethod
+ *     cdef Account create_c(AccountState event):
+ *         Condition.not_none(event, "event")             # <<<<<<<<<<<<<<
+ * 
+ *         # Parse account issuer
+ */
+  __pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition->not_none(((PyObject *)__pyx_v_event), __pyx_n_u_event, NULL); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 81, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":84
+ * 
+ *         # Parse account issuer
+ *         cdef str issuer = event.account_id.get_issuer()             # <<<<<<<<<<<<<<
+ * 
+ *         # Determine account settings
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_AccountId *)__pyx_v_event->account_id->__pyx_base.__pyx_vtab)->get_issuer(__pyx_v_event->account_id, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_issuer = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "nautilus_trader/accounting/factory.pyx":87
+ * 
+ *         # Determine account settings
+ *         cdef type account_cls = _ISSUER_ACCOUNT_TYPE.get(issuer)             # <<<<<<<<<<<<<<
+ *         cdef bint calculated = _ISSUER_ACCOUNT_CALCULATED.get(issuer, False)
+ * 
+ */
+  if (unlikely(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 87, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE, __pyx_v_issuer, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyType_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("type", __pyx_t_1))) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_v_account_cls = ((PyTypeObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "nautilus_trader/accounting/factory.pyx":88
+ *         # Determine account settings
+ *         cdef type account_cls = _ISSUER_ACCOUNT_TYPE.get(issuer)
+ *         cdef bint calculated = _ISSUER_ACCOUNT_CALCULATED.get(issuer, False)             # <<<<<<<<<<<<<<
+ * 
+ *         # Create account
+ */
+  if (unlikely(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 88, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED, __pyx_v_issuer, Py_False); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_calculated = __pyx_t_2;
+
+  /* "nautilus_trader/accounting/factory.pyx":91
+ * 
+ *         # Create account
+ *         if account_cls is not None:             # <<<<<<<<<<<<<<
+ *             return account_cls(event, calculated)
+ *         if event.account_type == AccountType.CASH:
+ */
+  __pyx_t_2 = (__pyx_v_account_cls != ((PyTypeObject*)Py_None));
+  if (__pyx_t_2) {
+
+    /* "nautilus_trader/accounting/factory.pyx":92
+ *         # Create account
+ *         if account_cls is not None:
+ *             return account_cls(event, calculated)             # <<<<<<<<<<<<<<
+ *         if event.account_type == AccountType.CASH:
+ *             return CashAccount(event, calculated)
+ */
+    __Pyx_XDECREF((PyObject *)__pyx_r);
+    __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_calculated); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF((PyObject *)__pyx_v_event);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_event);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_event));
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_v_account_cls), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account))))) __PYX_ERR(0, 92, __pyx_L1_error)
+    __pyx_r = ((struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *)__pyx_t_1);
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "nautilus_trader/accounting/factory.pyx":91
+ * 
+ *         # Create account
+ *         if account_cls is not None:             # <<<<<<<<<<<<<<
+ *             return account_cls(event, calculated)
+ *         if event.account_type == AccountType.CASH:
+ */
+  }
+
+  /* "nautilus_trader/accounting/factory.pyx":93
+ *         if account_cls is not None:
+ *             return account_cls(event, calculated)
+ *         if event.account_type == AccountType.CASH:             # <<<<<<<<<<<<<<
+ *             return CashAccount(event, calculated)
+ *         elif event.account_type == AccountType.MARGIN:
+ */
+  switch (__pyx_v_event->account_type) {
+    case __pyx_e_15nautilus_trader_5model_7c_enums_12account_type_CASH:
+
+    /* "nautilus_trader/accounting/factory.pyx":94
+ *             return account_cls(event, calculated)
+ *         if event.account_type == AccountType.CASH:
+ *             return CashAccount(event, calculated)             # <<<<<<<<<<<<<<
+ *         elif event.account_type == AccountType.MARGIN:
+ *             return MarginAccount(event, calculated)
+ */
+    __Pyx_XDECREF((PyObject *)__pyx_r);
+    __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_calculated); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF((PyObject *)__pyx_v_event);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_event);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_event));
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = ((struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *)__pyx_t_1);
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "nautilus_trader/accounting/factory.pyx":93
+ *         if account_cls is not None:
+ *             return account_cls(event, calculated)
+ *         if event.account_type == AccountType.CASH:             # <<<<<<<<<<<<<<
+ *             return CashAccount(event, calculated)
+ *         elif event.account_type == AccountType.MARGIN:
+ */
+    break;
+    case __pyx_e_15nautilus_trader_5model_7c_enums_12account_type_MARGIN:
+
+    /* "nautilus_trader/accounting/factory.pyx":96
+ *             return CashAccount(event, calculated)
+ *         elif event.account_type == AccountType.MARGIN:
+ *             return MarginAccount(event, calculated)             # <<<<<<<<<<<<<<
+ *         elif event.account_type == AccountType.BETTING:
+ *             return BettingAccount(event, calculated)
+ */
+    __Pyx_XDECREF((PyObject *)__pyx_r);
+    __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_calculated); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF((PyObject *)__pyx_v_event);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_event);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_event));
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = ((struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *)__pyx_t_1);
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "nautilus_trader/accounting/factory.pyx":95
+ *         if event.account_type == AccountType.CASH:
+ *             return CashAccount(event, calculated)
+ *         elif event.account_type == AccountType.MARGIN:             # <<<<<<<<<<<<<<
+ *             return MarginAccount(event, calculated)
+ *         elif event.account_type == AccountType.BETTING:
+ */
+    break;
+    case __pyx_e_15nautilus_trader_5model_7c_enums_12account_type_BETTING:
+
+    /* "nautilus_trader/accounting/factory.pyx":98
+ *             return MarginAccount(event, calculated)
+ *         elif event.account_type == AccountType.BETTING:
+ *             return BettingAccount(event, calculated)             # <<<<<<<<<<<<<<
+ *         else:  # pragma: no cover (design-time error)
+ *             raise RuntimeError("invalid account type")
+ */
+    __Pyx_XDECREF((PyObject *)__pyx_r);
+    __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_calculated); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 98, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF((PyObject *)__pyx_v_event);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_event);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_event));
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = ((struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *)__pyx_t_1);
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "nautilus_trader/accounting/factory.pyx":97
+ *         elif event.account_type == AccountType.MARGIN:
+ *             return MarginAccount(event, calculated)
+ *         elif event.account_type == AccountType.BETTING:             # <<<<<<<<<<<<<<
+ *             return BettingAccount(event, calculated)
+ *         else:  # pragma: no cover (design-time error)
+ */
+    break;
+    default:
+
+    /* "nautilus_trader/accounting/factory.pyx":100
+ *             return BettingAccount(event, calculated)
+ *         else:  # pragma: no cover (design-time error)
+ *             raise RuntimeError("invalid account type")             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 100, __pyx_L1_error)
+    break;
+  }
+
+  /* "nautilus_trader/accounting/factory.pyx":80
+ * 
+ *     @staticmethod
+ *     cdef Account create_c(AccountState event):             # <<<<<<<<<<<<<<
+ *         Condition.not_none(event, "event")
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.create_c", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_issuer);
+  __Pyx_XDECREF((PyObject *)__pyx_v_account_cls);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nautilus_trader/accounting/factory.pyx":102
+ *             raise RuntimeError("invalid account type")
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def create(AccountState event) -> Account:
+ *         """
+ */
+
+/* Python wrapper */
+static struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_5create(CYTHON_UNUSED PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_4create, "AccountFactory.create(AccountState event) -> Account\n\n        Create an account based on the events account type.\n\n        Parameters\n        ----------\n        event : AccountState\n            The account state event for the creation.\n\n        Returns\n        -------\n        Account\n\n        ");
+static PyMethodDef __pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_5create = {"create", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_5create, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_4create};
+static struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_5create(CYTHON_UNUSED PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *__pyx_v_event = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED const Py_ssize_t __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("create (wrapper)", 0);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_event,0};
+    PyObject* values[1] = {0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_event)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "create") < 0)) __PYX_ERR(0, 102, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_event = ((struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *)values[0]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("create", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 102, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.create", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_event), __pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState, 1, "event", 0))) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_r = __pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_4create(__pyx_v_event);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_4create(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *__pyx_v_event) {
+  struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("create", 0);
+
+  /* "nautilus_trader/accounting/factory.pyx":117
+ * 
+ *         """
+ *         return AccountFactory.create_c(event)             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF((PyObject *)__pyx_r);
+  __pyx_t_1 = ((PyObject *)__pyx_f_15nautilus_trader_10accounting_7factory_14AccountFactory_create_c(__pyx_v_event)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = ((struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nautilus_trader/accounting/factory.pyx":102
+ *             raise RuntimeError("invalid account type")
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def create(AccountState event) -> Account:
+ *         """
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.create", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_7__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_6__reduce_cython__, "AccountFactory.__reduce_cython__(self)");
+static PyMethodDef __pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_7__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_7__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_6__reduce_cython__};
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_7__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED const Py_ssize_t __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
+  __pyx_r = __pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_6__reduce_cython__(((struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_6__reduce_cython__(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = ()             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __Pyx_INCREF(__pyx_empty_tuple);
+  __pyx_v_state = __pyx_empty_tuple;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = ()
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_1 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v__dict = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":7
+ *     state = ()
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_2 = (__pyx_v__dict != Py_None);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v__dict);
+    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = False
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = ()
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = False             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, None), state
+ */
+  /*else*/ {
+    __pyx_v_use_setstate = 0;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, None), state
+ *     else:
+ */
+  if (__pyx_v_use_setstate) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = False
+ *     if use_setstate:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_pyx_unpickle_AccountFactory); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_238750788);
+    __Pyx_GIVEREF(__pyx_int_238750788);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_238750788);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, Py_None);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_state);
+    __pyx_t_3 = 0;
+    __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, None), state
+ *     else:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_AccountFactory__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_pyx_unpickle_AccountFactory); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_238750788);
+    __Pyx_GIVEREF(__pyx_int_238750788);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_238750788);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+    __pyx_t_4 = 0;
+    __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_AccountFactory__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_9__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_8__setstate_cython__, "AccountFactory.__setstate_cython__(self, __pyx_state)");
+static PyMethodDef __pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_9__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_9__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_8__setstate_cython__};
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_9__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED const Py_ssize_t __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_state,0};
+    PyObject* values[1] = {0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 16, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__setstate_cython__") < 0)) __PYX_ERR(1, 16, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 16, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_8__setstate_cython__(((struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory_14AccountFactory_8__setstate_cython__(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_AccountFactory__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_v___pyx_state))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_AccountFactory__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.AccountFactory.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_AccountFactory(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_1__pyx_unpickle_AccountFactory(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory, "__pyx_unpickle_AccountFactory(__pyx_type, long __pyx_checksum, __pyx_state)");
+static PyMethodDef __pyx_mdef_15nautilus_trader_10accounting_7factory_1__pyx_unpickle_AccountFactory = {"__pyx_unpickle_AccountFactory", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_1__pyx_unpickle_AccountFactory, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory};
+static PyObject *__pyx_pw_15nautilus_trader_10accounting_7factory_1__pyx_unpickle_AccountFactory(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED const Py_ssize_t __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_AccountFactory (wrapper)", 0);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_AccountFactory", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_AccountFactory", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__pyx_unpickle_AccountFactory") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_AccountFactory", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.__pyx_unpickle_AccountFactory", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_AccountFactory", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xe3b0c44, 0xda39a3e, 0xd41d8cd):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__2, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xe3b0c44, 0xda39a3e, 0xd41d8cd):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum
+ *     __pyx_result = AccountFactory.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_3 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xe3b0c44, 0xda39a3e, 0xd41d8cd):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum             # <<<<<<<<<<<<<<
+ *     __pyx_result = AccountFactory.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_3 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_v___pyx_PickleError, __pyx_t_1, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xe3b0c44, 0xda39a3e, 0xd41d8cd):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum
+ *     __pyx_result = AccountFactory.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_AccountFactory__set_state(<AccountFactory> __pyx_result, __pyx_state)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory), __pyx_n_s_new); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v___pyx_type};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_v___pyx_result = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum
+ *     __pyx_result = AccountFactory.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_AccountFactory__set_state(<AccountFactory> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_2 = (__pyx_v___pyx_state != Py_None);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = AccountFactory.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_AccountFactory__set_state(<AccountFactory> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_AccountFactory__set_state(AccountFactory __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_v___pyx_state))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory__set_state(((struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum
+ *     __pyx_result = AccountFactory.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_AccountFactory__set_state(<AccountFactory> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_AccountFactory__set_state(<AccountFactory> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_AccountFactory__set_state(AccountFactory __pyx_result, tuple __pyx_state):
+ *     if len(__pyx_state) > 0 and hasattr(__pyx_result, '__dict__'):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_AccountFactory(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.__pyx_unpickle_AccountFactory", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_AccountFactory__set_state(<AccountFactory> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_AccountFactory__set_state(AccountFactory __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 0 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[0])
+ */
+
+static PyObject *__pyx_f_15nautilus_trader_10accounting_7factory___pyx_unpickle_AccountFactory__set_state(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_AccountFactory__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_AccountFactory__set_state(AccountFactory __pyx_result, tuple __pyx_state):
+ *     if len(__pyx_state) > 0 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[0])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 > 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_AccountFactory__set_state(AccountFactory __pyx_result, tuple __pyx_state):
+ *     if len(__pyx_state) > 0 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[0])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_update); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 13, __pyx_L1_error)
+    }
+    __pyx_t_5 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_7 = NULL;
+    __pyx_t_8 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+        __pyx_t_8 = 1;
+      }
+    }
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_AccountFactory__set_state(AccountFactory __pyx_result, tuple __pyx_state):
+ *     if len(__pyx_state) > 0 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[0])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_AccountFactory__set_state(<AccountFactory> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_AccountFactory__set_state(AccountFactory __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 0 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[0])
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("nautilus_trader.accounting.factory.__pyx_unpickle_AccountFactory__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nautilus_trader/core/correctness.pxd":16
+ * # -------------------------------------------------------------------------------------------------
+ * 
+ * cdef inline Exception make_exception(ex_default, ex_type, str msg):             # <<<<<<<<<<<<<<
+ *     if type(ex_type) == type(Exception):
+ *         return ex_type(msg)
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_15nautilus_trader_4core_11correctness_make_exception(PyObject *__pyx_v_ex_default, PyObject *__pyx_v_ex_type, PyObject *__pyx_v_msg) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("make_exception", 0);
+
+  /* "nautilus_trader/core/correctness.pxd":17
+ * 
+ * cdef inline Exception make_exception(ex_default, ex_type, str msg):
+ *     if type(ex_type) == type(Exception):             # <<<<<<<<<<<<<<
+ *         return ex_type(msg)
+ *     else:
+ */
+  __pyx_t_1 = PyObject_RichCompare(((PyObject *)Py_TYPE(__pyx_v_ex_type)), ((PyObject *)Py_TYPE(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])))), Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 17, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(2, 17, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "nautilus_trader/core/correctness.pxd":18
+ * cdef inline Exception make_exception(ex_default, ex_type, str msg):
+ *     if type(ex_type) == type(Exception):
+ *         return ex_type(msg)             # <<<<<<<<<<<<<<
+ *     else:
+ *         return ex_default(msg)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_ex_type);
+    __pyx_t_3 = __pyx_v_ex_type; __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_msg};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 18, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    if (!(likely(__Pyx_PyException_Check(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("Exception", __pyx_t_1))) __PYX_ERR(2, 18, __pyx_L1_error)
+    __pyx_r = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "nautilus_trader/core/correctness.pxd":17
+ * 
+ * cdef inline Exception make_exception(ex_default, ex_type, str msg):
+ *     if type(ex_type) == type(Exception):             # <<<<<<<<<<<<<<
+ *         return ex_type(msg)
+ *     else:
+ */
+  }
+
+  /* "nautilus_trader/core/correctness.pxd":20
+ *         return ex_type(msg)
+ *     else:
+ *         return ex_default(msg)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_ex_default);
+    __pyx_t_3 = __pyx_v_ex_default; __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_msg};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 20, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    if (!(likely(__Pyx_PyException_Check(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("Exception", __pyx_t_1))) __PYX_ERR(2, 20, __pyx_L1_error)
+    __pyx_r = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "nautilus_trader/core/correctness.pxd":16
+ * # -------------------------------------------------------------------------------------------------
+ * 
+ * cdef inline Exception make_exception(ex_default, ex_type, str msg):             # <<<<<<<<<<<<<<
+ *     if type(ex_type) == type(Exception):
+ *         return ex_type(msg)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("nautilus_trader.core.correctness.make_exception", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_15nautilus_trader_10accounting_7factory_AccountFactory __pyx_vtable_15nautilus_trader_10accounting_7factory_AccountFactory;
+
+static PyObject *__pyx_tp_new_15nautilus_trader_10accounting_7factory_AccountFactory(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *p;
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  if (likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  #endif
+  p = ((struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory *)o);
+  p->__pyx_vtab = __pyx_vtabptr_15nautilus_trader_10accounting_7factory_AccountFactory;
+  return o;
+}
+
+static void __pyx_tp_dealloc_15nautilus_trader_10accounting_7factory_AccountFactory(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_15nautilus_trader_10accounting_7factory_AccountFactory) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyMethodDef __pyx_methods_15nautilus_trader_10accounting_7factory_AccountFactory[] = {
+  {"register_account_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_1register_account_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_register_account_type},
+  {"register_calculated_account", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_3register_calculated_account, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_2register_calculated_account},
+  {"create", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_5create, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_4create},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_7__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_6__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15nautilus_trader_10accounting_7factory_14AccountFactory_9__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15nautilus_trader_10accounting_7factory_14AccountFactory_8__setstate_cython__},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_15nautilus_trader_10accounting_7factory_AccountFactory},
+  {Py_tp_doc, (void *)PyDoc_STR("\n    Provides a factory for creating different account types.\n    ")},
+  {Py_tp_methods, (void *)__pyx_methods_15nautilus_trader_10accounting_7factory_AccountFactory},
+  {Py_tp_new, (void *)__pyx_tp_new_15nautilus_trader_10accounting_7factory_AccountFactory},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory_spec = {
+  "nautilus_trader.accounting.factory.AccountFactory",
+  sizeof(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE,
+  __pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "nautilus_trader.accounting.factory.""AccountFactory", /*tp_name*/
+  sizeof(struct __pyx_obj_15nautilus_trader_10accounting_7factory_AccountFactory), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_15nautilus_trader_10accounting_7factory_AccountFactory, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  PyDoc_STR("\n    Provides a factory for creating different account types.\n    "), /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_15nautilus_trader_10accounting_7factory_AccountFactory, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_15nautilus_trader_10accounting_7factory_AccountFactory, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+/* #### Code section: pystring_table ### */
+
+static int __Pyx_CreateStringTabAndInitStrings(void) {
+  __Pyx_StringTabEntry __pyx_string_tab[] = {
+    {&__pyx_n_s_Account, __pyx_k_Account, sizeof(__pyx_k_Account), 0, 0, 1, 1},
+    {&__pyx_n_s_AccountFactory, __pyx_k_AccountFactory, sizeof(__pyx_k_AccountFactory), 0, 0, 1, 1},
+    {&__pyx_n_s_AccountFactory___reduce_cython, __pyx_k_AccountFactory___reduce_cython, sizeof(__pyx_k_AccountFactory___reduce_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_AccountFactory___setstate_cython, __pyx_k_AccountFactory___setstate_cython, sizeof(__pyx_k_AccountFactory___setstate_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_AccountFactory_create, __pyx_k_AccountFactory_create, sizeof(__pyx_k_AccountFactory_create), 0, 0, 1, 1},
+    {&__pyx_n_s_AccountFactory_register_account, __pyx_k_AccountFactory_register_account, sizeof(__pyx_k_AccountFactory_register_account), 0, 0, 1, 1},
+    {&__pyx_n_s_AccountFactory_register_calculat, __pyx_k_AccountFactory_register_calculat, sizeof(__pyx_k_AccountFactory_register_calculat), 0, 0, 1, 1},
+    {&__pyx_n_u_ISSUER_ACCOUNT_TYPE, __pyx_k_ISSUER_ACCOUNT_TYPE, sizeof(__pyx_k_ISSUER_ACCOUNT_TYPE), 0, 1, 0, 1},
+    {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+    {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+    {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
+    {&__pyx_n_s__16, __pyx_k__16, sizeof(__pyx_k__16), 0, 0, 1, 1},
+    {&__pyx_kp_u__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0, 0},
+    {&__pyx_n_s_account_cls, __pyx_k_account_cls, sizeof(__pyx_k_account_cls), 0, 0, 1, 1},
+    {&__pyx_n_u_account_cls, __pyx_k_account_cls, sizeof(__pyx_k_account_cls), 0, 1, 0, 1},
+    {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
+    {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+    {&__pyx_n_s_create, __pyx_k_create, sizeof(__pyx_k_create), 0, 0, 1, 1},
+    {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+    {&__pyx_n_s_dict_2, __pyx_k_dict_2, sizeof(__pyx_k_dict_2), 0, 0, 1, 1},
+    {&__pyx_kp_u_disable, __pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0, 0},
+    {&__pyx_kp_u_enable, __pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0, 0},
+    {&__pyx_n_s_event, __pyx_k_event, sizeof(__pyx_k_event), 0, 0, 1, 1},
+    {&__pyx_n_u_event, __pyx_k_event, sizeof(__pyx_k_event), 0, 1, 0, 1},
+    {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
+    {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
+    {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+    {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+    {&__pyx_kp_u_invalid_account_type, __pyx_k_invalid_account_type, sizeof(__pyx_k_invalid_account_type), 0, 1, 0, 0},
+    {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
+    {&__pyx_kp_u_isenabled, __pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0, 0},
+    {&__pyx_n_s_issuer, __pyx_k_issuer, sizeof(__pyx_k_issuer), 0, 0, 1, 1},
+    {&__pyx_n_u_issuer, __pyx_k_issuer, sizeof(__pyx_k_issuer), 0, 1, 0, 1},
+    {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+    {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+    {&__pyx_kp_s_nautilus_trader_accounting_facto, __pyx_k_nautilus_trader_accounting_facto, sizeof(__pyx_k_nautilus_trader_accounting_facto), 0, 0, 1, 0},
+    {&__pyx_n_s_nautilus_trader_accounting_facto_2, __pyx_k_nautilus_trader_accounting_facto_2, sizeof(__pyx_k_nautilus_trader_accounting_facto_2), 0, 0, 1, 1},
+    {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+    {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_unpickle_AccountFactory, __pyx_k_pyx_unpickle_AccountFactory, sizeof(__pyx_k_pyx_unpickle_AccountFactory), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+    {&__pyx_n_s_register_account_type, __pyx_k_register_account_type, sizeof(__pyx_k_register_account_type), 0, 0, 1, 1},
+    {&__pyx_n_s_register_calculated_account, __pyx_k_register_calculated_account, sizeof(__pyx_k_register_calculated_account), 0, 0, 1, 1},
+    {&__pyx_n_s_return, __pyx_k_return, sizeof(__pyx_k_return), 0, 0, 1, 1},
+    {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+    {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+    {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_state, __pyx_k_state, sizeof(__pyx_k_state), 0, 0, 1, 1},
+    {&__pyx_n_s_staticmethod, __pyx_k_staticmethod, sizeof(__pyx_k_staticmethod), 0, 0, 1, 1},
+    {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+    {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+    {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+    {&__pyx_n_s_use_setstate, __pyx_k_use_setstate, sizeof(__pyx_k_use_setstate), 0, 0, 1, 1},
+    {0, 0, 0, 0, 0, 0, 0}
+  };
+  return __Pyx_InitStrings(__pyx_string_tab);
+}
+/* #### Code section: cached_builtins ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_staticmethod = __Pyx_GetBuiltinName(__pyx_n_s_staticmethod); if (!__pyx_builtin_staticmethod) __PYX_ERR(0, 33, __pyx_L1_error)
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(0, 100, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cached_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "nautilus_trader/accounting/factory.pyx":100
+ *             return BettingAccount(event, calculated)
+ *         else:  # pragma: no cover (design-time error)
+ *             raise RuntimeError("invalid account type")             # <<<<<<<<<<<<<<
+ * 
+ *     @staticmethod
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_invalid_account_type); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xe3b0c44, 0xda39a3e, 0xd41d8cd):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xe3b0c44, 0xda39a3e, 0xd41d8cd) = ())" % __pyx_checksum
+ */
+  __pyx_tuple__2 = PyTuple_Pack(3, __pyx_int_238750788, __pyx_int_228825662, __pyx_int_222419149); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "nautilus_trader/accounting/factory.pyx":33
+ *     """
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_account_type(str issuer, type account_cls):
+ *         """
+ */
+  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_n_s_issuer, __pyx_n_s_account_cls); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nautilus_trader_accounting_facto, __pyx_n_s_register_account_type, 33, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(0, 33, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":57
+ *         _ISSUER_ACCOUNT_TYPE[issuer] = account_cls
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_calculated_account(str issuer):
+ *         """
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_s_issuer); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nautilus_trader_accounting_facto, __pyx_n_s_register_calculated_account, 57, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 57, __pyx_L1_error)
+
+  /* "nautilus_trader/accounting/factory.pyx":102
+ *             raise RuntimeError("invalid account type")
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def create(AccountState event) -> Account:
+ *         """
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_n_s_event); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_nautilus_trader_accounting_facto, __pyx_n_s_create, 102, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 102, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+  __pyx_tuple__10 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_state, __pyx_n_s_dict_2, __pyx_n_s_use_setstate); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(1, 1, __pyx_L1_error)
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_AccountFactory__set_state(self, __pyx_state)
+ */
+  __pyx_tuple__12 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(1, 16, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_AccountFactory(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__14 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_AccountFactory, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+/* #### Code section: init_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
+  __pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  __pyx_umethod_PyDict_Type_get.method_name = &__pyx_n_s_get;
+  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_int_222419149 = PyInt_FromLong(222419149L); if (unlikely(!__pyx_int_222419149)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_228825662 = PyInt_FromLong(228825662L); if (unlikely(!__pyx_int_228825662)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_238750788 = PyInt_FromLong(238750788L); if (unlikely(!__pyx_int_238750788)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_globals ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  return 0;
+}
+/* #### Code section: init_module ### */
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_15nautilus_trader_10accounting_7factory_AccountFactory = &__pyx_vtable_15nautilus_trader_10accounting_7factory_AccountFactory;
+  __pyx_vtable_15nautilus_trader_10accounting_7factory_AccountFactory.create_c = (struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account *(*)(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState *))__pyx_f_15nautilus_trader_10accounting_7factory_14AccountFactory_create_c;
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory_spec, NULL); if (unlikely(!__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory)) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory_spec, __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  #else
+  __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory = &__pyx_type_15nautilus_trader_10accounting_7factory_AccountFactory;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dictoffset && __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory, __pyx_vtabptr_15nautilus_trader_10accounting_7factory_AccountFactory) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_MergeVtables(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_AccountFactory, (PyObject *) __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  #endif
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.account_type"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.account_type", "AccountTypeParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser) __PYX_ERR(3, 23, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_12account_type_AccountTypeParser)) __PYX_ERR(3, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.liquidity_side"); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.liquidity_side", "LiquiditySideParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser) __PYX_ERR(4, 23, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_14liquidity_side_LiquiditySideParser)) __PYX_ERR(4, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT(PyTypeObject),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(5, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.currency"); if (unlikely(!__pyx_t_1)) __PYX_ERR(6, 21, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_8currency_Currency = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.currency", "Currency", sizeof(struct __pyx_obj_15nautilus_trader_5model_8currency_Currency), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_8currency_Currency),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_8currency_Currency) __PYX_ERR(6, 21, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_8currency_Currency = (struct __pyx_vtabstruct_15nautilus_trader_5model_8currency_Currency*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_8currency_Currency); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_8currency_Currency)) __PYX_ERR(6, 21, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.core.uuid"); if (unlikely(!__pyx_t_1)) __PYX_ERR(7, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_4core_4uuid_UUID4 = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.uuid", "UUID4", sizeof(struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_4uuid_UUID4),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_4uuid_UUID4) __PYX_ERR(7, 19, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_4core_4uuid_UUID4 = (struct __pyx_vtabstruct_15nautilus_trader_4core_4uuid_UUID4*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_4core_4uuid_UUID4); if (unlikely(!__pyx_vtabptr_15nautilus_trader_4core_4uuid_UUID4)) __PYX_ERR(7, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.core.message"); if (unlikely(!__pyx_t_1)) __PYX_ERR(8, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.message", "MessageCategoryParser", sizeof(struct __pyx_obj_15nautilus_trader_4core_7message_MessageCategoryParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_7message_MessageCategoryParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser) __PYX_ERR(8, 29, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_4core_7message_MessageCategoryParser = (struct __pyx_vtabstruct_15nautilus_trader_4core_7message_MessageCategoryParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_4core_7message_MessageCategoryParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_4core_7message_MessageCategoryParser)) __PYX_ERR(8, 29, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_4core_7message_Message = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.message", "Message", sizeof(struct __pyx_obj_15nautilus_trader_4core_7message_Message), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_7message_Message),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_7message_Message) __PYX_ERR(8, 38, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_4core_7message_Command = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.message", "Command", sizeof(struct __pyx_obj_15nautilus_trader_4core_7message_Command), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_7message_Command),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_7message_Command) __PYX_ERR(8, 47, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_4core_7message_Document = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.message", "Document", sizeof(struct __pyx_obj_15nautilus_trader_4core_7message_Document), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_7message_Document),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_7message_Document) __PYX_ERR(8, 51, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_4core_7message_Event = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.message", "Event", sizeof(struct __pyx_obj_15nautilus_trader_4core_7message_Event), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_7message_Event),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_7message_Event) __PYX_ERR(8, 55, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_4core_7message_Request = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.message", "Request", sizeof(struct __pyx_obj_15nautilus_trader_4core_7message_Request), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_7message_Request),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_7message_Request) __PYX_ERR(8, 60, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_4core_7message_Response = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.message", "Response", sizeof(struct __pyx_obj_15nautilus_trader_4core_7message_Response), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_7message_Response),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_7message_Response) __PYX_ERR(8, 65, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.identifiers"); if (unlikely(!__pyx_t_1)) __PYX_ERR(9, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "Identifier", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_Identifier),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier) __PYX_ERR(9, 28, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_Identifier = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Identifier*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_Identifier); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_Identifier)) __PYX_ERR(9, 28, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "Symbol", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_Symbol), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_Symbol),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol) __PYX_ERR(9, 32, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_Symbol = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Symbol*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_Symbol); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_Symbol)) __PYX_ERR(9, 32, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_Venue = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "Venue", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_Venue), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_Venue),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_Venue) __PYX_ERR(9, 36, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_Venue = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_Venue*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_Venue); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_Venue)) __PYX_ERR(9, 36, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "InstrumentId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_InstrumentId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId) __PYX_ERR(9, 40, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_InstrumentId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_InstrumentId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_InstrumentId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_InstrumentId)) __PYX_ERR(9, 40, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "ComponentId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_ComponentId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_ComponentId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId) __PYX_ERR(9, 55, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_ComponentId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ComponentId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_ComponentId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_ComponentId)) __PYX_ERR(9, 55, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "ClientId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId) __PYX_ERR(9, 59, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_ClientId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ClientId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_ClientId)) __PYX_ERR(9, 59, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "TraderId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_TraderId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_TraderId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId) __PYX_ERR(9, 63, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_TraderId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_TraderId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_TraderId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_TraderId)) __PYX_ERR(9, 63, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "StrategyId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_StrategyId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId) __PYX_ERR(9, 67, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_StrategyId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_StrategyId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_StrategyId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_StrategyId)) __PYX_ERR(9, 67, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "AccountId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_AccountId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId) __PYX_ERR(9, 74, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_AccountId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_AccountId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_AccountId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_AccountId)) __PYX_ERR(9, 74, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "ClientOrderId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_ClientOrderId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId) __PYX_ERR(9, 80, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_ClientOrderId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_ClientOrderId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_ClientOrderId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_ClientOrderId)) __PYX_ERR(9, 80, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "VenueOrderId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_VenueOrderId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_VenueOrderId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId) __PYX_ERR(9, 84, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_VenueOrderId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_VenueOrderId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_VenueOrderId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_VenueOrderId)) __PYX_ERR(9, 84, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "OrderListId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_OrderListId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_OrderListId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId) __PYX_ERR(9, 88, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_OrderListId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_OrderListId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_OrderListId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_OrderListId)) __PYX_ERR(9, 88, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "PositionId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_PositionId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId) __PYX_ERR(9, 92, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_PositionId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_PositionId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_PositionId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_PositionId)) __PYX_ERR(9, 92, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.identifiers", "TradeId", sizeof(struct __pyx_obj_15nautilus_trader_5model_11identifiers_TradeId), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11identifiers_TradeId),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId) __PYX_ERR(9, 100, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11identifiers_TradeId = (struct __pyx_vtabstruct_15nautilus_trader_5model_11identifiers_TradeId*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11identifiers_TradeId); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11identifiers_TradeId)) __PYX_ERR(9, 100, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.events.account"); if (unlikely(!__pyx_t_1)) __PYX_ERR(10, 22, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.account", "AccountState", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_7account_AccountState),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState) __PYX_ERR(10, 22, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_7account_AccountState = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_7account_AccountState*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_7account_AccountState); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_7account_AccountState)) __PYX_ERR(10, 22, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.contingency_type"); if (unlikely(!__pyx_t_1)) __PYX_ERR(11, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.contingency_type", "ContingencyTypeParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser) __PYX_ERR(11, 27, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_16contingency_type_ContingencyTypeParser)) __PYX_ERR(11, 27, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.order_side"); if (unlikely(!__pyx_t_1)) __PYX_ERR(12, 22, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.order_side", "OrderSideParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser) __PYX_ERR(12, 22, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_10order_side_OrderSideParser)) __PYX_ERR(12, 22, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.order_type"); if (unlikely(!__pyx_t_1)) __PYX_ERR(13, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.order_type", "OrderTypeParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser) __PYX_ERR(13, 29, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_10order_type_OrderTypeParser)) __PYX_ERR(13, 29, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.time_in_force"); if (unlikely(!__pyx_t_1)) __PYX_ERR(14, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.time_in_force", "TimeInForceParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser) __PYX_ERR(14, 27, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_13time_in_force_TimeInForceParser)) __PYX_ERR(14, 27, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.objects"); if (unlikely(!__pyx_t_1)) __PYX_ERR(15, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7objects_Quantity = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.objects", "Quantity", sizeof(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7objects_Quantity),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7objects_Quantity) __PYX_ERR(15, 27, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7objects_Quantity = (struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Quantity*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7objects_Quantity); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7objects_Quantity)) __PYX_ERR(15, 27, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_7objects_Price = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.objects", "Price", sizeof(struct __pyx_obj_15nautilus_trader_5model_7objects_Price), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7objects_Price),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7objects_Price) __PYX_ERR(15, 73, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7objects_Price = (struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Price*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7objects_Price); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7objects_Price)) __PYX_ERR(15, 73, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_7objects_Money = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.objects", "Money", sizeof(struct __pyx_obj_15nautilus_trader_5model_7objects_Money), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7objects_Money),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7objects_Money) __PYX_ERR(15, 115, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7objects_Money = (struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_Money*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7objects_Money); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7objects_Money)) __PYX_ERR(15, 115, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.objects", "AccountBalance", sizeof(struct __pyx_obj_15nautilus_trader_5model_7objects_AccountBalance), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7objects_AccountBalance),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance) __PYX_ERR(15, 150, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7objects_AccountBalance = (struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_AccountBalance*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7objects_AccountBalance); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7objects_AccountBalance)) __PYX_ERR(15, 150, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.objects", "MarginBalance", sizeof(struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7objects_MarginBalance),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance) __PYX_ERR(15, 165, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7objects_MarginBalance = (struct __pyx_vtabstruct_15nautilus_trader_5model_7objects_MarginBalance*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7objects_MarginBalance); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7objects_MarginBalance)) __PYX_ERR(15, 165, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.events.order"); if (unlikely(!__pyx_t_1)) __PYX_ERR(16, 37, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderEvent = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderEvent", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderEvent),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderEvent) __PYX_ERR(16, 37, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderInitialized", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderInitialized), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderInitialized),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized) __PYX_ERR(16, 54, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderInitialized = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderInitialized*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderInitialized); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderInitialized)) __PYX_ERR(16, 54, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderDenied", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderDenied), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderDenied),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied) __PYX_ERR(16, 87, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderDenied = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderDenied*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderDenied); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderDenied)) __PYX_ERR(16, 87, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderSubmitted", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderSubmitted), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderSubmitted),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted) __PYX_ERR(16, 98, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderSubmitted = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderSubmitted*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderSubmitted); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderSubmitted)) __PYX_ERR(16, 98, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderAccepted", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderAccepted), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderAccepted),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted) __PYX_ERR(16, 107, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderAccepted = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderAccepted*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderAccepted); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderAccepted)) __PYX_ERR(16, 107, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderRejected", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderRejected), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderRejected),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected) __PYX_ERR(16, 116, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderRejected = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderRejected*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderRejected); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderRejected)) __PYX_ERR(16, 116, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderCanceled", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCanceled), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCanceled),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled) __PYX_ERR(16, 127, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderCanceled = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCanceled*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCanceled); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderCanceled)) __PYX_ERR(16, 127, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderExpired", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderExpired), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderExpired),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired) __PYX_ERR(16, 136, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderExpired = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderExpired*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderExpired); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderExpired)) __PYX_ERR(16, 136, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderTriggered", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderTriggered), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderTriggered),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered) __PYX_ERR(16, 145, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderTriggered = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderTriggered*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderTriggered); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderTriggered)) __PYX_ERR(16, 145, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderPendingUpdate", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingUpdate), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingUpdate),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate) __PYX_ERR(16, 154, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderPendingUpdate = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingUpdate*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingUpdate); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderPendingUpdate)) __PYX_ERR(16, 154, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderPendingCancel", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingCancel), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderPendingCancel),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel) __PYX_ERR(16, 163, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderPendingCancel = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderPendingCancel*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderPendingCancel); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderPendingCancel)) __PYX_ERR(16, 163, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderModifyRejected", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderModifyRejected), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderModifyRejected),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected) __PYX_ERR(16, 172, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderModifyRejected = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderModifyRejected*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderModifyRejected); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderModifyRejected)) __PYX_ERR(16, 172, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderCancelRejected", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCancelRejected), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderCancelRejected),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected) __PYX_ERR(16, 183, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderCancelRejected = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderCancelRejected*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderCancelRejected); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderCancelRejected)) __PYX_ERR(16, 183, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderUpdated", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderUpdated), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderUpdated),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated) __PYX_ERR(16, 194, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderUpdated = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderUpdated*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderUpdated); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderUpdated)) __PYX_ERR(16, 194, __pyx_L1_error)
+  __pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.events.order", "OrderFilled", sizeof(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_6events_5order_OrderFilled),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled) __PYX_ERR(16, 209, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderFilled = (struct __pyx_vtabstruct_15nautilus_trader_5model_6events_5order_OrderFilled*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_6events_5order_OrderFilled); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_6events_5order_OrderFilled)) __PYX_ERR(16, 209, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.core.data"); if (unlikely(!__pyx_t_1)) __PYX_ERR(17, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_4core_4data_Data = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.data", "Data", sizeof(struct __pyx_obj_15nautilus_trader_4core_4data_Data), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_4data_Data),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_4data_Data) __PYX_ERR(17, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.asset_class"); if (unlikely(!__pyx_t_1)) __PYX_ERR(18, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.asset_class", "AssetClassParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser) __PYX_ERR(18, 29, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_11asset_class_AssetClassParser)) __PYX_ERR(18, 29, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.asset_type"); if (unlikely(!__pyx_t_1)) __PYX_ERR(19, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.asset_type", "AssetTypeParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser) __PYX_ERR(19, 27, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_10asset_type_AssetTypeParser)) __PYX_ERR(19, 27, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.tick_scheme.base"); if (unlikely(!__pyx_t_1)) __PYX_ERR(20, 21, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.tick_scheme.base", "TickScheme", sizeof(struct __pyx_obj_15nautilus_trader_5model_11tick_scheme_4base_TickScheme), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11tick_scheme_4base_TickScheme),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme) __PYX_ERR(20, 21, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11tick_scheme_4base_TickScheme = (struct __pyx_vtabstruct_15nautilus_trader_5model_11tick_scheme_4base_TickScheme*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11tick_scheme_4base_TickScheme); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11tick_scheme_4base_TickScheme)) __PYX_ERR(20, 21, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.instruments.base"); if (unlikely(!__pyx_t_1)) __PYX_ERR(21, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.instruments.base", "Instrument", sizeof(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_11instruments_4base_Instrument),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument) __PYX_ERR(21, 28, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_11instruments_4base_Instrument = (struct __pyx_vtabstruct_15nautilus_trader_5model_11instruments_4base_Instrument*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_11instruments_4base_Instrument); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_11instruments_4base_Instrument)) __PYX_ERR(21, 28, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.c_enums.position_side"); if (unlikely(!__pyx_t_1)) __PYX_ERR(22, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.c_enums.position_side", "PositionSideParser", sizeof(struct __pyx_obj_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser) __PYX_ERR(22, 23, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser = (struct __pyx_vtabstruct_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_7c_enums_13position_side_PositionSideParser)) __PYX_ERR(22, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.position"); if (unlikely(!__pyx_t_1)) __PYX_ERR(23, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_5model_8position_Position = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.model.position", "Position", sizeof(struct __pyx_obj_15nautilus_trader_5model_8position_Position), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_5model_8position_Position),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_5model_8position_Position) __PYX_ERR(23, 35, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_5model_8position_Position = (struct __pyx_vtabstruct_15nautilus_trader_5model_8position_Position*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_5model_8position_Position); if (unlikely(!__pyx_vtabptr_15nautilus_trader_5model_8position_Position)) __PYX_ERR(23, 35, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.accounting.accounts.base"); if (unlikely(!__pyx_t_1)) __PYX_ERR(24, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.accounting.accounts.base", "Account", sizeof(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4base_Account),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account) __PYX_ERR(24, 30, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_10accounting_8accounts_4base_Account = (struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4base_Account*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_10accounting_8accounts_4base_Account); if (unlikely(!__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_4base_Account)) __PYX_ERR(24, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.accounting.accounts.cash"); if (unlikely(!__pyx_t_1)) __PYX_ERR(25, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.accounting.accounts.cash", "CashAccount", sizeof(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_4cash_CashAccount),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount) __PYX_ERR(25, 25, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_10accounting_8accounts_4cash_CashAccount = (struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_4cash_CashAccount*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_10accounting_8accounts_4cash_CashAccount); if (unlikely(!__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_4cash_CashAccount)) __PYX_ERR(25, 25, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.accounting.accounts.betting"); if (unlikely(!__pyx_t_1)) __PYX_ERR(26, 24, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.accounting.accounts.betting", "BettingAccount", sizeof(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount) __PYX_ERR(26, 24, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount = (struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount); if (unlikely(!__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_7betting_BettingAccount)) __PYX_ERR(26, 24, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.accounting.accounts.margin"); if (unlikely(!__pyx_t_1)) __PYX_ERR(27, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.accounting.accounts.margin", "MarginAccount", sizeof(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount) __PYX_ERR(27, 28, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount = (struct __pyx_vtabstruct_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount); if (unlikely(!__pyx_vtabptr_15nautilus_trader_10accounting_8accounts_6margin_MarginAccount)) __PYX_ERR(27, 28, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.core.correctness"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_15nautilus_trader_4core_11correctness_Condition = __Pyx_ImportType(__pyx_t_1, "nautilus_trader.core.correctness", "Condition", sizeof(struct __pyx_obj_15nautilus_trader_4core_11correctness_Condition), __PYX_GET_STRUCT_ALIGNMENT(struct __pyx_obj_15nautilus_trader_4core_11correctness_Condition),
+  __Pyx_ImportType_CheckSize_Warn);
+   if (!__pyx_ptype_15nautilus_trader_4core_11correctness_Condition) __PYX_ERR(2, 23, __pyx_L1_error)
+  __pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition = (struct __pyx_vtabstruct_15nautilus_trader_4core_11correctness_Condition*)__Pyx_GetVtable(__pyx_ptype_15nautilus_trader_4core_11correctness_Condition); if (unlikely(!__pyx_vtabptr_15nautilus_trader_4core_11correctness_Condition)) __PYX_ERR(2, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("nautilus_trader.model.tick_scheme.base"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportVoidPtr(__pyx_t_1, "TICK_SCHEMES", (void **)&__pyx_vp_15nautilus_trader_5model_11tick_scheme_4base_TICK_SCHEMES, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_factory(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_factory},
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "factory",
+      0, /* m_doc */
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      0, /* m_size */
+    #elif CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstate), /* m_size */
+    #else
+      -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+#endif
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initfactory(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initfactory(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_factory(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_factory(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *module, const char* from_name, const char* to_name, int allow_none)
+#else
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+#endif
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+            result = PyModule_AddObject(module, to_name, value);
+#else
+            result = PyDict_SetItemString(moddict, to_name, value);
+#endif
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    moddict = module;
+#else
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+#endif
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_factory(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'factory' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("factory", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #elif CYTHON_USE_MODULE_STATE
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  {
+    int add_module_result = PyState_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to factory pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #endif
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_factory(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_nautilus_trader__accounting__factory) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "nautilus_trader.accounting.factory")) {
+      if (unlikely((PyDict_SetItemString(modules, "nautilus_trader.accounting.factory", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely((__Pyx_modinit_type_init_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_type_import_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_variable_import_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "nautilus_trader/accounting/factory.pyx":24
+ * 
+ * 
+ * cdef dict _ISSUER_ACCOUNT_TYPE = {}         # type: dict[str, type]             # <<<<<<<<<<<<<<
+ * cdef dict _ISSUER_ACCOUNT_CALCULATED = {}   # type: dict[str, bool]
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 24, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE);
+  __Pyx_DECREF_SET(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_TYPE, ((PyObject*)__pyx_t_2));
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "nautilus_trader/accounting/factory.pyx":25
+ * 
+ * cdef dict _ISSUER_ACCOUNT_TYPE = {}         # type: dict[str, type]
+ * cdef dict _ISSUER_ACCOUNT_CALCULATED = {}   # type: dict[str, bool]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED);
+  __Pyx_DECREF_SET(__pyx_v_15nautilus_trader_10accounting_7factory__ISSUER_ACCOUNT_CALCULATED, ((PyObject*)__pyx_t_2));
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "nautilus_trader/accounting/factory.pyx":33
+ *     """
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_account_type(str issuer, type account_cls):
+ *         """
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_1register_account_type, __Pyx_CYFUNCTION_STATICMETHOD | __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_AccountFactory_register_account, NULL, __pyx_n_s_nautilus_trader_accounting_facto_2, __pyx_d, ((PyObject *)__pyx_codeobj__5)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_register_account_type, __pyx_t_2) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+  __Pyx_GetNameInClass(__pyx_t_2, (PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory, __pyx_n_s_register_account_type); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_staticmethod, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_register_account_type, __pyx_t_3) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+
+  /* "nautilus_trader/accounting/factory.pyx":57
+ *         _ISSUER_ACCOUNT_TYPE[issuer] = account_cls
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def register_calculated_account(str issuer):
+ *         """
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_3register_calculated_account, __Pyx_CYFUNCTION_STATICMETHOD | __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_AccountFactory_register_calculat, NULL, __pyx_n_s_nautilus_trader_accounting_facto_2, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_register_calculated_account, __pyx_t_3) < 0) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+  __Pyx_GetNameInClass(__pyx_t_3, (PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory, __pyx_n_s_register_calculated_account); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_staticmethod, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_register_calculated_account, __pyx_t_2) < 0) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+
+  /* "nautilus_trader/accounting/factory.pyx":102
+ *             raise RuntimeError("invalid account type")
+ * 
+ *     @staticmethod             # <<<<<<<<<<<<<<
+ *     def create(AccountState event) -> Account:
+ *         """
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_return, __pyx_n_s_Account) < 0) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_5create, __Pyx_CYFUNCTION_STATICMETHOD | __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_AccountFactory_create, NULL, __pyx_n_s_nautilus_trader_accounting_facto_2, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_3, __pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_create, __pyx_t_3) < 0) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+  __Pyx_GetNameInClass(__pyx_t_3, (PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory, __pyx_n_s_create); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_staticmethod, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_create, __pyx_t_2) < 0) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_7__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_AccountFactory___reduce_cython, NULL, __pyx_n_s_nautilus_trader_accounting_facto_2, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_AccountFactory, (type(self), 0xe3b0c44, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_AccountFactory__set_state(self, __pyx_state)
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_15nautilus_trader_10accounting_7factory_14AccountFactory_9__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_AccountFactory___setstate_cython, NULL, __pyx_n_s_nautilus_trader_accounting_facto_2, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory->tp_dict, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(1, 16, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_15nautilus_trader_10accounting_7factory_AccountFactory);
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_AccountFactory(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_15nautilus_trader_10accounting_7factory_1__pyx_unpickle_AccountFactory, 0, __pyx_n_s_pyx_unpickle_AccountFactory, NULL, __pyx_n_s_nautilus_trader_accounting_facto_2, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_AccountFactory, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nautilus_trader/accounting/factory.pyx":1
+ * # -------------------------------------------------------------------------------------------------             # <<<<<<<<<<<<<<
+ * #  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+ * #  https://nautechsystems.io
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nautilus_trader/core/correctness.pxd":16
+ * # -------------------------------------------------------------------------------------------------
+ * 
+ * cdef inline Exception make_exception(ex_default, ex_type, str msg):             # <<<<<<<<<<<<<<
+ *     if type(ex_type) == type(Exception):
+ *         return ex_type(msg)
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  if (__pyx_m) {
+    if (__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init nautilus_trader.accounting.factory", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      PyErr_Fetch(&tp, &value, &tb);
+      PyState_RemoveModule(&__pyx_moduledef);
+      PyErr_Restore(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init nautilus_trader.accounting.factory");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#if _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* TupleAndListFromArray */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        Py_INCREF(__pyx_empty_tuple);
+        return __pyx_empty_tuple;
+    }
+    res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    return res;
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        return PyList_New(0);
+    }
+    res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    return res;
+}
+#endif
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* fastcall */
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
+{
+    Py_ssize_t i, n = PyTuple_GET_SIZE(kwnames);
+    for (i = 0; i < n; i++)
+    {
+        if (s == PyTuple_GET_ITEM(kwnames, i)) return kwvalues[i];
+    }
+    for (i = 0; i < n; i++)
+    {
+        int eq = __Pyx_PyUnicode_Equals(s, PyTuple_GET_ITEM(kwnames, i), Py_EQ);
+        if (unlikely(eq != 0)) {
+            if (unlikely(eq < 0)) return NULL;  // error
+            return kwvalues[i];
+        }
+    }
+    return NULL;  // not found (no exception set)
+}
+#endif
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject *const *kwvalues,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    int kwds_is_tuple = CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds));
+    while (1) {
+        if (kwds_is_tuple) {
+            if (pos >= PyTuple_GET_SIZE(kwds)) break;
+            key = PyTuple_GET_ITEM(kwds, pos);
+            value = kwvalues[pos];
+            pos++;
+        }
+        else
+        {
+            if (!PyDict_Next(kwds, &pos, &key, &value)) break;
+        }
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key)
+                );
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    __Pyx_TypeName type_name;
+    __Pyx_TypeName obj_type_name;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    type_name = __Pyx_PyType_GetName(type);
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected " __Pyx_FMT_TYPENAME
+        ", got " __Pyx_FMT_TYPENAME ")", name, type_name, obj_type_name);
+    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* UnpackUnboundCMethod */
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *kwargs) {
+    PyObject *selfless_args = PyTuple_GetSlice(args, 1, PyTuple_Size(args));
+    if (unlikely(!selfless_args)) return NULL;
+    PyObject *result = PyObject_Call(method, selfless_args, kwargs);
+    Py_DECREF(selfless_args);
+    return result;
+}
+static PyMethodDef __Pyx_UnboundCMethod_Def = {
+     "CythonUnboundCMethod",
+     __PYX_REINTERPRET_FUNCION(PyCFunction, __Pyx_SelflessCall),
+     METH_VARARGS | METH_KEYWORDS,
+     NULL
+};
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    target->method = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION >= 3
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    #else
+    if (likely(!PyCFunction_Check(method)))
+    #endif
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
+    } else
+#endif
+#if defined(CYTHON_COMPILING_IN_PYPY)
+#elif PY_VERSION_HEX >= 0x03090000
+    if (PyCFunction_CheckExact(method))
+#else
+    if (PyCFunction_Check(method))
+#endif
+    {
+        PyObject *self;
+        int self_found;
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        self = PyObject_GetAttrString(method, "__self__");
+        if (!self) {
+            PyErr_Clear();
+        }
+#else
+        self = PyCFunction_GET_SELF(method);
+#endif
+        self_found = (self && self != Py_None);
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        Py_XDECREF(self);
+#endif
+        if (self_found) {
+            PyObject *unbound_method = PyCFunction_New(&__Pyx_UnboundCMethod_Def, method);
+            if (unlikely(!unbound_method)) return -1;
+            Py_DECREF(method);
+            target->method = unbound_method;
+        }
+    }
+    return 0;
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    if (likely(cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return (*(cfunc->func))(self, arg);
+        } else if ((PY_VERSION_HEX >= 0x030600B1) && flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+                return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, &arg, 1);
+            #else
+                return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+            #endif
+        } else if ((PY_VERSION_HEX >= 0x030700A0) && flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+        }
+    }
+    return __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 1, arg);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(2, self, arg);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    if (likely(cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+            return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, args, 2);
+            #else
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+            #endif
+        }
+        #if PY_VERSION_HEX >= 0x030700A0
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+        #endif
+    }
+    return __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(3);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 1, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 2, arg2);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(3, self, arg1, arg2);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if PY_MAJOR_VERSION >= 3 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000)
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyString_CheckExact(key) || PyUnicode_CheckExact(key) || PyInt_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
+        }
+        Py_INCREF(value);
+    }
+#endif
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
+}
+
+/* RaiseUnexpectedTypeError */
+static int
+__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
+{
+    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
+                 expected, obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    __Pyx_TypeName obj_type_name;
+    __Pyx_TypeName type_name;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    type_name = __Pyx_PyType_GetName(type);
+    PyErr_Format(PyExc_TypeError,
+                 "Cannot convert " __Pyx_FMT_TYPENAME " to " __Pyx_FMT_TYPENAME,
+                 obj_type_name, type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    __Pyx_DECREF_TypeName(type_name);
+    return 0;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    CYTHON_UNUSED_VAR(cause);
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kw,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kw, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kw))) {
+        if (unlikely(PyTuple_GET_SIZE(kw) == 0))
+            return 1;
+        if (!kw_allowed) {
+            key = PyTuple_GET_ITEM(kw, 0);
+            goto invalid_keyword;
+        }
+#if PY_VERSION_HEX < 0x03090000
+        for (pos = 0; pos < PyTuple_GET_SIZE(kw); pos++) {
+            key = PyTuple_GET_ITEM(kw, pos);
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+        }
+#endif
+        return 1;
+    }
+    while (PyDict_Next(kw, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if (!kw_allowed && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r;
+#if CYTHON_USE_TYPE_SLOTS
+    if (likely(PyString_Check(n))) {
+        r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+        if (unlikely(!r) && likely(!PyErr_Occurred())) {
+            r = __Pyx_NewRef(d);
+        }
+        return r;
+    }
+#endif
+    r = PyObject_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *module = 0;
+    PyObject *empty_dict = 0;
+    PyObject *empty_list = 0;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (unlikely(!py_import))
+        goto bad;
+    if (!from_list) {
+        empty_list = PyList_New(0);
+        if (unlikely(!empty_list))
+            goto bad;
+        from_list = empty_list;
+    }
+    #endif
+    empty_dict = PyDict_New();
+    if (unlikely(!empty_dict))
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                #if CYTHON_COMPILING_IN_LIMITED_API
+                module = PyImport_ImportModuleLevelObject(
+                    name, empty_dict, empty_dict, from_list, 1);
+                #else
+                module = PyImport_ImportModuleLevelObject(
+                    name, __pyx_d, empty_dict, from_list, 1);
+                #endif
+                if (unlikely(!module)) {
+                    if (unlikely(!PyErr_ExceptionMatches(PyExc_ImportError)))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (unlikely(!py_level))
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, __pyx_d, empty_dict, from_list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            #if CYTHON_COMPILING_IN_LIMITED_API
+            module = PyImport_ImportModuleLevelObject(
+                name, empty_dict, empty_dict, from_list, level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, __pyx_d, empty_dict, from_list, level);
+            #endif
+            #endif
+        }
+    }
+bad:
+    Py_XDECREF(empty_dict);
+    Py_XDECREF(empty_list);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
+        PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__3);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if PY_VERSION_HEX < 0x030700A1 || (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400)
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
+    if (unlikely(!value)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL && !CYTHON_VECTORCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object"))) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectFastCall */
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]);
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+    Py_DECREF(argstuple);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t _nargs, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+        if (__Pyx_IsCyOrPyCFunction(func))
+#else
+        if (PyCFunction_Check(func))
+#endif
+        {
+            if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+                return __Pyx_PyObject_CallMethO(func, NULL);
+            }
+        }
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (PyCFunction_Check(func))
+        {
+            if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+                return __Pyx_PyObject_CallMethO(func, args[0]);
+            }
+        }
+    }
+#endif
+    #if PY_VERSION_HEX < 0x030800B1
+    #if CYTHON_FAST_PYCCALL
+    if (PyCFunction_Check(func)) {
+        if (kwargs) {
+            return _PyCFunction_FastCallDict(func, args, nargs, kwargs);
+        } else {
+            return _PyCFunction_FastCallKeywords(func, args, nargs, NULL);
+        }
+    }
+    #if PY_VERSION_HEX >= 0x030700A1
+    if (!kwargs && __Pyx_IS_TYPE(func, &PyMethodDescr_Type)) {
+        return _PyMethodDescr_FastCallKeywords(func, args, nargs, NULL);
+    }
+    #endif
+    #endif
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs);
+    }
+    #endif
+    #endif
+    #if CYTHON_VECTORCALL
+    vectorcallfunc f = _PyVectorcall_Function(func);
+    if (f) {
+        return f(func, args, (size_t)nargs, kwargs);
+    }
+    #elif defined(__Pyx_CyFunction_USED) && CYTHON_BACKPORT_VECTORCALL
+    if (__Pyx_CyFunction_CheckExact(func)) {
+        __pyx_vectorcallfunc f = __Pyx_CyFunction_func_vectorcall(func);
+        if (f) return f(func, args, (size_t)nargs, kwargs);
+    }
+    #endif
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_empty_tuple, kwargs);
+    }
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+}
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (!r) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (unlikely(!j)) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
+        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
+        if (mm && mm->mp_subscript) {
+            PyObject *r, *key = PyInt_FromSsize_t(i);
+            if (unlikely(!key)) return NULL;
+            r = mm->mp_subscript(o, key);
+            Py_DECREF(key);
+            return r;
+        }
+        if (likely(sm && sm->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
+                Py_ssize_t l = sm->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return sm->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* FixUpExtensionType */
+#if CYTHON_USE_TYPE_SPECS
+static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
+#if PY_VERSION_HEX > 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    CYTHON_UNUSED_VAR(spec);
+    CYTHON_UNUSED_VAR(type);
+#else
+    const PyType_Slot *slot = spec->slots;
+    while (slot && slot->slot && slot->slot != Py_tp_members)
+        slot++;
+    if (slot && slot->slot == Py_tp_members) {
+        int changed = 0;
+#if !(PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON)
+        const
+#endif
+            PyMemberDef *memb = (PyMemberDef*) slot->pfunc;
+        while (memb && memb->name) {
+            if (memb->name[0] == '_' && memb->name[1] == '_') {
+#if PY_VERSION_HEX < 0x030900b1
+                if (strcmp(memb->name, "__weaklistoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_weaklistoffset = memb->offset;
+                    changed = 1;
+                }
+                else if (strcmp(memb->name, "__dictoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_dictoffset = memb->offset;
+                    changed = 1;
+                }
+#if CYTHON_METH_FASTCALL
+                else if (strcmp(memb->name, "__vectorcalloffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+#if PY_VERSION_HEX >= 0x030800b4
+                    type->tp_vectorcall_offset = memb->offset;
+#else
+                    type->tp_print = (printfunc) memb->offset;
+#endif
+                    changed = 1;
+                }
+#endif
+#else
+                if ((0));
+#endif
+#if PY_VERSION_HEX <= 0x030900b1 && CYTHON_COMPILING_IN_CPYTHON
+                else if (strcmp(memb->name, "__module__") == 0) {
+                    PyObject *descr;
+                    assert(memb->type == T_OBJECT);
+                    assert(memb->flags == 0 || memb->flags == READONLY);
+                    descr = PyDescr_NewMember(type, memb);
+                    if (unlikely(!descr))
+                        return -1;
+                    if (unlikely(PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr) < 0)) {
+                        Py_DECREF(descr);
+                        return -1;
+                    }
+                    Py_DECREF(descr);
+                    changed = 1;
+                }
+#endif
+            }
+            memb++;
+        }
+        if (changed)
+            PyType_Modified(type);
+    }
+#endif
+    return 0;
+}
+#endif
+
+/* PyObjectCallNoArg */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+    PyObject *arg = NULL;
+    return __Pyx_PyObject_FastCall(func, (&arg)+1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* PyObjectCallOneArg */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *args[2] = {NULL, arg};
+    return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    __Pyx_TypeName type_name;
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if defined(Py_TPFLAGS_METHOD_DESCRIPTOR) && Py_TPFLAGS_METHOD_DESCRIPTOR
+        if (__Pyx_PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_METHOD_DESCRIPTOR))
+#elif PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (likely(descr != NULL)) {
+        *method = descr;
+        return 0;
+    }
+    type_name = __Pyx_PyType_GetName(tp);
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%U'",
+                 type_name, name);
+#else
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%.400s'",
+                 type_name, PyString_AS_STRING(name));
+#endif
+    __Pyx_DECREF_TypeName(type_name);
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* ValidateBasesTuple */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases) {
+    Py_ssize_t i, n = PyTuple_GET_SIZE(bases);
+    for (i = 1; i < n; i++)
+    {
+        PyObject *b0 = PyTuple_GET_ITEM(bases, i);
+        PyTypeObject *b;
+#if PY_MAJOR_VERSION < 3
+        if (PyClass_Check(b0))
+        {
+            PyErr_Format(PyExc_TypeError, "base class '%.200s' is an old-style class",
+                         PyString_AS_STRING(((PyClassObject*)b0)->cl_name));
+            return -1;
+        }
+#endif
+        b = (PyTypeObject*) b0;
+        if (!__Pyx_PyType_HasFeature(b, Py_TPFLAGS_HEAPTYPE))
+        {
+            __Pyx_TypeName b_name = __Pyx_PyType_GetName(b);
+            PyErr_Format(PyExc_TypeError,
+                "base class '" __Pyx_FMT_TYPENAME "' is not a heap type", b_name);
+            __Pyx_DECREF_TypeName(b_name);
+            return -1;
+        }
+        if (dictoffset == 0 && b->tp_dictoffset)
+        {
+            __Pyx_TypeName b_name = __Pyx_PyType_GetName(b);
+            PyErr_Format(PyExc_TypeError,
+                "extension type '%.200s' has no __dict__ slot, "
+                "but base type '" __Pyx_FMT_TYPENAME "' has: "
+                "either add 'cdef dict __dict__' to the extension type "
+                "or add '__slots__ = [...]' to the base type",
+                type_name, b_name);
+            __Pyx_DECREF_TypeName(b_name);
+            return -1;
+        }
+    }
+    return 0;
+}
+#endif
+
+/* PyType_Ready */
+static int __Pyx_PyType_Ready(PyTypeObject *t) {
+#if CYTHON_USE_TYPE_SPECS || !(CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API) || defined(PYSTON_MAJOR_VERSION)
+    (void)__Pyx_PyObject_CallMethod0;
+#if CYTHON_USE_TYPE_SPECS
+    (void)__Pyx_validate_bases_tuple;
+#endif
+    return PyType_Ready(t);
+#else
+    int r;
+    PyObject *bases = __Pyx_PyType_GetSlot(t, tp_bases, PyObject*);
+    if (bases && unlikely(__Pyx_validate_bases_tuple(t->tp_name, t->tp_dictoffset, bases) == -1))
+        return -1;
+#if PY_VERSION_HEX >= 0x03050000 && !defined(PYSTON_MAJOR_VERSION)
+    {
+        int gc_was_enabled;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        gc_was_enabled = PyGC_Disable();
+        (void)__Pyx_PyObject_CallMethod0;
+    #else
+        PyObject *ret, *py_status;
+        PyObject *gc = NULL;
+        #if PY_VERSION_HEX >= 0x030700a1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM+0 >= 0x07030400)
+        gc = PyImport_GetModule(__pyx_kp_u_gc);
+        #endif
+        if (unlikely(!gc)) gc = PyImport_Import(__pyx_kp_u_gc);
+        if (unlikely(!gc)) return -1;
+        py_status = __Pyx_PyObject_CallMethod0(gc, __pyx_kp_u_isenabled);
+        if (unlikely(!py_status)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+        gc_was_enabled = __Pyx_PyObject_IsTrue(py_status);
+        Py_DECREF(py_status);
+        if (gc_was_enabled > 0) {
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_kp_u_disable);
+            if (unlikely(!ret)) {
+                Py_DECREF(gc);
+                return -1;
+            }
+            Py_DECREF(ret);
+        } else if (unlikely(gc_was_enabled == -1)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+    #endif
+        t->tp_flags |= Py_TPFLAGS_HEAPTYPE;
+#if PY_VERSION_HEX >= 0x030A0000
+        t->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
+#endif
+#else
+        (void)__Pyx_PyObject_CallMethod0;
+#endif
+    r = PyType_Ready(t);
+#if PY_VERSION_HEX >= 0x03050000 && !defined(PYSTON_MAJOR_VERSION)
+        t->tp_flags &= ~Py_TPFLAGS_HEAPTYPE;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        if (gc_was_enabled)
+            PyGC_Enable();
+    #else
+        if (gc_was_enabled) {
+            PyObject *tp, *v, *tb;
+            PyErr_Fetch(&tp, &v, &tb);
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_kp_u_enable);
+            if (likely(ret || r == -1)) {
+                Py_XDECREF(ret);
+                PyErr_Restore(tp, v, tb);
+            } else {
+                Py_XDECREF(tp);
+                Py_XDECREF(v);
+                Py_XDECREF(tb);
+                r = -1;
+            }
+        }
+        Py_DECREF(gc);
+    #endif
+    }
+#endif
+    return r;
+#endif
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetName(tp);
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%U'",
+                 type_name, attr_name);
+#else
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%.400s'",
+                 type_name, PyString_AS_STRING(attr_name));
+#endif
+    __Pyx_DECREF_TypeName(type_name);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    if (unlikely(!ob))
+        goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_n_s_pyx_vtable, ob) < 0))
+#else
+    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_n_s_pyx_vtable, ob) < 0))
+#endif
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyTypeObject *type) {
+    void* ptr;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_n_s_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_n_s_pyx_vtable);
+#endif
+    if (!ob)
+        goto bad;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* MergeVTables */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_MergeVtables(PyTypeObject *type) {
+    int i;
+    void** base_vtables;
+    __Pyx_TypeName tp_base_name;
+    __Pyx_TypeName base_name;
+    void* unknown = (void*)-1;
+    PyObject* bases = type->tp_bases;
+    int base_depth = 0;
+    {
+        PyTypeObject* base = type->tp_base;
+        while (base) {
+            base_depth += 1;
+            base = base->tp_base;
+        }
+    }
+    base_vtables = (void**) malloc(sizeof(void*) * (size_t)(base_depth + 1));
+    base_vtables[0] = unknown;
+    for (i = 1; i < PyTuple_GET_SIZE(bases); i++) {
+        void* base_vtable = __Pyx_GetVtable(((PyTypeObject*)PyTuple_GET_ITEM(bases, i)));
+        if (base_vtable != NULL) {
+            int j;
+            PyTypeObject* base = type->tp_base;
+            for (j = 0; j < base_depth; j++) {
+                if (base_vtables[j] == unknown) {
+                    base_vtables[j] = __Pyx_GetVtable(base);
+                    base_vtables[j + 1] = unknown;
+                }
+                if (base_vtables[j] == base_vtable) {
+                    break;
+                } else if (base_vtables[j] == NULL) {
+                    goto bad;
+                }
+                base = base->tp_base;
+            }
+        }
+    }
+    PyErr_Clear();
+    free(base_vtables);
+    return 0;
+bad:
+    tp_base_name = __Pyx_PyType_GetName(type->tp_base);
+    base_name = __Pyx_PyType_GetName((PyTypeObject*)PyTuple_GET_ITEM(bases, i));
+    PyErr_Format(PyExc_TypeError,
+        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base_name, base_name);
+    __Pyx_DECREF_TypeName(tp_base_name);
+    __Pyx_DECREF_TypeName(base_name);
+    free(base_vtables);
+    return -1;
+}
+#endif
+
+/* SetupReduce */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStrNoError(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred()) {
+        __Pyx_TypeName type_obj_name =
+            __Pyx_PyType_GetName((PyTypeObject*)type_obj);
+        PyErr_Format(PyExc_RuntimeError,
+            "Unable to initialize pickling for " __Pyx_FMT_TYPENAME, type_obj_name);
+        __Pyx_DECREF_TypeName(type_obj_name);
+    }
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+#endif
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType
+#define __PYX_HAVE_RT_ImportType
+static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize+itemsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error &&
+            ((size_t)basicsize > size || (size_t)(basicsize + itemsize) < size)) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd-%zd from PyObject",
+            module_name, class_name, size, basicsize, basicsize+itemsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* FetchSharedCythonModule */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void) {
+    PyObject *abi_module = PyImport_AddModule((char*) __PYX_ABI_MODULE_NAME);
+    if (unlikely(!abi_module)) return NULL;
+    Py_INCREF(abi_module);
+    return abi_module;
+}
+
+/* FetchCommonType */
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t basicsize,
+                               Py_ssize_t expected_basicsize) {
+    if (!PyType_Check(cached_type)) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s is not a type object", name);
+        return -1;
+    }
+    if (basicsize != expected_basicsize) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s has the wrong size, try recompiling",
+            name);
+        return -1;
+    }
+    return 0;
+}
+#if !CYTHON_USE_TYPE_SPECS
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* abi_module;
+    const char* object_name;
+    PyTypeObject *cached_type = NULL;
+    abi_module = __Pyx_FetchSharedCythonABIModule();
+    if (!abi_module) return NULL;
+    object_name = strrchr(type->tp_name, '.');
+    object_name = object_name ? object_name+1 : type->tp_name;
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(abi_module, object_name);
+    if (cached_type) {
+        if (__Pyx_VerifyCachedType(
+              (PyObject *)cached_type,
+              object_name,
+              cached_type->tp_basicsize,
+              type->tp_basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    }
+    if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+    PyErr_Clear();
+    if (PyType_Ready(type) < 0) goto bad;
+    if (PyObject_SetAttrString(abi_module, object_name, (PyObject *)type) < 0)
+        goto bad;
+    Py_INCREF(type);
+    cached_type = type;
+done:
+    Py_DECREF(abi_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+#else
+static PyTypeObject *__Pyx_FetchCommonTypeFromSpec(PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *abi_module, *cached_type = NULL;
+    const char* object_name = strrchr(spec->name, '.');
+    object_name = object_name ? object_name+1 : spec->name;
+    abi_module = __Pyx_FetchSharedCythonABIModule();
+    if (!abi_module) return NULL;
+    cached_type = PyObject_GetAttrString(abi_module, object_name);
+    if (cached_type) {
+        Py_ssize_t basicsize;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        PyObject *py_basicsize;
+        py_basicsize = PyObject_GetAttrString(cached_type, "__basicsize__");
+        if (unlikely(!py_basicsize)) goto bad;
+        basicsize = PyLong_AsSsize_t(py_basicsize);
+        Py_DECREF(py_basicsize);
+        py_basicsize = 0;
+        if (unlikely(basicsize == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+#else
+        basicsize = likely(PyType_Check(cached_type)) ? ((PyTypeObject*) cached_type)->tp_basicsize : -1;
+#endif
+        if (__Pyx_VerifyCachedType(
+              cached_type,
+              object_name,
+              basicsize,
+              spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    }
+    if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+    PyErr_Clear();
+    CYTHON_UNUSED_VAR(module);
+    cached_type = __Pyx_PyType_FromModuleAndSpec(abi_module, spec, bases);
+    if (unlikely(!cached_type)) goto bad;
+    if (unlikely(__Pyx_fix_up_extension_type_from_spec(spec, (PyTypeObject *) cached_type) < 0)) goto bad;
+    if (PyObject_SetAttrString(abi_module, object_name, cached_type) < 0) goto bad;
+done:
+    Py_DECREF(abi_module);
+    assert(cached_type == NULL || PyType_Check(cached_type));
+    return (PyTypeObject *) cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+#endif
+
+/* PyVectorcallFastCallDict */
+#if CYTHON_METH_FASTCALL
+static PyObject *__Pyx_PyVectorcall_FastCallDict_kw(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    PyObject *res = NULL;
+    PyObject *kwnames;
+    PyObject **newargs;
+    PyObject **kwvalues;
+    Py_ssize_t i, pos;
+    size_t j;
+    PyObject *key, *value;
+    unsigned long keys_are_strings;
+    Py_ssize_t nkw = PyDict_GET_SIZE(kw);
+    newargs = (PyObject **)PyMem_Malloc((nargs + (size_t)nkw) * sizeof(args[0]));
+    if (unlikely(newargs == NULL)) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    for (j = 0; j < nargs; j++) newargs[j] = args[j];
+    kwnames = PyTuple_New(nkw);
+    if (unlikely(kwnames == NULL)) {
+        PyMem_Free(newargs);
+        return NULL;
+    }
+    kwvalues = newargs + nargs;
+    pos = i = 0;
+    keys_are_strings = Py_TPFLAGS_UNICODE_SUBCLASS;
+    while (PyDict_Next(kw, &pos, &key, &value)) {
+        keys_are_strings &= Py_TYPE(key)->tp_flags;
+        Py_INCREF(key);
+        Py_INCREF(value);
+        PyTuple_SET_ITEM(kwnames, i, key);
+        kwvalues[i] = value;
+        i++;
+    }
+    if (unlikely(!keys_are_strings)) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        goto cleanup;
+    }
+    res = vc(func, newargs, nargs, kwnames);
+cleanup:
+    Py_DECREF(kwnames);
+    for (i = 0; i < nkw; i++)
+        Py_DECREF(kwvalues[i]);
+    PyMem_Free(newargs);
+    return res;
+}
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    if (likely(kw == NULL) || PyDict_GET_SIZE(kw) == 0) {
+        return vc(func, args, nargs, NULL);
+    }
+    return __Pyx_PyVectorcall_FastCallDict_kw(func, vc, args, nargs, kw);
+}
+#endif
+
+/* CythonFunctionShared */
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj) {
+#if PY_VERSION_HEX < 0x030900B1
+    __Pyx_Py_XDECREF_SET(
+        __Pyx_CyFunction_GetClassObj(f),
+            ((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#else
+    __Pyx_Py_XDECREF_SET(
+        ((PyCMethodObject *) (f))->mm_class,
+        (PyTypeObject*)((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#endif
+}
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, void *closure)
+{
+    CYTHON_UNUSED_VAR(closure);
+    if (unlikely(op->func_doc == NULL)) {
+        if (((PyCFunctionObject*)op)->m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(((PyCFunctionObject*)op)->m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(((PyCFunctionObject*)op)->m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_doc, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(((PyCFunctionObject*)op)->m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(((PyCFunctionObject*)op)->m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_name, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_qualname, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_dict, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(op);
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyTuple_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__defaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->defaults_tuple, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result = op->defaults_tuple;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__kwdefaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(op->defaults_kwdict, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result = op->defaults_kwdict;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, value);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result = op->func_annotations;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine(__pyx_CyFunctionObject *op, void *context) {
+    int is_coroutine;
+    CYTHON_UNUSED_VAR(context);
+    if (op->func_is_coroutine) {
+        return __Pyx_NewRef(op->func_is_coroutine);
+    }
+    is_coroutine = op->flags & __Pyx_CYFUNCTION_COROUTINE;
+#if PY_VERSION_HEX >= 0x03050000
+    if (is_coroutine) {
+        PyObject *module, *fromlist, *marker = __pyx_n_s_is_coroutine;
+        fromlist = PyList_New(1);
+        if (unlikely(!fromlist)) return NULL;
+        Py_INCREF(marker);
+        PyList_SET_ITEM(fromlist, 0, marker);
+        module = PyImport_ImportModuleLevelObject(__pyx_n_s_asyncio_coroutines, NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+        if (unlikely(!module)) goto ignore;
+        op->func_is_coroutine = __Pyx_PyObject_GetAttrStr(module, marker);
+        Py_DECREF(module);
+        if (likely(op->func_is_coroutine)) {
+            return __Pyx_NewRef(op->func_is_coroutine);
+        }
+ignore:
+        PyErr_Clear();
+    }
+#endif
+    op->func_is_coroutine = __Pyx_PyBool_FromLong(is_coroutine);
+    return __Pyx_NewRef(op->func_is_coroutine);
+}
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {(char *) "_is_coroutine", (getter)__Pyx_CyFunction_get_is_coroutine, 0, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), 0, 0},
+#if CYTHON_USE_TYPE_SPECS
+    {(char *) "__dictoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_dict), READONLY, 0},
+#if CYTHON_METH_FASTCALL
+#if CYTHON_BACKPORT_VECTORCALL
+    {(char *) "__vectorcalloffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_vectorcall), READONLY, 0},
+#else
+    {(char *) "__vectorcalloffset__", T_PYSSIZET, offsetof(PyCFunctionObject, vectorcall), READONLY, 0},
+#endif
+#endif
+#if PY_VERSION_HEX < 0x030500A0
+    {(char *) "__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_weakreflist), READONLY, 0},
+#else
+    {(char *) "__weaklistoffset__", T_PYSSIZET, offsetof(PyCFunctionObject, m_weakreflist), READONLY, 0},
+#endif
+#endif
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, PyObject *args)
+{
+    CYTHON_UNUSED_VAR(args);
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(((PyCFunctionObject*)m)->m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) (((PyCFunctionObject*)cyfunc)->m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyCFunctionObject *cf = (PyCFunctionObject*) op;
+    if (unlikely(op == NULL))
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    cf->m_ml = ml;
+    cf->m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    cf->m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+#if PY_VERSION_HEX < 0x030900B1
+    op->func_classobj = NULL;
+#else
+    ((PyCMethodObject*)op)->mm_class = NULL;
+#endif
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    op->func_is_coroutine = NULL;
+#if CYTHON_METH_FASTCALL
+    switch (ml->ml_flags & (METH_VARARGS | METH_FASTCALL | METH_NOARGS | METH_O | METH_KEYWORDS | METH_METHOD)) {
+    case METH_NOARGS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_NOARGS;
+        break;
+    case METH_O:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_O;
+        break;
+    case METH_METHOD | METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD;
+        break;
+    case METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS;
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = NULL;
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        Py_DECREF(op);
+        return NULL;
+    }
+#endif
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(((PyCFunctionObject*)m)->m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+#if PY_VERSION_HEX < 0x030900B1
+    Py_CLEAR(__Pyx_CyFunction_GetClassObj(m));
+#else
+    {
+        PyObject *cls = (PyObject*) ((PyCMethodObject *) (m))->mm_class;
+        ((PyCMethodObject *) (m))->mm_class = NULL;
+        Py_XDECREF(cls);
+    }
+#endif
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    Py_CLEAR(m->func_is_coroutine);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
+    }
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    __Pyx_PyHeapTypeObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(((PyCFunctionObject*)m)->m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(__Pyx_CyFunction_GetClassObj(m));
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    Py_VISIT(m->func_is_coroutine);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
+    }
+    return 0;
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        return NULL;
+    }
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+#if CYTHON_METH_FASTCALL
+     __pyx_vectorcallfunc vc = __Pyx_CyFunction_func_vectorcall(cyfunc);
+    if (vc) {
+#if CYTHON_ASSUME_SAFE_MACROS
+        return __Pyx_PyVectorcall_FastCallDict(func, vc, &PyTuple_GET_ITEM(args, 0), (size_t)PyTuple_GET_SIZE(args), kw);
+#else
+        (void) &__Pyx_PyVectorcall_FastCallDict;
+        return PyVectorcall_Call(func, args, kw);
+#endif
+    }
+#endif
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+#else
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
+#endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE int __Pyx_CyFunction_Vectorcall_CheckArgs(__pyx_CyFunctionObject *cyfunc, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int ret = 0;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        if (unlikely(nargs < 1)) {
+            PyErr_Format(PyExc_TypeError, "%.200s() needs an argument",
+                         ((PyCFunctionObject*)cyfunc)->m_ml->ml_name);
+            return -1;
+        }
+        ret = 1;
+    }
+    if (unlikely(kwnames) && unlikely(PyTuple_GET_SIZE(kwnames))) {
+        PyErr_Format(PyExc_TypeError,
+                     "%.200s() takes no keyword arguments", ((PyCFunctionObject*)cyfunc)->m_ml->ml_name);
+        return -1;
+    }
+    return ret;
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 0)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+            def->ml_name, nargs);
+        return NULL;
+    }
+    return def->ml_meth(self, NULL);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 1)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+            def->ml_name, nargs);
+        return NULL;
+    }
+    return def->ml_meth(self, args[0]);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    return ((_PyCFunctionFastWithKeywords)(void(*)(void))def->ml_meth)(self, args, nargs, kwnames);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+    PyTypeObject *cls = (PyTypeObject *) __Pyx_CyFunction_GetClassObj(cyfunc);
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+    return ((__Pyx_PyCMethod)(void(*)(void))def->ml_meth)(self, cls, args, (size_t)nargs, kwnames);
+}
+#endif
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_CyFunctionType_slots[] = {
+    {Py_tp_dealloc, (void *)__Pyx_CyFunction_dealloc},
+    {Py_tp_repr, (void *)__Pyx_CyFunction_repr},
+    {Py_tp_call, (void *)__Pyx_CyFunction_CallAsMethod},
+    {Py_tp_traverse, (void *)__Pyx_CyFunction_traverse},
+    {Py_tp_clear, (void *)__Pyx_CyFunction_clear},
+    {Py_tp_methods, (void *)__pyx_CyFunction_methods},
+    {Py_tp_members, (void *)__pyx_CyFunction_members},
+    {Py_tp_getset, (void *)__pyx_CyFunction_getsets},
+    {Py_tp_descr_get, (void *)__Pyx_PyMethod_New},
+    {0, 0},
+};
+static PyType_Spec __pyx_CyFunctionType_spec = {
+    __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+#ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
+    Py_TPFLAGS_METHOD_DESCRIPTOR |
+#endif
+#if (defined(_Py_TPFLAGS_HAVE_VECTORCALL) && CYTHON_METH_FASTCALL)
+    _Py_TPFLAGS_HAVE_VECTORCALL |
+#endif
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    __pyx_CyFunctionType_slots
+};
+#else
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+#if !CYTHON_METH_FASTCALL
+    0,
+#elif CYTHON_BACKPORT_VECTORCALL
+    (printfunc)offsetof(__pyx_CyFunctionObject, func_vectorcall),
+#else
+    offsetof(PyCFunctionObject, vectorcall),
+#endif
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+#ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
+    Py_TPFLAGS_METHOD_DESCRIPTOR |
+#endif
+#ifdef _Py_TPFLAGS_HAVE_VECTORCALL
+    _Py_TPFLAGS_HAVE_VECTORCALL |
+#endif
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_PyMethod_New,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+    0,
+#endif
+};
+#endif
+static int __pyx_CyFunction_init(PyObject *module) {
+#if CYTHON_USE_TYPE_SPECS
+    __pyx_CyFunctionType = __Pyx_FetchCommonTypeFromSpec(module, &__pyx_CyFunctionType_spec, NULL);
+#else
+    CYTHON_UNUSED_VAR(module);
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+#endif
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* GetNameInClass */
+static PyObject *__Pyx__GetNameInClass(PyObject *nmspace, PyObject *name) {
+    PyObject *result;
+    PyObject *dict;
+    assert(PyType_Check(nmspace));
+#if CYTHON_USE_TYPE_SLOTS
+    dict = ((PyTypeObject*)nmspace)->tp_dict;
+    Py_XINCREF(dict);
+#else
+    dict = PyObject_GetAttr(nmspace, __pyx_n_s_dict);
+#endif
+    if (likely(dict)) {
+        result = PyObject_GetItem(dict, name);
+        Py_DECREF(dict);
+        if (result) {
+            return result;
+        }
+    }
+    PyErr_Clear();
+    __Pyx_GetModuleGlobalNameUncached(result, name);
+    return result;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStrNoError(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+#endif
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    if (c_line) {
+        (void) __pyx_cfilenm;
+        (void) __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    _PyTraceback_Add(funcname, filename, py_line);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if ((sizeof(long) < sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if ((sizeof(long) <= sizeof(unsigned long))) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if ((sizeof(long) <= sizeof(long))) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if (CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* FormatTypeName */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static __Pyx_TypeName
+__Pyx_PyType_GetName(PyTypeObject* tp)
+{
+    PyObject *name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_n_s_name);
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
+        PyErr_Clear();
+        Py_XSETREF(name, __Pyx_NewRef(__pyx_n_s__16));
+    }
+    return name;
+}
+#endif
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if ((sizeof(int) < sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if ((sizeof(int) <= sizeof(unsigned long))) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if ((sizeof(int) <= sizeof(long))) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if (CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compile time version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* VoidPtrImport */
+#ifndef __PYX_HAVE_RT_ImportVoidPtr
+#define __PYX_HAVE_RT_ImportVoidPtr
+static int __Pyx_ImportVoidPtr(PyObject *module, const char *name, void **p, const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, name);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C variable %.200s",
+                PyModule_GetName(module), name);
+        goto bad;
+    }
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    *p = PyCapsule_GetPointer(cobj, sig);
+    if (!(*p))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+#if PY_MAJOR_VERSION >= 3
+static int __Pyx_InitString(__Pyx_StringTabEntry t, PyObject **str) {
+    if (t.is_unicode | t.is_str) {
+        if (t.intern) {
+            *str = PyUnicode_InternFromString(t.s);
+        } else if (t.encoding) {
+            *str = PyUnicode_Decode(t.s, t.n - 1, t.encoding, NULL);
+        } else {
+            *str = PyUnicode_FromStringAndSize(t.s, t.n - 1);
+        }
+    } else {
+        *str = PyBytes_FromStringAndSize(t.s, t.n - 1);
+    }
+    if (!*str)
+        return -1;
+    if (PyObject_Hash(*str) == -1)
+        return -1;
+    return 0;
+}
+#endif
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION >= 3
+        __Pyx_InitString(*t, t->p);
+        #else
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        #endif
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY && !CYTHON_COMPILING_IN_LIMITED_API) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetName(Py_TYPE(result));
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
+                "The ability to return an instance of a strict subclass of int is deprecated, "
+                "and may be removed in a future version of Python.",
+                result_type_name)) {
+            __Pyx_DECREF_TypeName(result_type_name);
+            Py_DECREF(result);
+            return NULL;
+        }
+        __Pyx_DECREF_TypeName(result_type_name);
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type " __Pyx_FMT_TYPENAME ")",
+                 type_name, type_name, result_type_name);
+    __Pyx_DECREF_TypeName(result_type_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = __Pyx_PyLong_Digits(b);
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+/* #### Code section: utility_code_pragmas_end ### */
+#if _MSV_VER
+#pragma warning( pop )
+#endif
+
+
+
+/* #### Code section: end ### */
+#endif /* Py_PYTHON_H */